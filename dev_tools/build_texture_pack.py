@@ -0,0 +1,149 @@
+"""
+テクスチャパック生成スクリプト
+- maps.py / items.py が参照している全テクスチャ・スプライトを、描画に使う最終形
+  （TILE×TILE の RGB / Alpha 配列、壁の原寸 RGBA、指定サイズのスプライト RGBA）にして
+  1本のバイナリ「src/assets/texture_pack.bin」へ詰める
+- 索引は「src/assets/texture_pack.json」（offset / shape と元 PNG の sha1・サイズ・mtime）
+- ゲーム側（core/texture_pack.py）は np.memmap でコピー無しに読み、元 PNG が変わっていれば PNG にフォールバック
+- PNG を差し替えたら、このスクリプトを再実行するだけでOK
+
+使い方:
+    python dev_tools/build_texture_pack.py
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# ========================
+# --- 設定項目 ---
+# ========================
+ROOT_DIR = Path(__file__).parent.parent.resolve()
+SRC_DIR = ROOT_DIR / "src"
+
+# ゲーム本体のモジュールを import できるように
+sys.path.insert(0, str(SRC_DIR))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # 画面は不要
+
+import pygame  # noqa: E402
+
+from core.asset_prefetch import decode_rgba32  # noqa: E402
+from core.config import TILE  # noqa: E402
+from core.items import (  # noqa: E402
+    ALWAYS_SPRITE_SIZE, ALWAYS_SPRITES, ITEM_SPRITE_SIZE, SPRITE_DB, sprite_path_for,
+)
+from core.maps import MAPS  # noqa: E402
+from core.texture_loader import _resolve_path, _surf_to_tile_arrays_rgba  # noqa: E402
+from core.texture_pack import PACK_BIN, PACK_INDEX, PACK_VERSION, entry_key, file_sha1  # noqa: E402
+
+# 各エントリの先頭をそろえる境界（バイト）
+ALIGN = 64
+
+
+def collect_entries():
+    """
+    パックに入れる (相対パス, サイズ, モード) の集合を作る。
+    マップ定義の textures と、アイテム/固定スプライトの一覧から拾う。
+    """
+    entries = set()
+
+    def rel_of(val):
+        p = _resolve_path(SRC_DIR, val)
+        if p is None:
+            return None
+        try:
+            return p.relative_to(SRC_DIR).as_posix()
+        except ValueError:
+            return None
+
+    for m in MAPS.values():
+        tex = m.get("textures") or {}
+        for k in ("wall",):
+            if isinstance(tex.get(k), str):
+                entries.add((rel_of(tex[k]), None, "alpha"))
+        for k in ("floor", "ceiling"):
+            if isinstance(tex.get(k), str):
+                entries.add((rel_of(tex[k]), (TILE, TILE), "rgb3"))
+        for val in (tex.get("wall_special") or {}).values():
+            if isinstance(val, str):
+                entries.add((rel_of(val), None, "alpha"))
+        for val in (tex.get("special") or {}).values():
+            if isinstance(val, str) and ("." in val or "/" in val or "\\" in val):
+                entries.add((rel_of(val), (TILE, TILE), "rgba_tile"))
+
+    for meta in SPRITE_DB.values():
+        path = sprite_path_for(meta)
+        if path:
+            entries.add((path, ITEM_SPRITE_SIZE, "sprite"))
+    for path, _label in ALWAYS_SPRITES.values():
+        entries.add((path, ALWAYS_SPRITE_SIZE, "sprite"))
+
+    return sorted((e for e in entries if e[0]), key=lambda e: (e[0], str(e[1]), e[2]))
+
+
+def bake(surf, size, mode):
+    """Surface → パックに書く配列のリスト（C 連続の uint8）"""
+    if mode == "rgb3":
+        rgb, _ = _surf_to_tile_arrays_rgba(surf)
+        return [rgb]
+    if mode == "rgba_tile":
+        rgb, alpha = _surf_to_tile_arrays_rgba(surf)
+        return [rgb, alpha]
+    if mode == "sprite":
+        surf = pygame.transform.smoothscale(surf, size)
+    w, h = surf.get_size()
+    rgba = np.frombuffer(pygame.image.tobytes(surf, "RGBA"), dtype=np.uint8).reshape(h, w, 4)
+    return [rgba]
+
+
+def build_pack():
+    pygame.init()
+    entries = collect_entries()
+    index = {"version": PACK_VERSION, "tile": TILE, "entries": {}, "sources": {}}
+    bin_path = SRC_DIR / PACK_BIN
+    idx_path = SRC_DIR / PACK_INDEX
+
+    offset = 0
+    tmp_path = bin_path.with_suffix(".bin.tmp")
+    with open(tmp_path, "wb") as f:
+        for rel, size, mode in entries:
+            src = SRC_DIR / rel
+            if not src.exists():
+                print(f"[SKIP] 見つかりません: {rel}")
+                continue
+            surf = decode_rgba32(str(src))
+            if surf is None:
+                print(f"[SKIP] デコード失敗: {rel}")
+                continue
+
+            specs = []
+            for arr in bake(surf, size, mode):
+                arr = np.ascontiguousarray(arr, dtype=np.uint8)
+                pad = (-offset) % ALIGN
+                if pad:
+                    f.write(b"\0" * pad)
+                    offset += pad
+                specs.append({"offset": offset, "shape": list(arr.shape)})
+                f.write(arr.tobytes())
+                offset += arr.nbytes
+            index["entries"][entry_key(rel, size, mode)] = {"arrays": specs}
+
+            if rel not in index["sources"]:
+                st = src.stat()
+                index["sources"][rel] = {
+                    "sha1": file_sha1(src),
+                    "size": st.st_size,
+                    "mtime_ns": st.st_mtime_ns,
+                }
+            print(f"[SUCCESS] {mode:9s} {rel}")
+
+    os.replace(tmp_path, bin_path)
+    idx_path.write_text(json.dumps(index, ensure_ascii=False, indent=1), encoding="utf-8")
+    print(f"[INFO] {len(index['entries'])} エントリ / {offset / (1024 * 1024):.1f}MB → {bin_path}")
+
+
+if __name__ == "__main__":
+    build_pack()
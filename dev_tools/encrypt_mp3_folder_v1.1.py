@@ -3,12 +3,26 @@ MP3音源ファイル一括暗号化スクリプト
 - スクリプトと同じ場所にある全MP3を暗号化
 - 暗号化済みファイルは「.enc」拡張子付きで"sounds_encrypted"フォルダとしてスクリプトと同じ場所に保存
 - 暗号化キー（Fernetキー）は「secret.key」としてスクリプトと同じ場所に保存
+- --format stream を付けると、BGM 向けのチャンク暗号形式（src/core/stream_crypto.py）で出力
+  （ゲーム側は読む位置のチャンクだけ復号しながらストリーム再生できる。拡張子は同じ .enc）
+  鍵は同じ secret.key から導出するので、ゲーム側の FERNET_KEY を変える必要はない
+
+使い方:
+    python encrypt_mp3_folder_v1.1.py                       # 従来の Fernet 形式
+    python encrypt_mp3_folder_v1.1.py --format stream       # チャンク暗号形式（BGM 向け）
+    python encrypt_mp3_folder_v1.1.py --format stream --chunk-kb 128
 """
 
+import argparse
 import os
+import sys
 from pathlib import Path
 from cryptography.fernet import Fernet
 
+# チャンク暗号の実装はゲーム本体と共有する
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+from core.stream_crypto import DEFAULT_CHUNK_SIZE, derive_stream_key, encrypt_stream  # noqa: E402
+
 # ========================
 # --- 設定項目 ---
 # ========================
@@ -47,20 +61,21 @@ def load_key(key_file):
         return f.read()
 
 
-def encrypt_file(input_path, output_path, fernet):
+def encrypt_file(input_path, output_path, encrypt):
     """
     指定されたファイル（MP3）を暗号化し、出力パスに保存
+    :param encrypt: bytes -> bytes の暗号化関数（Fernet / チャンク暗号）
     """
     with open(input_path, "rb") as f:
         data = f.read()
-    encrypted_data = fernet.encrypt(data)
+    encrypted_data = encrypt(data)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, "wb") as f:
         f.write(encrypted_data)
     print(f"[SUCCESS] 暗号化: {input_path} → {output_path}")
 
 
-def encrypt_mp3_files(input_folder, output_folder, fernet):
+def encrypt_mp3_files(input_folder, output_folder, encrypt):
     """
     フォルダを再帰的に探索し、すべてのMP3ファイルを暗号化
     """
@@ -70,17 +85,30 @@ def encrypt_mp3_files(input_folder, output_folder, fernet):
                 src_path = Path(root) / file
                 rel_path = src_path.relative_to(input_folder)
                 dest_path = output_folder / rel_path.with_suffix(rel_path.suffix + ".enc")
-                encrypt_file(src_path, dest_path, fernet)
+                encrypt_file(src_path, dest_path, encrypt)
 
 
 def main():
+    parser = argparse.ArgumentParser(description="MP3 を一括暗号化して .enc を作る")
+    parser.add_argument("--format", choices=("fernet", "stream"), default="fernet",
+                        help="fernet=従来形式 / stream=チャンク暗号（BGM のストリーム再生向け）")
+    parser.add_argument("--chunk-kb", type=int, default=DEFAULT_CHUNK_SIZE // 1024,
+                        help="stream 形式のチャンクサイズ（KB）")
+    args = parser.parse_args()
+
     # --- 暗号化キーを生成または読み込み ---
     generate_key(KEY_FILE)
     key = load_key(KEY_FILE)
-    fernet = Fernet(key)
+    if args.format == "stream":
+        stream_key = derive_stream_key(key)
+        chunk = max(1, args.chunk_kb) * 1024
+        encrypt = lambda data: encrypt_stream(data, stream_key, chunk)  # noqa: E731
+        print(f"[INFO] チャンク暗号形式で出力します（チャンク {chunk // 1024}KB）")
+    else:
+        encrypt = Fernet(key).encrypt
 
     # --- MP3ファイルを一括暗号化 ---
-    encrypt_mp3_files(INPUT_FOLDER, OUTPUT_FOLDER, fernet)
+    encrypt_mp3_files(INPUT_FOLDER, OUTPUT_FOLDER, encrypt)
     print("\nすべてのMP3ファイルの暗号化が完了しました。")
 
 
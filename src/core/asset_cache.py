@@ -0,0 +1,163 @@
+# core/asset_cache.py
+# -*- coding: utf-8 -*-
+"""
+プロセス全体で共有する画像アセットのキャッシュ（マップをまたいで再利用）。
+
+・キーは (解決済みパス, 目標サイズ, 変換モード)。
+  同じ PNG でも「convert_alpha した原寸 Surface」「TILE×TILE の RGB 配列」
+  「96×96 のスプライト」などは別エントリとして持つ。
+・メモリ予算（バイト数）を超えたら、最も長く使われていないものから捨てる（LRU）。
+・ヒット/ミス/追い出し回数を数えるので、DEV 表示でマップ移動の効き具合が見える。
+・ロック付き：ロード処理自体はロックの外で行う（core.asset_prefetch のワーカーからも書き込む）。
+
+注意: 返る Surface / ndarray は複数マップで共有される。書き換えずに参照だけすること
+      （点灯切替などは“参照の付け替え”で行う既存方式のままでOK）。
+
+使い方:
+    surf = ASSET_CACHE.get_or_load(("/abs/wall.png", None, "alpha"),
+                                   lambda: pygame.image.load(p).convert_alpha())
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+import numpy as np
+import pygame
+
+ASSET_CACHE_MAX_BYTES = 96 * 1024 * 1024   # 既定の予算（テクスチャ/スプライト合計）
+
+# ロード失敗を覚えておくための印（毎回ディスクを見に行かない）
+_MISSING = object()
+
+
+def asset_nbytes(value: Any) -> int:
+    """キャッシュ値のおおよそのバイト数（Surface / ndarray / それらのタプル）"""
+    if value is None or value is _MISSING:
+        return 0
+    if isinstance(value, pygame.Surface):
+        return value.get_width() * value.get_height() * value.get_bytesize()
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (tuple, list)):
+        return sum(asset_nbytes(v) for v in value)
+    return 0
+
+
+class AssetCache:
+    def __init__(self, max_bytes: int = ASSET_CACHE_MAX_BYTES) -> None:
+        self.max_bytes = int(max_bytes)
+        self._entries: "OrderedDict[Hashable, tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "bytes": 0}
+
+    # ------------------------------------------------------------
+    # 基本操作
+    # ------------------------------------------------------------
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            ent = self._entries.get(key)
+            if ent is None:
+                return default
+            self._entries.move_to_end(key)
+            return None if ent[0] is _MISSING else ent[0]
+
+    def pop(self, key: Hashable) -> Any:
+        """取り出して消す（無ければ None）。統計には数えない"""
+        with self._lock:
+            ent = self._entries.pop(key, None)
+            if ent is None:
+                return None
+            self.stats["bytes"] -= ent[1]
+            return None if ent[0] is _MISSING else ent[0]
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def put(self, key: Hashable, value: Any, nbytes: Optional[int] = None) -> None:
+        size = asset_nbytes(value) if nbytes is None else int(nbytes)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.stats["bytes"] -= old[1]
+            self._entries[key] = (value, size)
+            self.stats["bytes"] += size
+            self._evict_locked()
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """キャッシュにあればそれを、無ければ loader() の結果を登録して返す（None も“無い”として覚える）"""
+        with self._lock:
+            ent = self._entries.get(key)
+            if ent is not None:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return None if ent[0] is _MISSING else ent[0]
+            self.stats["misses"] += 1
+        value = loader()
+        self.put(key, _MISSING if value is None else value)
+        return value
+
+    def _evict_locked(self) -> None:
+        # 最新の1件は予算超過でも残す（巨大画像1枚でキャッシュが空回りしないように）
+        while self.stats["bytes"] > self.max_bytes and len(self._entries) > 1:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.stats["bytes"] -= size
+            self.stats["evictions"] += 1
+
+    # ------------------------------------------------------------
+    # 管理
+    # ------------------------------------------------------------
+    def free_bytes(self) -> int:
+        with self._lock:
+            return max(0, self.max_bytes - self.stats["bytes"])
+
+    def set_budget(self, max_bytes: int) -> None:
+        with self._lock:
+            self.max_bytes = int(max_bytes)
+            self._evict_locked()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.stats["bytes"] = 0
+
+    def info(self) -> dict:
+        """DEV表示用：件数・バイト数・ヒット率"""
+        with self._lock:
+            hits, misses = self.stats["hits"], self.stats["misses"]
+            total = hits + misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.stats["bytes"],
+                "max_bytes": self.max_bytes,
+                "hits": hits,
+                "misses": misses,
+                "evictions": self.stats["evictions"],
+                "hit_rate": (hits / total) if total else 0.0,
+            }
+
+
+# プロセス共通のインスタンス
+ASSET_CACHE = AssetCache()
+
+
+# ---------------------------------------------------------------------
+# 先読み（core.asset_prefetch）との受け渡し
+#   ワーカーは display に触れないので、デコード済みの“生”Surface を mode="raw" で置いていく。
+#   メインスレッドのローダはまずここを見て、あれば convert_alpha だけで済ませる。
+# ---------------------------------------------------------------------
+def raw_key(path: str) -> tuple:
+    return (str(path), None, "raw")
+
+
+def take_decoded(path: str, cache: AssetCache = ASSET_CACHE) -> Optional[pygame.Surface]:
+    """先読み済みの“生”Surface があれば取り出す（取り出したらキャッシュからは消す）"""
+    return cache.pop(raw_key(path))
+
+
+def load_image(path: str) -> pygame.Surface:
+    """先読み済みならそれを、無ければディスクからデコード（convert はしない）"""
+    surf = take_decoded(path)
+    return surf if surf is not None else pygame.image.load(str(path))
@@ -0,0 +1,178 @@
+# core/asset_prefetch.py
+# -*- coding: utf-8 -*-
+"""
+隣接マップのアセット先読み（バックグラウンドスレッド）。
+
+・マップをロードした直後に、そのマップの triggers が指す target_map（1ホップ先）の
+  テクスチャ/スプライトをワーカースレッドでデコードし、ASSET_CACHE に入れておく。
+  → 確認ダイアログで「はい」を押した瞬間のデコード待ち（カクつき）を無くす。
+・ワーカーは画面（display）に一切触らない：
+    - 床/天井/特殊床は TILE×TILE の配列まで作って、本番と同じキーで登録
+    - 壁/スプライトは 32bit SRCALPHA の“生”Surface（mode="raw"）までを登録し、
+      convert_alpha はメインスレッドのロード時に asset_cache.take_decoded() 経由で行う
+・予算：キャッシュの空きが足りないときは先読みをやめる（今いるマップの分を追い出さない）。
+  予算の PREFETCH_BUDGET_RATIO までしか使わない。
+・取り消し：request() のたびに世代番号を上げ、古い世代のジョブは次のアセットの手前で打ち切る
+  （プレイヤーが別の出口へ向かい直したときなど）。
+
+使い方:
+    PREFETCHER.request([PrefetchPlan(map_id, tex_cfg, sprites), ...])
+"""
+from __future__ import annotations
+
+import os
+import queue
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import pygame
+
+from .asset_cache import ASSET_CACHE, AssetCache, asset_nbytes, raw_key
+from .config import TILE
+from .texture_loader import _resolve_path, _surf_to_tile_array3, _surf_to_tile_arrays_rgba
+
+DEV_MODE = os.getenv("DEV_MODE", "0") == "1"
+
+# 先読みで使ってよいのはキャッシュ予算のこの割合まで（残りは本番ロード用に空けておく）
+PREFETCH_BUDGET_RATIO = 0.75
+
+
+@dataclass
+class PrefetchPlan:
+    map_id: str
+    textures: dict                                           # load_textures に渡すのと同じ textures 定義
+    sprites: list[tuple[str, tuple[int, int]]] = field(default_factory=list)  # (相対パス, サイズ)
+
+
+def decode_rgba32(path: str) -> Optional[pygame.Surface]:
+    """display 無しで PNG をデコードし、32bit SRCALPHA の Surface にそろえる"""
+    try:
+        img = pygame.image.load(path)
+    except Exception:
+        return None
+    out = pygame.Surface(img.get_size(), pygame.SRCALPHA, 32)
+    out.blit(img, (0, 0))
+    return out
+
+
+class AssetPrefetcher:
+    def __init__(self, base_dir: Path, cache: AssetCache = ASSET_CACHE) -> None:
+        self.base_dir = Path(base_dir).resolve()
+        self.cache = cache
+        self._gen = 0
+        self._jobs: "queue.Queue[tuple[int, PrefetchPlan]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        # DEV 用の統計
+        self.stats = {"decoded": 0, "skipped": 0, "cancelled": 0, "over_budget": 0}
+
+    # ------------------------------------------------------------
+    # メインスレッドから
+    # ------------------------------------------------------------
+    def request(self, plans: list[PrefetchPlan]) -> None:
+        """先読み対象を差し替える（それ以前の未完了ジョブは取り消し）"""
+        with self._lock:
+            self._gen += 1
+            gen = self._gen
+            for plan in plans:
+                self._jobs.put((gen, plan))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="asset-prefetch", daemon=True)
+                self._thread.start()
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._gen += 1
+
+    # ------------------------------------------------------------
+    # ワーカー
+    # ------------------------------------------------------------
+    def _stale(self, gen: int) -> bool:
+        return gen != self._gen
+
+    def _run(self) -> None:
+        while True:
+            gen, plan = self._jobs.get()
+            if self._stale(gen):
+                self.stats["cancelled"] += 1
+                continue
+            try:
+                done = self._prefetch_plan(gen, plan)
+                if DEV_MODE:
+                    state = "done" if done else "stopped"
+                    print(f"[PREFETCH] {plan.map_id}: {state} {self.cache.info()['bytes'] / (1024 * 1024):.1f}MB")
+            except Exception as e:
+                if DEV_MODE:
+                    print(f"[PREFETCH][WARN] {plan.map_id}: {e}")
+
+    def _fits(self, value) -> bool:
+        reserve = int(self.cache.max_bytes * (1.0 - PREFETCH_BUDGET_RATIO))
+        if self.cache.free_bytes() - reserve >= asset_nbytes(value):
+            return True
+        self.stats["over_budget"] += 1
+        return False
+
+    def _tasks(self, plan: PrefetchPlan):
+        """(種別, 値) の列：wall/raw は生Surface、rgb3/rgba_tile は配列"""
+        tex = plan.textures or {}
+        for k in ("wall",):
+            if isinstance(tex.get(k), str):
+                yield "raw", tex[k]
+        for k in ("floor", "ceiling"):
+            if isinstance(tex.get(k), str):
+                yield "rgb3", tex[k]
+        for val in (tex.get("wall_special") or {}).values():
+            if isinstance(val, str):
+                yield "raw", val
+        for val in (tex.get("special") or {}).values():
+            if isinstance(val, str) and ("." in val or "/" in val or "\\" in val):
+                yield "rgba_tile", val
+
+    def _prefetch_plan(self, gen: int, plan: PrefetchPlan) -> bool:
+        cache = self.cache
+        for mode, rel in self._tasks(plan):
+            if self._stale(gen):
+                self.stats["cancelled"] += 1
+                return False
+            p = _resolve_path(self.base_dir, rel)
+            if p is None:
+                continue
+            key = (str(p), (TILE, TILE), mode) if mode != "raw" else raw_key(str(p))
+            # 既に本番形式で入っているなら不要
+            if key in cache or (mode == "raw" and (str(p), None, "alpha") in cache):
+                self.stats["skipped"] += 1
+                continue
+            surf = decode_rgba32(str(p))
+            if surf is None:
+                continue
+            if mode == "rgb3":
+                value = _surf_to_tile_array3(surf)
+            elif mode == "rgba_tile":
+                value = _surf_to_tile_arrays_rgba(surf)
+            else:
+                value = surf
+            if not self._fits(value):
+                return False
+            cache.put(key, value)
+            self.stats["decoded"] += 1
+
+        for rel, size in plan.sprites:
+            if self._stale(gen):
+                self.stats["cancelled"] += 1
+                return False
+            p = (self.base_dir / rel).resolve()
+            if (str(p), tuple(size), "sprite") in cache or raw_key(str(p)) in cache:
+                self.stats["skipped"] += 1
+                continue
+            if not p.exists():
+                continue
+            surf = decode_rgba32(str(p))
+            if surf is None:
+                continue
+            if not self._fits(surf):
+                return False
+            cache.put(raw_key(str(p)), surf)
+            self.stats["decoded"] += 1
+        return True
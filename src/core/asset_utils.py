@@ -13,6 +13,9 @@ from typing import Tuple, Optional
 import pygame
 import numpy as np
 
+from .asset_cache import ASSET_CACHE, load_image
+from .texture_pack import get_texture_pack
+
 MAGENTA = (220, 0, 220)   # “素材なし”感が分かりやすい色
 WHITE   = (255, 255, 255)
 GRAY1   = (180, 180, 180)
@@ -28,15 +31,38 @@ def load_or_placeholder(base_dir: Path, rel_path: str, *,
     - shape: "circle" / "rect"
     - label: 2〜3文字程度の略称を中央に描く（AX, OR, KYなど）
     """
-    # 実ファイル読み込みを試す
+    size = (int(size[0]), int(size[1]))
+    # 実ファイル読み込みを試す（縮小済みをマップ共通でキャッシュ）
+    path = (base_dir / rel_path) if rel_path else None
+    if path:
+        try:
+            key = (str(path.resolve()), size, "sprite")
+        except Exception:
+            key = (str(path), size, "sprite")
+        img = ASSET_CACHE.get_or_load(key, lambda: _load_scaled_sprite(base_dir, path, size))
+        if img is not None:
+            return img
+
+    return ASSET_CACHE.get_or_load(
+        ("<placeholder:sprite>", size, f"{shape}:{label or ''}"),
+        lambda: _make_sprite_placeholder(size, shape, label),
+    )
+
+def _load_scaled_sprite(base_dir: Path, path: Path, size: Tuple[int, int]) -> Optional[pygame.Surface]:
     try:
-        path = (base_dir / rel_path) if rel_path else None
-        if path and path.exists():
-            img = pygame.image.load(str(path)).convert_alpha()
+        # 事前ベイク済みパック（指定サイズに縮小済み）があればそれを使う
+        pack = get_texture_pack(base_dir)
+        baked = pack.surface(path, size, "sprite") if pack else None
+        if baked is not None:
+            return baked.convert_alpha()
+        if path.exists():
+            img = load_image(str(path.resolve())).convert_alpha()
             return pygame.transform.smoothscale(img, size)
     except Exception:
         pass  # 失敗→プレースホルダーへ
+    return None
 
+def _make_sprite_placeholder(size: Tuple[int, int], shape: str, label: Optional[str]) -> pygame.Surface:
     w, h = size
     surf = pygame.Surface(size, pygame.SRCALPHA)
 
@@ -0,0 +1,179 @@
+# core/audio_cache.py
+# -*- coding: utf-8 -*-
+"""
+復号済み音声のキャッシュ（ボイス / BGM / ムービー音声で共有）。
+
+・以前は play_voice / play_bgm / play_video のたびに .mp3.enc を丸ごと読み直して fernet.decrypt していた。
+  同じセリフの再生や chaser_caught.mp4 のリトライでも毎回復号＋MP3デコードが走る。
+・ここでは2種類を LRU で持つ（キーはファイルの絶対パス＋種類）：
+    "bytes" : 復号済みの MP3 などのバイト列（BGM はストリーム再生なのでこちら）
+    "sound" : 構築済みの pygame.mixer.Sound（ボイス・ムービー音声。デコード済み PCM を持つ）
+  Sound のキーにはミキサーの形式（周波数・ビット・ch）も入れるので、mixer を作り直しても古い PCM は使わない。
+・予算（バイト数）を超えたら最も長く使われていないものから捨てる。
+  pin したもの（短いループ音・何度も流れるムービー音声）は追い出さない。
+・ファイルの mtime が変わっていたら読み直す（開発中の差し替え用）。
+
+使い方:
+    data = AUDIO_CACHE.read_bytes(path)           # 復号済みバイト列
+    snd  = AUDIO_CACHE.load_sound(path, pin=True) # Sound（同じ Sound を共有するので音量は再生直前に設定）
+"""
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, Optional
+
+import pygame
+
+DEV_MODE = os.getenv("DEV_MODE", "0") == "1"
+
+AUDIO_CACHE_MAX_BYTES = 48 * 1024 * 1024   # 既定の予算（復号済みバイト列＋Sound の PCM 合計）
+AUDIO_PIN_MAX_SEC = 30.0                    # pin を許す長さ（これより長い音は pin しても普通の LRU 扱い）
+
+
+def _decrypt(data: bytes) -> bytes:
+    # 鍵は sound_manager 側で一元管理（循環 import を避けるため呼び出し時に参照）。
+    # チャンク暗号（core.stream_crypto）と従来の Fernet の両方をここで見分ける
+    from core.sound_manager import decrypt_audio
+    return decrypt_audio(data)
+
+
+def sound_nbytes(sound: pygame.mixer.Sound) -> int:
+    """Sound が持つ PCM のおおよそのバイト数（get_raw はコピーになるので長さから計算）"""
+    init = pygame.mixer.get_init()
+    if not init:
+        return 0
+    freq, size, channels = init
+    return int(sound.get_length() * freq * channels * (abs(size) // 8))
+
+
+class AudioCache:
+    def __init__(self, max_bytes: int = AUDIO_CACHE_MAX_BYTES) -> None:
+        self.max_bytes = int(max_bytes)
+        # key -> (値, バイト数, mtime_ns)
+        self._entries: "OrderedDict[Hashable, tuple[Any, int, int]]" = OrderedDict()
+        self._pinned: set[Hashable] = set()
+        self._lock = threading.RLock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "bytes": 0}
+
+    # ------------------------------------------------------------
+    # 内部
+    # ------------------------------------------------------------
+    @staticmethod
+    def _mtime(path: Path) -> int:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return -1
+
+    def _get(self, key: Hashable, mtime: int) -> Any:
+        with self._lock:
+            ent = self._entries.get(key)
+            if ent is not None and ent[2] == mtime:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return ent[0]
+            self.stats["misses"] += 1
+            return None
+
+    def _put(self, key: Hashable, value: Any, nbytes: int, mtime: int) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.stats["bytes"] -= old[1]
+            self._entries[key] = (value, nbytes, mtime)
+            self.stats["bytes"] += nbytes
+            self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        # pin 中のものは飛ばす。最新の1件は予算超過でも残す
+        victims = [k for k in self._entries if k not in self._pinned]
+        for key in victims[:-1]:
+            if self.stats["bytes"] <= self.max_bytes:
+                break
+            _, size, _ = self._entries.pop(key)
+            self.stats["bytes"] -= size
+            self.stats["evictions"] += 1
+
+    # ------------------------------------------------------------
+    # 取得
+    # ------------------------------------------------------------
+    def read_bytes(self, path, encrypted: Optional[bool] = None) -> bytes:
+        """ファイルの中身（.enc なら復号済み）。失敗時は例外をそのまま投げる"""
+        path = Path(path).resolve()
+        is_enc = encrypted if encrypted is not None else path.name.endswith(".enc")
+        key = (str(path), "bytes")
+        mtime = self._mtime(path)
+        data = self._get(key, mtime)
+        if data is not None:
+            return data
+        with open(path, "rb") as f:
+            data = f.read()
+        if is_enc:
+            data = _decrypt(data)
+        self._put(key, data, len(data), mtime)
+        return data
+
+    def load_sound(self, path, encrypted: Optional[bool] = None, *, pin: bool = False) -> pygame.mixer.Sound:
+        """
+        構築済みの Sound（初回だけ復号＋デコード）。
+        同じ Sound を使い回すので、音量は呼び出し側が再生直前に set_volume すること。
+        """
+        path = Path(path).resolve()
+        is_enc = encrypted if encrypted is not None else path.name.endswith(".enc")
+        key = (str(path), "sound", pygame.mixer.get_init())
+        mtime = self._mtime(path)
+        snd = self._get(key, mtime)
+        if snd is None:
+            # 復号済みバイト列は Sound を作ったら不要なので bytes 側には残さない。
+            # デコード済み PCM はディスク（core.pcm_cache）にも残し、次回起動では MP3 デコードを省く
+            from core.pcm_cache import PCM_CACHE
+            snd = PCM_CACHE.load_sound(path, encrypted=is_enc)
+            self._put(key, snd, sound_nbytes(snd), mtime)
+            if DEV_MODE:
+                print(f"[AUDIO] decoded {path.name} ({snd.get_length():.1f}s)")
+        if pin and snd.get_length() <= AUDIO_PIN_MAX_SEC:
+            with self._lock:
+                self._pinned.add(key)
+        return snd
+
+    # ------------------------------------------------------------
+    # 管理
+    # ------------------------------------------------------------
+    def unpin_all(self) -> None:
+        with self._lock:
+            self._pinned.clear()
+            self._evict_locked()
+
+    def set_budget(self, max_bytes: int) -> None:
+        with self._lock:
+            self.max_bytes = int(max_bytes)
+            self._evict_locked()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._pinned.clear()
+            self.stats["bytes"] = 0
+
+    def info(self) -> dict:
+        """DEV表示用：件数・バイト数・ヒット率"""
+        with self._lock:
+            hits, misses = self.stats["hits"], self.stats["misses"]
+            total = hits + misses
+            return {
+                "entries": len(self._entries),
+                "pinned": len(self._pinned),
+                "bytes": self.stats["bytes"],
+                "max_bytes": self.max_bytes,
+                "hits": hits,
+                "misses": misses,
+                "evictions": self.stats["evictions"],
+                "hit_rate": (hits / total) if total else 0.0,
+            }
+
+
+# プロセス共通のインスタンス
+AUDIO_CACHE = AudioCache()
@@ -0,0 +1,144 @@
+# core/channel_pool.py
+# -*- coding: utf-8 -*-
+"""
+ミキサーのチャンネルを用途別のグループに分けて割り当てる。
+
+・以前は voice に Channel(3) 決め打ち、ループは _ensure_channel で 6 番以降を場当たり的に確保、
+  単発 SE は Sound.play() で「空いているどれか」を使っていた。
+  追跡BGM＋川の環境音＋足音＋SE が重なると、空きが無くなった音が黙って鳴らない。
+  （しかも Sound.play() が voice 用の 3 番を横取りすることもあった）
+・ここではグループ（voice / loop / ambience / ui / world）ごとに本数を宣言して連番で確保し、
+  set_reserved でプール分は自動割り当ての対象外にする（Sound.play() に横取りされない）。
+・単発再生 play() はグループ内の空きを使い、空きが無ければ
+  優先度が自分以下のものの中から「いちばん優先度が低いもの」を止めて奪う
+  （同じ優先度が複数あれば、いちばん古く鳴り始めたもの）。
+  奪えなければその再生は捨てる。どちらも回数を数える（DEV 表示用）。
+・ループ用の名前付きチャンネル named() はグループ内の1本を専有する。
+
+使い方:
+    pool = ChannelPool(CHANNEL_GROUPS)
+    pool.play("world", sound, priority=60)
+    ch = pool.named("loop", "footstep")
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import pygame
+
+
+@dataclass(frozen=True)
+class ChannelGroup:
+    name: str
+    capacity: int        # このグループが使えるチャンネル数
+    priority: int = 50   # play() で priority を省略したときの値
+
+
+# 既定の構成（合計 10 本。プール外の番号は従来どおり Sound.play() の自動割り当て用に残る）
+CHANNEL_GROUPS = (
+    ChannelGroup("voice", 1, 100),    # セリフ・ムービー音声
+    ChannelGroup("ambience", 1, 70),  # 川などの環境音ループ
+    ChannelGroup("loop", 2, 60),      # 足音などの名前付きループ
+    ChannelGroup("ui", 2, 80),        # カーソル/決定/メニュー
+    ChannelGroup("world", 4, 50),     # ゲーム内の単発 SE
+)
+
+
+class ChannelPool:
+    def __init__(self, groups=CHANNEL_GROUPS, first_index: int = 0) -> None:
+        self.groups = {g.name: g for g in groups}
+        self._channels: dict[str, list[pygame.mixer.Channel]] = {}
+        self._indices: dict[str, list[int]] = {}
+        # チャンネル番号 -> (優先度, 鳴り始めた時刻)
+        self._playing: dict[int, tuple[int, float]] = {}
+        self._named: dict[tuple[str, str], int] = {}
+        self.stats = {g.name: {"played": 0, "stolen": 0, "dropped": 0} for g in groups}
+
+        idx = int(first_index)
+        for g in groups:
+            self._indices[g.name] = list(range(idx, idx + g.capacity))
+            idx += g.capacity
+        self.total = idx
+        try:
+            if pygame.mixer.get_num_channels() < self.total + 2:
+                pygame.mixer.set_num_channels(self.total + 2)   # プール外にも少し残す
+            pygame.mixer.set_reserved(self.total)
+        except Exception:
+            pass
+        for name, idxs in self._indices.items():
+            self._channels[name] = [pygame.mixer.Channel(i) for i in idxs]
+
+    # ------------------------------------------------------------
+    # 名前付き（ループ用・専有）
+    # ------------------------------------------------------------
+    def named(self, group: str, name: str) -> pygame.mixer.Channel:
+        """group の中から name 専用のチャンネルを1本割り当てる（同じ名前なら同じチャンネル）"""
+        key = (group, name)
+        idx = self._named.get(key)
+        if idx is None:
+            taken = {i for (g, _), i in self._named.items() if g == group}
+            free = [i for i in self._indices[group] if i not in taken]
+            # 専有しきったら最後の1本を共有（ループが本数より多い構成ミスでも落ちないように）
+            idx = free[0] if free else self._indices[group][-1]
+            self._named[key] = idx
+        return pygame.mixer.Channel(idx)
+
+    # ------------------------------------------------------------
+    # 単発再生
+    # ------------------------------------------------------------
+    def _pick(self, group: str, priority: int) -> tuple[Optional[int], bool]:
+        """
+        (使うチャンネル番号, 奪ったか)。空きも奪える相手も無ければ (None, False)。
+        奪う相手は priority 以下のうち (優先度, 鳴り始めた時刻) が最小のもの＝最低優先度、同点なら最古
+        """
+        named = {i for (g, _), i in self._named.items() if g == group}
+        candidates = [i for i in self._indices[group] if i not in named]
+        victim = None
+        for i in candidates:
+            if not pygame.mixer.Channel(i).get_busy():
+                return i, False
+            prio, started = self._playing.get(i, (0, 0.0))
+            if prio <= priority and (victim is None or (prio, started) < victim[1]):
+                victim = (i, (prio, started))
+        if victim is None:
+            return None, False
+        return victim[0], True
+
+    def play(self, group: str, sound: pygame.mixer.Sound, *, priority: Optional[int] = None,
+             loops: int = 0, fade_ms: int = 0) -> Optional[pygame.mixer.Channel]:
+        """group のチャンネルで sound を鳴らす。鳴らせなかったら None"""
+        g = self.groups[group]
+        prio = g.priority if priority is None else int(priority)
+        idx, stolen = self._pick(group, prio)
+        st = self.stats[group]
+        if idx is None:
+            st["dropped"] += 1
+            return None
+        ch = pygame.mixer.Channel(idx)
+        if stolen:
+            ch.stop()
+            st["stolen"] += 1
+        ch.play(sound, loops=loops, fade_ms=max(0, int(fade_ms)))
+        self._playing[idx] = (prio, time.perf_counter())
+        st["played"] += 1
+        return ch
+
+    # ------------------------------------------------------------
+    # 管理
+    # ------------------------------------------------------------
+    def stop_group(self, group: str, fade_ms: int = 0) -> None:
+        for ch in self._channels[group]:
+            if fade_ms > 0:
+                ch.fadeout(int(fade_ms))
+            else:
+                ch.stop()
+
+    def info(self) -> dict:
+        """DEV表示用：グループごとの使用中本数と再生/横取り/破棄の回数"""
+        out = {}
+        for name, chans in self._channels.items():
+            busy = sum(1 for ch in chans if ch.get_busy())
+            out[name] = {"busy": busy, "capacity": len(chans), **self.stats[name]}
+        return out
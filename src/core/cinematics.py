@@ -6,7 +6,7 @@
  - 近接トリガ（シンボル／座標）
  - once 再生（videos_played フラグ管理）
  - クールダウン（多重発火防止）
- - キュー処理（1本ずつ再生）
+ - キュー処理（1本ずつ再生。再生中に次のムービーを先に開いておく）
  - 便利関数：ブロッキング再生、ドクター演出シーケンス
 """
 from __future__ import annotations
@@ -19,11 +19,15 @@ import pygame
 import core.game_state as game_state
 from core.config import TILE, WIDTH, HEIGHT
 from core.maps import MAPS
+from core.symbol_index import get_symbol_index
 from core.transitions import fade_in, fade_out
 #
 # すべての動画再生は video_player.play_video に統一する
 # （音声の指定・SEキューなど video_player 側の機能を全面利用）
-from core.video_player import play_video as _vp_play_video
+from core.video_player import play_video as _vp_play_video, VideoPreroll
+
+# キューの次のムービーの準備（今のムービーの再生中に開いておく）
+_next_preroll: VideoPreroll | None = None
 
 # --- 内部ユーティリティ ---------------------------------------------------
 def _vp_set() -> set[str]:
@@ -59,7 +63,8 @@ def play_video_blocking(
     fade: bool = False,
     audio_path: str | None = None,
     sound_manager=None,
-    se_cues: list[tuple[float, str]] | None = None
+    se_cues: list[tuple[float, str]] | None = None,
+    preroll: VideoPreroll | None = None,
 ) -> dict:
     """
     video_player.play_video を使ったブロッキング再生（結果 dict を返す）
@@ -95,6 +100,7 @@ def play_video_blocking(
             fade_ms=0,                      # フェードは本関数で wrap する
             sound_manager=sound_manager,    # （任意）BGM/SE 音量統一のため
             se_cues=se_cues,                # （任意）ムービーに同期してSEを鳴らす
+            preroll=preroll,                # （任意）先に開いておいた準備
         )
         # 互換の戻り値に整形
         res = {"played_to_end": bool(finished)}
@@ -118,19 +124,51 @@ def enqueue_video(video_id: str, video_path: str, *, toast_on_end: Optional[str]
         "audio_path": audio_path,
     })
 
+def _discard_preroll() -> None:
+    global _next_preroll
+    if _next_preroll is not None:
+        _next_preroll.close()
+        _next_preroll = None
+
+def _take_preroll(base_dir: Path, job: dict) -> VideoPreroll | None:
+    """job 用に開いておいた準備を受け取る（別のムービー向けなら捨てる）"""
+    global _next_preroll
+    pr, _next_preroll = _next_preroll, None
+    if pr is not None and not pr.matches(base_dir, job["video_path"], job.get("audio_path")):
+        pr.close()
+        pr = None
+    return pr
+
+def _preopen_next(base_dir: Path, q: deque) -> None:
+    """キュー先頭（次に流れるムービー）を裏で開いておく"""
+    global _next_preroll
+    nxt = q[0] if q else None
+    if not nxt or nxt.get("kind") != "video":
+        return
+    if has_played(game_state.current_map_id, nxt.get("id") or nxt.get("video_path")):
+        return
+    _next_preroll = VideoPreroll(base_dir, nxt["video_path"], nxt.get("audio_path"))
+
 def process_queue(screen: pygame.Surface, base_dir: Path, *,
                   toast_cb: Optional[Callable[[str,int],None]] = None,
                   sound_manager=None) -> None:
     q: deque = game_state.state.setdefault("cinematic_queue", deque())
-    if not q or not can_fire():
+    if not q:
+        _discard_preroll()   # キューが片付けられた：開いておいた分も閉じる
+        return
+    if not can_fire():
         return
     job = q.popleft()
     if job.get("kind") != "video":
+        _discard_preroll()
         return
     cur_map = game_state.current_map_id
     vid_id = job.get("id") or job.get("video_path")
     if has_played(cur_map, vid_id):
+        _discard_preroll()
         return
+    preroll = _take_preroll(base_dir, job)
+    _preopen_next(base_dir, q)
     res = play_video_blocking(
         screen, base_dir,
         job["video_path"],
@@ -139,6 +177,7 @@ def process_queue(screen: pygame.Surface, base_dir: Path, *,
         audio_path=job.get("audio_path"),
         se_cues=job.get("se_cues"),
         sound_manager=sound_manager,
+        preroll=preroll,
     )
     mark_played(cur_map, vid_id)
     msg = job.get("toast_on_end") if res.get("played_to_end") else job.get("toast_on_skip")
@@ -148,17 +187,8 @@ def process_queue(screen: pygame.Surface, base_dir: Path, *,
 
 # --- 近接トリガ（once） ----------------------------------------------------
 def _player_near_any_symbol(symbols: Iterable[str], radius_px: float) -> bool:
-    layout = MAPS[game_state.current_map_id]["layout"]
-    px, py = game_state.player_x, game_state.player_y
-    r2 = radius_px * radius_px
-    for y, row in enumerate(layout):
-        for x, ch in enumerate(row):
-            if ch in symbols:
-                cx, cy = x*TILE + TILE*0.5, y*TILE + TILE*0.5
-                dx, dy = px - cx, py - cy
-                if dx*dx + dy*dy <= r2:
-                    return True
-    return False
+    idx = get_symbol_index(game_state.current_map_id)
+    return idx.near_any(symbols, game_state.player_x, game_state.player_y, radius_px, TILE)
 
 def trigger_proximity_movie_once(
     screen: pygame.Surface,
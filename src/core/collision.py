@@ -0,0 +1,126 @@
+# core/collision.py
+# -*- coding: utf-8 -*-
+"""
+タイルグリッドとの当たり判定（スイープ式・軸分離）。
+
+・キャラクターを「中心 (x, y)・半径 r の正方形（AABB）」とみなし、
+  X → Y の順に1軸ずつ動かして、通行不可タイルに食い込んだら境界ぴったりに押し戻す。
+  → 壁沿いのスライド移動が1回の呼び出しで完結する。
+・1回の移動量が大きいときは、タイルをすり抜けない幅（半タイル以下）に分割して進める
+  （スピードアップや低fpsでも角を貫通しない）。
+・AABB の当たり方は is_wall(x, y, radius) の 3×3 プローブと同じ
+  （r < TILE なので、プローブ9点で AABB が触れる全タイルを網羅している）。
+・マップ外は壁扱い。
+
+スカラ版 move_circle() と、複数体を一括で解く配列版 move_circles() を提供。
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+# 境界から押し戻すときのすき間（次の判定で“接触中”と誤判定しないため）
+_SKIN = 1e-3
+
+
+def _walk_at(walkable: np.ndarray, tx: int, ty: int) -> bool:
+    h, w = walkable.shape
+    return 0 <= tx < w and 0 <= ty < h and bool(walkable[ty, tx])
+
+
+def _span(lo: float, hi: float, tile: int) -> range:
+    """座標区間 [lo, hi] が触れるタイル番号の範囲"""
+    return range(int(math.floor(lo / tile)), int(math.floor(hi / tile)) + 1)
+
+
+def _sweep_axis(walkable: np.ndarray, x: float, y: float, d: float,
+                radius: float, tile: int, axis: int) -> tuple[float, bool]:
+    """
+    1軸ぶんの移動（axis=0 で X、1 で Y）。
+    戻り値: (新しい座標値, 壁に当たったか)
+    """
+    pos, other = (x, y) if axis == 0 else (y, x)
+    if d == 0.0:
+        return pos, False
+    new = pos + d
+    # 進行方向の“先端”が入るタイル列を調べる
+    lead = new + radius if d > 0 else new - radius
+    lead_t = int(math.floor(lead / tile))
+    for o in _span(other - radius, other + radius, tile):
+        tx, ty = (lead_t, o) if axis == 0 else (o, lead_t)
+        if not _walk_at(walkable, tx, ty):
+            # 壁タイルの手前の境界へ押し戻す
+            if d > 0:
+                return lead_t * tile - radius - _SKIN, True
+            return (lead_t + 1) * tile + radius + _SKIN, True
+    return new, False
+
+
+def move_circle(walkable: np.ndarray, x: float, y: float, dx: float, dy: float,
+                radius: float, tile: int) -> tuple[float, float, bool, bool]:
+    """
+    (x, y) から (dx, dy) だけ動かし、壁で補正した位置を返す。
+    戻り値: (new_x, new_y, hit_x, hit_y)
+    """
+    # すり抜け防止：1サブステップの移動量を半タイル以下に
+    n = max(1, int(math.ceil(max(abs(dx), abs(dy)) / (tile * 0.5))))
+    sx, sy = dx / n, dy / n
+    hit_x = hit_y = False
+    for _ in range(n):
+        if not hit_x:
+            x, hx = _sweep_axis(walkable, x, y, sx, radius, tile, 0)
+            hit_x |= hx
+        if not hit_y:
+            y, hy = _sweep_axis(walkable, x, y, sy, radius, tile, 1)
+            hit_y |= hy
+        if hit_x and hit_y:
+            break
+    return x, y, hit_x, hit_y
+
+
+# ---------------------------------------------------------------------
+# 配列版（追跡者プール用）
+# ---------------------------------------------------------------------
+def _walk_batch(walkable: np.ndarray, tx: np.ndarray, ty: np.ndarray) -> np.ndarray:
+    h, w = walkable.shape
+    inb = (tx >= 0) & (tx < w) & (ty >= 0) & (ty < h)
+    out = np.zeros(tx.shape, dtype=bool)
+    out[inb] = walkable[ty[inb], tx[inb]]
+    return out
+
+
+def _sweep_axis_batch(walkable: np.ndarray, pos: np.ndarray, other: np.ndarray,
+                      d: np.ndarray, radius: float, tile: int, axis: int) -> np.ndarray:
+    """_sweep_axis の配列版。r < TILE/2 前提で、交差方向に触れるタイルは最大2列"""
+    new = pos + d
+    lead = np.where(d > 0, new + radius, new - radius)
+    lead_t = np.floor(lead / tile).astype(np.int64)
+    o_lo = np.floor((other - radius) / tile).astype(np.int64)
+    o_hi = np.floor((other + radius) / tile).astype(np.int64)
+    if axis == 0:
+        ok = _walk_batch(walkable, lead_t, o_lo) & _walk_batch(walkable, lead_t, o_hi)
+    else:
+        ok = _walk_batch(walkable, o_lo, lead_t) & _walk_batch(walkable, o_hi, lead_t)
+    blocked = (d != 0) & ~ok
+    clamp = np.where(d > 0, lead_t * tile - radius - _SKIN, (lead_t + 1) * tile + radius + _SKIN)
+    return np.where(blocked, clamp, new)
+
+
+def move_circles(walkable: np.ndarray, xs: np.ndarray, ys: np.ndarray,
+                 dxs: np.ndarray, dys: np.ndarray, radius: float, tile: int
+                 ) -> tuple[np.ndarray, np.ndarray]:
+    """move_circle の一括版（追跡者など複数体）。戻り値: (new_xs, new_ys)"""
+    xs = np.asarray(xs, dtype=np.float64).copy()
+    ys = np.asarray(ys, dtype=np.float64).copy()
+    dxs = np.asarray(dxs, dtype=np.float64)
+    dys = np.asarray(dys, dtype=np.float64)
+    if xs.size == 0:
+        return xs, ys
+    max_d = float(max(np.abs(dxs).max(), np.abs(dys).max()))
+    n = max(1, int(math.ceil(max_d / (tile * 0.5))))
+    sx, sy = dxs / n, dys / n
+    for _ in range(n):
+        xs = _sweep_axis_batch(walkable, xs, ys, sx, radius, tile, 0)
+        ys = _sweep_axis_batch(walkable, ys, xs, sy, radius, tile, 1)
+    return xs, ys
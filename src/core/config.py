@@ -8,7 +8,13 @@ NUM_RAYS = 120
 MAX_DEPTH = 800
 TILE = 64
 MAP_SIZE = 10
-PLAYER_SPEED = 3
+PLAYER_SPEED = 3  # 60fps 基準の px/フレーム（固定ステップでは ×60 して px/秒 として扱う）
+
+# ---  ゲームループ（固定タイムステップ） ---
+SIM_HZ = 120                 # シミュレーション（移動・追跡者・タイマー）の更新頻度
+SIM_DT = 1.0 / SIM_HZ        # 1ステップの秒数
+MAX_FRAME_DT = 0.25          # これより長いフレームは“停止していた”とみなし、取り戻さない
+RENDER_FPS_CAP = 120         # 描画の上限fps（0 で無制限）
 
 DELTA_ANGLE = FOV / NUM_RAYS  # FOV（視野角）とNUM_RAYS（レイ本数）から計算される定数
 
@@ -1,59 +1,161 @@
 # core/enemies.py
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import Tuple, Callable
-import math
-import pygame
-
-Vec2 = Tuple[float, float]
-Grid = Tuple[int, int]
-
-@dataclass
-class Chaser:
-    """地下通路向けのシンプル追跡者（最小実装）
-    - プレイヤー方向の単位ベクトルに沿って等速移動
-    - 次位置が「壁なら止まる」: is_block_px(nx, ny) を外から受け取る
+import numpy as np
+
+from core.collision import move_circles
+
+# =====================================================================
+# 複数体の追跡者を NumPy 配列でまとめて扱う“プール”
+#  - 位置・速度・状態・タイマーを 1体=1要素 の配列で保持
+#  - 移動 / 壁スライド（core.collision のスイープ判定） / 起床判定 / 捕獲判定 を配列演算で一括処理
+#  - 10〜50体規模でも Python ループは描画の blit 程度に抑える
+# =====================================================================
+
+# 状態
+ENEMY_STATE_FREE = 0     # 未使用スロット（配列末尾より後ろは常にこれ）
+ENEMY_STATE_CHASING = 1  # 有効（タイマー次第で起床→追跡）
+
+# 由来グループ（マップ再構築時に“マップ定義の敵”だけ作り直すため）
+ENEMY_GROUP_MAP = 1      # maps.py の "enemies" / "chaser.enabled" 由来
+ENEMY_GROUP_SPAWNED = 2  # 近接トリガや DEV(F8) で出現したもの
+
+class EnemyPool:
+    """
+    1マップ分の追跡者群。配列は先頭 count 要素だけが有効（常に詰めて保持）。
+
+    座標はピクセル、速度は px/秒、タイマーは pygame.time.get_ticks() の ms。
     """
-    # 初期化パラメータ
-    spawn_px: Vec2
-    speed: float = 2.2             # 1フレーム当たりの移動px（60fps基準）
-    capture_radius_px: float = 28  # 捕獲判定のしきい値
-
-    # ランタイム
-    pos_px: Vec2 = field(init=False)
-
-    def __post_init__(self) -> None:
-        self.pos_px = self.spawn_px
-
-    def reset(self) -> None:
-        """捕獲後など初期状態へ"""
-        self.pos_px = self.spawn_px
-
-    def update(self,
-               player_px: Vec2,
-               is_block_px: Callable[[float, float], bool]) -> bool:
-        """1フレーム更新。捕獲したら True を返す。"""
-        dx = player_px[0] - self.pos_px[0]
-        dy = player_px[1] - self.pos_px[1]
-        dist = math.hypot(dx, dy)
-
-        # 捕獲チェック
-        if dist <= self.capture_radius_px:
-            return True
-
-        # 単位ベクトルで“まっすぐ”接近（壁ならそのフレームは停止）
-        if dist > 1e-6:
-            ux, uy = dx / dist, dy / dist
-            nx = self.pos_px[0] + ux * self.speed
-            ny = self.pos_px[1] + uy * self.speed
-            if not is_block_px(nx, ny):
-                self.pos_px = (nx, ny)
-
-        return False
-
-    def draw_debug_2d(self, screen: pygame.Surface, camera_offset: Vec2) -> None:
-        """開発用の簡易2D表示（本番は既存のスプライト描画に統合OK）"""
-        x = int(self.pos_px[0] - camera_offset[0])
-        y = int(self.pos_px[1] - camera_offset[1])
-        pygame.draw.circle(screen, (200, 40, 40), (x, y), 12)
+
+    def __init__(self, map_id: str, capacity: int = 8) -> None:
+        self.map_id = map_id
+        self.count = 0
+        self._alloc(max(1, int(capacity)))
+
+    # ------------------------------------------------------------
+    # 配列の確保・拡張
+    # ------------------------------------------------------------
+    def _alloc(self, cap: int) -> None:
+        self.x = np.zeros(cap, dtype=np.float64)
+        self.y = np.zeros(cap, dtype=np.float64)
+        self.vx = np.zeros(cap, dtype=np.float64)
+        self.vy = np.zeros(cap, dtype=np.float64)
+        self.speed = np.zeros(cap, dtype=np.float64)
+        self.state = np.zeros(cap, dtype=np.int8)
+        self.group = np.zeros(cap, dtype=np.int8)
+        self.wake_at = np.zeros(cap, dtype=np.int64)     # これ以前は動かない
+        self.safe_until = np.zeros(cap, dtype=np.int64)  # これ以前は動かない＆捕まえない
+        self.anim_offset = np.zeros(cap, dtype=np.int16) # アニメのコマずらし（足並みを揃えない）
+        # 描画側の“足元Y”平滑化用（NaN=未初期化）
+        self.ground_y = np.full(cap, np.nan, dtype=np.float64)
+        self.prev_dist = np.full(cap, np.nan, dtype=np.float64)
+
+    _FIELDS = ("x", "y", "vx", "vy", "speed", "state", "group",
+               "wake_at", "safe_until", "anim_offset", "ground_y", "prev_dist")
+
+    def _grow(self) -> None:
+        old = {name: getattr(self, name) for name in self._FIELDS}
+        self._alloc(len(self.x) * 2)
+        for name, arr in old.items():
+            getattr(self, name)[:len(arr)] = arr
+
+    # ------------------------------------------------------------
+    # 生成・削除
+    # ------------------------------------------------------------
+    def spawn(self, x: float, y: float, *, speed: float, wake_at_ms: int = 0,
+              safe_until_ms: int = 0, group: int = ENEMY_GROUP_SPAWNED,
+              anim_offset: int = 0) -> int:
+        """1体追加してインデックスを返す"""
+        if self.count >= len(self.x):
+            self._grow()
+        i = self.count
+        self.x[i], self.y[i] = float(x), float(y)
+        self.vx[i] = self.vy[i] = 0.0
+        self.speed[i] = float(speed)
+        self.state[i] = ENEMY_STATE_CHASING
+        self.group[i] = int(group)
+        self.wake_at[i] = int(wake_at_ms)
+        self.safe_until[i] = int(safe_until_ms)
+        self.anim_offset[i] = int(anim_offset)
+        self.ground_y[i] = np.nan
+        self.prev_dist[i] = np.nan
+        self.count += 1
+        return i
+
+    def _keep(self, keep: np.ndarray) -> None:
+        """keep=True の要素だけを先頭に詰め直す"""
+        n = int(keep.sum())
+        for name in self._FIELDS:
+            arr = getattr(self, name)
+            arr[:n] = arr[:self.count][keep]
+        self.state[n:self.count] = ENEMY_STATE_FREE
+        self.count = n
+
+    def remove_group(self, group: int) -> None:
+        if self.count:
+            self._keep(self.group[:self.count] != group)
+
+    def clear(self) -> None:
+        self.state[:self.count] = ENEMY_STATE_FREE
+        self.count = 0
+
+    # ------------------------------------------------------------
+    # 参照
+    # ------------------------------------------------------------
+    def __len__(self) -> int:
+        return self.count
+
+    def active_count(self) -> int:
+        return int((self.state[:self.count] == ENEMY_STATE_CHASING).sum())
+
+    def awake_mask(self, now_ms: int) -> np.ndarray:
+        """起床済み（wake/safe の両タイマーを過ぎた）有効個体のマスク"""
+        n = self.count
+        return ((self.state[:n] == ENEMY_STATE_CHASING)
+                & (self.wake_at[:n] <= now_ms)
+                & (self.safe_until[:n] <= now_ms))
+
+    # ------------------------------------------------------------
+    # 一括更新
+    # ------------------------------------------------------------
+    def step(self, dt_sec: float, now_ms: int,
+             target_x: np.ndarray, target_y: np.ndarray,
+             walkable: np.ndarray, tile: int, radius: float = 8.0) -> None:
+        """
+        起床済みの個体を target へ向けて speed*dt だけ進める。
+        壁とは core.collision.move_circles で軸分離スイープ判定（壁沿いにスライド）。
+        walkable: 通行可能マスク(bool, H×W)。範囲外は壁扱い。
+        """
+        n = self.count
+        if n == 0:
+            return
+        moving = self.awake_mask(now_ms)
+        cx, cy = self.x[:n], self.y[:n]
+        dx = np.asarray(target_x, dtype=np.float64) - cx
+        dy = np.asarray(target_y, dtype=np.float64) - cy
+        d = np.maximum(1e-6, np.hypot(dx, dy))
+        step = self.speed[:n] * max(0.0, float(dt_sec))
+        vx = np.where(moving, dx / d * step, 0.0)
+        vy = np.where(moving, dy / d * step, 0.0)
+
+        new_x, new_y = move_circles(walkable, cx, cy, vx, vy, radius, tile)
+        new_x = np.where(moving, new_x, cx)
+        new_y = np.where(moving, new_y, cy)
+
+        inv_dt = 1.0 / dt_sec if dt_sec > 0 else 0.0
+        self.vx[:n] = (new_x - cx) * inv_dt
+        self.vy[:n] = (new_y - cy) * inv_dt
+        self.x[:n] = new_x
+        self.y[:n] = new_y
+
+    def capture_index(self, px: float, py: float, radius_px: float, now_ms: int) -> int:
+        """捕獲半径内にいる起床済み個体のうち最も近いもののインデックス（無ければ -1）"""
+        n = self.count
+        if n == 0:
+            return -1
+        d2 = (self.x[:n] - px) ** 2 + (self.y[:n] - py) ** 2
+        hit = self.awake_mask(now_ms) & (d2 <= radius_px * radius_px)
+        if not hit.any():
+            return -1
+        return int(np.argmin(np.where(hit, d2, np.inf)))
+
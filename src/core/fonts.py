@@ -12,6 +12,8 @@ from pathlib import Path
 from functools import lru_cache
 import pygame
 
+from core.startup_trace import span
+
 # プロジェクトのルート（core/ から2階層遡る）
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 FONT_PATH = PROJECT_ROOT / "assets" / "fonts" / "NotoSansJP-Regular.ttf"
@@ -30,7 +32,8 @@ def get_font(size: int) -> pygame.font.Font:
     - lru_cache で再利用（パフォーマンス＆一貫性）
     """
     # NOTE: pygame.font.Font は Path でもOKだが、古い環境配慮で str() 化
-    return pygame.font.Font(str(FONT_PATH), size)
+    with span(f"font NotoSansJP {size}pt"):
+        return pygame.font.Font(str(FONT_PATH), size)
 
 # ------------------------------------------------------------
 # テキスト描画ヘルパ（影・縁取り）
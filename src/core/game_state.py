@@ -34,6 +34,13 @@ current_textures = {
     "ceiling": None,
 }
 
+# --- タイルグリッド（current_tile_grid）の版番号 ---
+#  build_tile_grid() のたびに +1。ナビ等のキャッシュ無効化の目印に使う
+tile_grid_version = 0
+
+# --- 追跡者プール（map_id -> core.enemies.EnemyPool） ---
+enemy_pools = {}
+
 # 一度開けたドアを記録（セーブ対応もしやすい）
 opened_doors = {}   # key: (map_id, door_id) -> True
 
@@ -149,8 +156,9 @@ def reset_for_new_run() -> None:
         "ceiling": None,
     })
 
-    # 4) ドア開閉情報をリセット
+    # 4) ドア開閉情報・追跡者をリセット
     opened_doors.clear()
+    enemy_pools.clear()
 
     # 5) インベントリは「持ち物の個数」だけを 0 に戻す
     #    キーの種類はそのまま残すことで、後からアイテムが増えても安全。
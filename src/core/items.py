@@ -171,6 +171,23 @@ SPRITE_DB: dict[str, dict] = {
     },
 }
 
+# スプライトの表示サイズ（ロード時にこの大きさへ縮小）
+ITEM_SPRITE_SIZE = (64, 64)
+ALWAYS_SPRITE_SIZE = (96, 96)
+
+# 固定スプライト（アイテムの有無に関わらず常時ロード）：key -> (パス, ラベル)
+ALWAYS_SPRITES = {
+    "guardian": ("assets/textures/forest_guardian.png", "GU"),
+    "fog":      ("assets/textures/forest_fog.png",      "FG"),
+    "trunk":    ("assets/textures/forest_trunk.png",    "TR"),
+}
+
+
+def sprite_path_for(meta: dict) -> str:
+    """SPRITE_DB のエントリから assets/ 起点のパスを作る（ファイル名だけなら assets/sprites/ を補う）"""
+    rel = meta.get("file") or ""
+    return f"assets/sprites/{rel}" if rel and not rel.startswith("assets/") else rel
+
 
 def get_sprite_meta(item_id: str) -> dict:
     """スプライト用メタの安全取得（未登録は無難なデフォルト）"""
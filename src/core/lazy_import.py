@@ -0,0 +1,138 @@
+# core/lazy_import.py
+# -*- coding: utf-8 -*-
+"""
+重い依存（cv2 / cryptography など）やシーンモジュールを“初めて使うときに”読み込む仕組み。
+
+・lazy_module("cv2", _import_cv2) はモジュールの代理オブジェクトを返す。属性に触れた瞬間に本物を import する。
+  （import 文の位置はそのままなので、モジュール先頭の見通しは変わらない）
+  PyInstaller は文字列からの import_module を追えないので、同梱が必要なものは
+  「中で import 文を書いた関数」（loader）を渡す。PyInstaller はこの import 文を見て同梱する。
+・LazyObject(factory) は「最初に属性へ触れたときに factory() で作る」代理。
+  sound_manager の Fernet のように、import 時に作っていたオブジェクト用。
+・warm_up([...]) はタイトル画面を出している間などに、バックグラウンドスレッドで先に import しておく。
+  本当に使う時点で読み込み中なら、Python の import ロックで完了を待つだけ（二重 import はしない）。
+・かかった時間は IMPORT_TIMINGS に記録し、DEV_MODE では [IMPORT] タグで表示する。
+
+使い方:
+    def _import_cv2():
+        import cv2
+        return cv2
+    cv2 = lazy_module("cv2", _import_cv2)
+    warm_up(["cv2", "scenes.ending_event"])
+"""
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+import threading
+import time
+from types import ModuleType
+from typing import Any, Callable, Iterable, Optional
+
+DEV_MODE = os.getenv("DEV_MODE", "0") == "1"
+
+# モジュール名 -> (import にかかった秒数, どのスレッドで読んだか)
+IMPORT_TIMINGS: dict[str, tuple[float, str]] = {}
+
+
+def timed_import(name: str, loader: Optional[Callable[[], ModuleType]] = None) -> ModuleType:
+    """
+    import して所要時間を記録（既に読み込み済みなら何もしない）。
+    loader があればそれで読み込む（import 文を書いた関数。PyInstaller に依存を見せるため）
+    """
+    mod = sys.modules.get(name)
+    if mod is not None:
+        return mod
+    t0 = time.perf_counter()
+    mod = loader() if loader is not None else importlib.import_module(name)
+    dt = time.perf_counter() - t0
+    who = threading.current_thread().name
+    IMPORT_TIMINGS.setdefault(name, (dt, who))
+    if DEV_MODE:
+        print(f"[IMPORT] {name}: {dt * 1000:.1f}ms ({who})")
+    return mod
+
+
+class LazyModule(ModuleType):
+    """属性アクセスで初めて本物を import するモジュール代理"""
+
+    def __init__(self, name: str, loader: Optional[Callable[[], ModuleType]] = None) -> None:
+        super().__init__(name)
+        self.__dict__["_lazy_mod"] = None
+        self.__dict__["_lazy_loader"] = loader
+
+    def _load(self) -> ModuleType:
+        mod = self.__dict__["_lazy_mod"]
+        if mod is None:
+            mod = timed_import(self.__name__, self.__dict__["_lazy_loader"])
+            self.__dict__["_lazy_mod"] = mod
+        return mod
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.__dict__["_lazy_mod"] is not None
+
+
+def lazy_module(name: str, loader: Optional[Callable[[], ModuleType]] = None) -> LazyModule:
+    return LazyModule(name, loader)
+
+
+class LazyObject:
+    """最初に属性へ触れたときに factory() で実体を作る代理（スレッド安全）"""
+
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        self.__dict__["_factory"] = factory
+        self.__dict__["_obj"] = None
+        self.__dict__["_lock"] = threading.Lock()
+
+    def _get(self) -> Any:
+        obj = self.__dict__["_obj"]
+        if obj is None:
+            with self.__dict__["_lock"]:
+                obj = self.__dict__["_obj"]
+                if obj is None:
+                    obj = self.__dict__["_factory"]()
+                    self.__dict__["_obj"] = obj
+        return obj
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._get(), attr)
+
+
+_warm_thread: Optional[threading.Thread] = None
+
+
+def warm_up(names: Iterable[str], *, background: bool = True) -> Optional[threading.Thread]:
+    """names を先に import しておく（失敗しても本番の初回アクセス時に改めて例外になるだけ）"""
+    global _warm_thread
+    names = [n for n in names if n not in sys.modules]
+    if not names:
+        return None
+
+    def _run() -> None:
+        for n in names:
+            try:
+                timed_import(n)
+            except Exception as e:
+                if DEV_MODE:
+                    print(f"[IMPORT][WARN] warm-up failed: {n} ({e})")
+
+    if not background:
+        _run()
+        return None
+    _warm_thread = threading.Thread(target=_run, name="import-warmup", daemon=True)
+    _warm_thread.start()
+    return _warm_thread
+
+
+def import_report() -> str:
+    """DEV 用：遅い順の import 所要時間"""
+    rows = sorted(IMPORT_TIMINGS.items(), key=lambda kv: kv[1][0], reverse=True)
+    return "\n".join(f"  {dt * 1000:8.1f}ms  {name}  ({who})" for name, (dt, who) in rows)
@@ -0,0 +1,122 @@
+# core/line_of_sight.py
+# -*- coding: utf-8 -*-
+"""
+視線（Line of Sight）判定サービス。
+
+・線分が通過するタイルを DDA（Amanatides & Woo 方式）で“境界ごとに”正確にたどり、
+  通行不可タイルに入った時点で遮蔽とみなす。px 間隔のサンプリングと違い、
+  細い角の取りこぼしが無く、判定回数も「通過タイル数」で済む。
+・線分がタイルの角をちょうど通る場合は、隣接する2タイルの両方を調べる
+  （壁と壁の隙間を斜めに“すり抜けて”見えることはない）。
+・結果は (始点タイル, 終点タイル, グリッド版) ごとに 1フレームの間だけキャッシュ。
+  begin_frame() を毎フレーム呼んでキャッシュを捨てる。
+  ※ 同じタイル対の2回目以降は、最初に問い合わせた点どうしの結果を返す近似。
+
+追跡者AI・近接トリガ・今後の敵の知覚処理はこの1インスタンスを共有する想定。
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from core.navigation import walkable_mask
+
+
+class LineOfSight:
+    def __init__(self, tile: int) -> None:
+        self.tile = int(tile)
+        self._cache: dict[tuple, bool] = {}
+        self._walk: np.ndarray | None = None
+        self._walk_key: tuple | None = None
+        # DEV 用の統計
+        self.queries = 0
+        self.hits = 0
+
+    def begin_frame(self) -> None:
+        """フレーム頭で呼ぶ：前フレームの結果を破棄"""
+        self._cache.clear()
+
+    def walkable(self, tile_grid: np.ndarray, version: int) -> np.ndarray:
+        """版ごとにキャッシュした通行可能マスク（他の処理からも再利用してよい）"""
+        key = (int(version), tile_grid.shape)
+        if key != self._walk_key:
+            self._walk = walkable_mask(tile_grid)
+            self._walk_key = key
+            self._cache.clear()
+        return self._walk
+
+    def clear(self, tile_grid: np.ndarray, version: int,
+              x0: float, y0: float, x1: float, y1: float) -> bool:
+        """(x0,y0)→(x1,y1)（px）の間に通行不可タイルが無ければ True"""
+        walk = self.walkable(tile_grid, version)
+        t = self.tile
+        a = (int(math.floor(x0 / t)), int(math.floor(y0 / t)))
+        b = (int(math.floor(x1 / t)), int(math.floor(y1 / t)))
+        key = (a, b, int(version))
+        self.queries += 1
+        hit = self._cache.get(key)
+        if hit is not None:
+            self.hits += 1
+            return hit
+        res = _dda_clear(walk, x0 / t, y0 / t, x1 / t, y1 / t)
+        self._cache[key] = res
+        return res
+
+
+def _dda_clear(walk: np.ndarray, x0: float, y0: float, x1: float, y1: float) -> bool:
+    """タイル単位の座標で DDA。通過する全タイルが通行可なら True（範囲外は壁）"""
+    h, w = walk.shape
+
+    def passable(ix: int, iy: int) -> bool:
+        return 0 <= ix < w and 0 <= iy < h and bool(walk[iy, ix])
+
+    ix, iy = int(math.floor(x0)), int(math.floor(y0))
+    ex, ey = int(math.floor(x1)), int(math.floor(y1))
+    if not passable(ix, iy):
+        return False
+
+    dx, dy = x1 - x0, y1 - y0
+    step_x = 1 if dx > 0 else -1
+    step_y = 1 if dy > 0 else -1
+    # 次の縦/横境界までのパラメータ t（0..1）と、1マス進むごとの増分
+    inf = float("inf")
+    t_delta_x = abs(1.0 / dx) if dx != 0 else inf
+    t_delta_y = abs(1.0 / dy) if dy != 0 else inf
+    if dx > 0:
+        t_max_x = (ix + 1 - x0) * t_delta_x
+    elif dx < 0:
+        t_max_x = (x0 - ix) * t_delta_x
+    else:
+        t_max_x = inf
+    if dy > 0:
+        t_max_y = (iy + 1 - y0) * t_delta_y
+    elif dy < 0:
+        t_max_y = (y0 - iy) * t_delta_y
+    else:
+        t_max_y = inf
+
+    # 終点タイルに着くまでに必要な境界通過回数（無限ループ防止の上限にもなる）
+    remaining = abs(ex - ix) + abs(ey - iy)
+    eps = 1e-9
+    while remaining > 0:
+        if abs(t_max_x - t_max_y) <= eps:
+            # 角をちょうど通過：隣の2タイルも両方通れること
+            if not passable(ix + step_x, iy) or not passable(ix, iy + step_y):
+                return False
+            ix += step_x
+            iy += step_y
+            t_max_x += t_delta_x
+            t_max_y += t_delta_y
+            remaining -= 2
+        elif t_max_x < t_max_y:
+            ix += step_x
+            t_max_x += t_delta_x
+            remaining -= 1
+        else:
+            iy += step_y
+            t_max_y += t_delta_y
+            remaining -= 1
+        if not passable(ix, iy):
+            return False
+    return True
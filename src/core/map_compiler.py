@@ -0,0 +1,314 @@
+# core/map_compiler.py
+# -*- coding: utf-8 -*-
+"""
+マップ定義（core/maps.py の MAPS）のコンパイル済みキャッシュ。
+
+・maps.py は巨大な dict リテラルなので、以前は起動時に
+    - 全マップの layout をコピーして _layout_base に
+    - 全マップの textures を deepcopy して _textures_base に
+    - run_maps_health_check で全レイアウトを走査
+  をしていた。マップ数に比例して起動が重くなる。
+・ここでは1マップずつ CompiledMap（原本レイアウト・NumPy グリッド・正規化済みアイテム/トリガ・
+  テクスチャ参照・診断結果）に変換し、セーブ先の cache/maps/<ハッシュ>/ に保存する。
+  セーブ先はユーザーが書き換えられる場所なので pickle は使わない（読み込みでコードが動きうる）。
+  グリッドは .npz（allow_pickle=False）、それ以外は JSON（タプルは印を付けて復元）。
+  ハッシュは maps.py / tile_types.py / items.py の中身とコンパイラ版から作るので、
+  定義を書き換えれば自動で作り直される。
+・起動時は manifest（マップ一覧と焼き込み済みの警告）を読むだけ。
+  各マップの中身は最初に参照したときに読み込む（レイジー）。
+・原本はキャッシュ（＝未改変の定義）から取るので、実行中に layout が書き換えられていても正しい。
+
+使い方:
+    prepare_map_cache(MAPS)             # 起動時に1回（警告の表示もここ）
+    layout_base(map_id)                 # 原本レイアウト（行リスト）
+    textures_base(map_id)               # 原本 textures（dict）
+    pristine_grid(map_id, layout)       # layout が原本どおりならコンパイル済みグリッドのコピー
+"""
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+
+from core.config import DEV_STRICT_VALIDATION
+
+DEV_MODE = os.getenv("DEV_MODE", "0") == "1"
+
+COMPILER_VERSION = 2
+_SOURCES = ("maps.py", "tile_types.py", "items.py")  # これらが変わったら作り直す
+
+
+@dataclass
+class CompiledMap:
+    map_id: str
+    layout: tuple[str, ...]                      # 原本レイアウト
+    grid: np.ndarray                             # uint8 (H×W)、build_tile_grid と同じ ASCII
+    textures: dict                               # 原本 textures（wall_special / special は必ず dict）
+    items: tuple[dict, ...] = ()                 # normalize_item_entry 済み
+    triggers: tuple[dict, ...] = ()              # pos / target_pos をタプルにそろえたもの
+    warnings: tuple[str, ...] = ()               # collect_map_warnings の結果
+
+    @property
+    def item_types(self) -> tuple[str, ...]:
+        seen = []
+        for it in self.items:
+            if it["type"] not in seen:
+                seen.append(it["type"])
+        return tuple(seen)
+
+
+# ---------------------------------------------------------------------
+# コンパイル
+# ---------------------------------------------------------------------
+def _normalize_trigger(t: dict) -> dict:
+    out = dict(t)
+    for k in ("pos", "target_pos", "pos_tile"):
+        if isinstance(out.get(k), (list, tuple)):
+            out[k] = tuple(out[k])
+    return out
+
+
+def compile_map(map_id: str, m: dict) -> CompiledMap:
+    from core.items import normalize_item_entry
+    from core.maps import collect_map_warnings
+
+    warnings = tuple(collect_map_warnings(map_id, m))   # 非矩形はここで例外
+    layout = tuple(m["layout"])
+    h = len(layout)
+    w = len(layout[0]) if h else 0
+    grid = np.empty((h, w), dtype=np.uint8)
+    for j, row in enumerate(layout):
+        grid[j, :] = np.frombuffer(row.encode("ascii"), dtype=np.uint8)
+
+    tex = copy.deepcopy(m.get("textures") or {})
+    tex.setdefault("wall_special", {})
+    tex.setdefault("special", {})
+
+    return CompiledMap(
+        map_id=map_id,
+        layout=layout,
+        grid=grid,
+        textures=tex,
+        items=tuple(normalize_item_entry(raw) for raw in m.get("items", [])),
+        triggers=tuple(_normalize_trigger(t) for t in m.get("triggers", [])),
+        warnings=warnings,
+    )
+
+
+def source_hash() -> str:
+    h = hashlib.sha1(f"v{COMPILER_VERSION}".encode())
+    here = Path(__file__).resolve().parent
+    for name in _SOURCES:
+        try:
+            h.update((here / name).read_bytes())
+        except OSError:
+            h.update(name.encode())
+    return h.hexdigest()[:16]
+
+
+def _cache_dir(digest: str) -> Optional[Path]:
+    try:
+        from core.save_system import get_save_root_dir
+        d = get_save_root_dir() / "cache" / "maps" / digest
+        d.mkdir(parents=True, exist_ok=True)
+        return d
+    except Exception:
+        return None
+
+
+# ---------------------------------------------------------------------
+# 実行時（レイジー読み込み）
+# ---------------------------------------------------------------------
+_MAPS_REF: Optional[dict] = None
+_DIR: Optional[Path] = None
+_COMPILED: dict[str, CompiledMap] = {}
+# prepare_map_cache 時点（まだ誰も layout を書き換えていない）の原本レイアウト。
+# キャッシュが読めないマップをその場でコンパイルし直すときは、生きている MAPS ではなくこれを使う
+_PRISTINE_LAYOUTS: dict[str, tuple[str, ...]] = {}
+
+
+def _to_json(obj: Any) -> Any:
+    """タプルと「文字列以外のキーを持つ dict」を印付きで JSON に載せる"""
+    if isinstance(obj, tuple):
+        return {"__tuple__": [_to_json(v) for v in obj]}
+    if isinstance(obj, list):
+        return [_to_json(v) for v in obj]
+    if isinstance(obj, dict):
+        if all(isinstance(k, str) for k in obj) and "__tuple__" not in obj and "__items__" not in obj:
+            return {k: _to_json(v) for k, v in obj.items()}
+        return {"__items__": [[_to_json(k), _to_json(v)] for k, v in obj.items()]}
+    if obj is None or isinstance(obj, (str, int, float, bool)):
+        return obj
+    raise TypeError(f"not cacheable: {type(obj).__name__}")
+
+
+def _from_json(obj: Any) -> Any:
+    if isinstance(obj, list):
+        return [_from_json(v) for v in obj]
+    if isinstance(obj, dict):
+        if "__tuple__" in obj:
+            return tuple(_from_json(v) for v in obj["__tuple__"])
+        if "__items__" in obj:
+            return {_from_json(k): _from_json(v) for k, v in obj["__items__"]}
+        return {k: _from_json(v) for k, v in obj.items()}
+    return obj
+
+
+def _write_json(path: Path, obj: Any) -> None:
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(_to_json(obj), f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def _read_json(path: Path) -> Any:
+    with open(path, "r", encoding="utf-8") as f:
+        return _from_json(json.load(f))
+
+
+def _write_map(d: Path, cm: CompiledMap) -> None:
+    tmp = d / f"{cm.map_id}.tmp.npz"
+    np.savez(tmp, grid=cm.grid)
+    os.replace(tmp, d / f"{cm.map_id}.npz")
+    _write_json(d / f"{cm.map_id}.json", {
+        "map_id": cm.map_id,
+        "layout": cm.layout,
+        "textures": cm.textures,
+        "items": cm.items,
+        "triggers": cm.triggers,
+        "warnings": cm.warnings,
+    })
+
+
+def _read_map(d: Path, map_id: str) -> CompiledMap:
+    meta = _read_json(d / f"{map_id}.json")
+    with np.load(d / f"{map_id}.npz", allow_pickle=False) as z:
+        grid = z["grid"]
+    layout = meta["layout"]
+    if meta["map_id"] != map_id or grid.dtype != np.uint8 or grid.shape != (len(layout), len(layout[0]) if layout else 0):
+        raise ValueError(f"cache mismatch: {map_id}")
+    return CompiledMap(
+        map_id=map_id,
+        layout=layout,
+        grid=grid,
+        textures=meta["textures"],
+        items=meta["items"],
+        triggers=meta["triggers"],
+        warnings=meta["warnings"],
+    )
+
+
+def _purge_old_caches(keep: Path) -> None:
+    """定義変更で使われなくなった古いハッシュのキャッシュを消す"""
+    import shutil
+    for d in keep.parent.iterdir():
+        if d.is_dir() and d != keep:
+            shutil.rmtree(d, ignore_errors=True)
+
+
+def prepare_map_cache(maps: dict) -> None:
+    """
+    起動時に1回。キャッシュが新しければ manifest を読むだけ、古ければ全マップをコンパイルして保存。
+    焼き込み済みの警告はここで表示する（run_maps_health_check と同じ出力）。
+    """
+    global _MAPS_REF, _DIR
+    _MAPS_REF = maps
+    for mid, m in maps.items():
+        _PRISTINE_LAYOUTS[mid] = tuple(m["layout"])
+    digest = source_hash()
+    _DIR = _cache_dir(digest)
+
+    manifest = None
+    if _DIR is not None and (_DIR / "manifest.json").exists():
+        try:
+            manifest = _read_json(_DIR / "manifest.json")
+            if set(manifest.get("maps", ())) != set(maps):
+                manifest = None
+        except Exception:
+            manifest = None
+
+    if manifest is None:
+        # コンパイル（初回 or 定義変更時だけ）。まだ誰も layout を書き換えていない起動直後に行う
+        warnings: dict[str, tuple[str, ...]] = {}
+        all_written = _DIR is not None
+        for mid, m in maps.items():
+            cm = compile_map(mid, m)
+            _COMPILED[mid] = cm
+            warnings[mid] = cm.warnings
+            if _DIR is not None:
+                try:
+                    _write_map(_DIR, cm)
+                except Exception as e:
+                    all_written = False
+                    if DEV_MODE:
+                        print(f"[MAPC][WARN] write failed: {mid} ({e})")
+        manifest = {"maps": list(maps), "warnings": warnings}
+        # 1つでも書けなかったら manifest は書かない（次回の起動でキャッシュを信用せず作り直させる）
+        if all_written:
+            try:
+                _write_json(_DIR / "manifest.json", manifest)
+            except Exception:
+                pass
+        if _DIR is not None:
+            _purge_old_caches(_DIR)
+        if DEV_MODE:
+            print(f"[MAPC] compiled {len(maps)} maps -> {_DIR}")
+
+    for mid in maps:
+        for w in manifest["warnings"].get(mid, ()):
+            print("[WARN]", w)
+    if DEV_STRICT_VALIDATION:
+        print("[INFO] MAPS health check complete.")
+
+
+def get_compiled_map(map_id: str) -> CompiledMap:
+    """map_id のコンパイル済みデータ（初回参照時にディスクから読む）"""
+    cm = _COMPILED.get(map_id)
+    if cm is not None:
+        return cm
+    if _DIR is not None:
+        try:
+            cm = _read_map(_DIR, map_id)
+        except Exception:
+            cm = None
+    if cm is None:
+        # キャッシュ無し/壊れている：手元の定義からその場でコンパイル。
+        # MAPS の layout は実行中に書き換わる（扉・霧・ロード）ので、原本は起動時のスナップショットから取る
+        if _MAPS_REF is None:
+            from core.maps import MAPS as maps
+        else:
+            maps = _MAPS_REF
+        m = maps[map_id]
+        pristine = _PRISTINE_LAYOUTS.get(map_id)
+        if pristine is not None:
+            m = {**m, "layout": list(pristine)}
+        cm = compile_map(map_id, m)
+    _COMPILED[map_id] = cm
+    return cm
+
+
+def layout_base(map_id: str) -> list[str]:
+    """原本レイアウト（呼び出し側で書き換えてもよい新しいリスト）"""
+    return list(get_compiled_map(map_id).layout)
+
+
+def textures_base(map_id: str) -> dict:
+    """原本 textures（読み取り専用として扱うこと）"""
+    return get_compiled_map(map_id).textures
+
+
+def pristine_grid(map_id: str, layout: list[str]) -> Optional[np.ndarray]:
+    """layout が原本と同じならコンパイル済みグリッドのコピー、違えば None"""
+    cm = get_compiled_map(map_id)
+    if len(layout) != len(cm.layout):
+        return None
+    for a, b in zip(layout, cm.layout):
+        if a is not b and a != b:
+            return None
+    return cm.grid.copy()
@@ -69,28 +69,34 @@ def _validate_trigger_vs_layout(map_id: str, map_def: dict) -> List[str]:
             msgs.append(f"[{map_id}] trigger {ev} の座標{pos}に '{want}' がありません（実際: '{ch}'）")
     return msgs
 
+def collect_map_warnings(map_id: str, m: Dict[str, Any]) -> List[str]:
+    """
+    1マップ分の診断。致命的（非矩形）＝例外、軽微＝警告文字列のリストを返す。
+    （core.map_compiler がこの結果をキャッシュに焼き込む）
+    """
+    _assert_rectangular(map_id, m)
+    warns = _validate_trigger_vs_layout(map_id, m)
+    spec = ((m.get("textures") or {}).get("special") or {})
+    need = set()
+    if any('w' in row for row in m.get("layout", [])): need.add('w')
+    if any('B' in row for row in m.get("layout", [])): need.add('B')
+    missing = [k for k in need if k not in spec]
+    if missing:
+        warns.append(f"{map_id}: special に {missing} がありません（川/橋の定義抜け）")
+    return warns
+
 def run_maps_health_check(MAPS: Dict[str, Any]) -> None:
     """
     起動時に一括診断。致命的＝例外、軽微＝警告print。
     """
     for mid, m in MAPS.items():
-        _assert_rectangular(mid, m)
-        warns = _validate_trigger_vs_layout(mid, m)
-        for w in warns:
+        for w in collect_map_warnings(mid, m):
             print("[WARN]", w)
         # テクスチャキーの最低限チェック（存在すればOK）
         tex = m.get("textures") or {}
         tex.setdefault("wall_special", {})
         tex.setdefault("special", {})
 
-        spec = (m.get("textures", {}).get("special") or {})
-        need = set()
-        if any('w' in row for row in m.get("layout", [])): need.add('w')
-        if any('B' in row for row in m.get("layout", [])): need.add('B')
-        missing = [k for k in need if k not in spec]
-        if missing:
-            print(f"[WARN] {mid}: special に {missing} がありません（川/橋の定義抜け）")
-
     if DEV_STRICT_VALIDATION:
         print("[INFO] MAPS health check complete.")
 
@@ -310,6 +316,8 @@ MAPS = {
         "ambience": {
             "se_loop": "river_loop"  # ← SoundManager 側のSEキー
         },
+        # このマップに入ったら先読みしておく SE（倒木イベント用）
+        "se_warm": ["tree_chop", "tree_crash"],
         "triggers": [
             {"event": "stair_up",   "pos": (2, 1),  
              "target_map": "forest_3", "target_pos": (3, 11),
@@ -460,6 +468,9 @@ MAPS = {
         },
     },
 
+    # このマップに入ったら先読みしておく SE（スイッチパズル用）
+    "se_warm": ["switch_ok", "switch_ng", "switch_solved"],
+
     # パズル定義（ロジックは従来の“肖像画＋床スイッチ”を流用）
     "puzzle": {
         "id": "lab_switch_order_01",
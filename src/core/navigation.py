@@ -0,0 +1,167 @@
+# core/navigation.py
+# -*- coding: utf-8 -*-
+"""
+追跡者ナビゲーション（フローフィールド方式）。
+
+・プレイヤーのいるタイルを“ゴール”として、NumPy の通行可能グリッド上で
+  幅優先（BFS）の距離マップを1枚だけ作る。
+・各タイルの「次に進むべき隣接タイル」も同時にベクトル演算で求めておくので、
+  追跡者は何体いても 1歩 O(1) で下り坂をたどるだけになる。
+・再計算は「プレイヤーのタイルが変わった」か「グリッドの版(version)が変わった」
+  ときだけ（ドア開放・霧晴れ・マップ移動などで version が上がる）。
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+
+from core.tile_types import TILE_TYPES
+
+# 距離マップで「到達不能」を表す値
+UNREACHABLE = -1
+
+# 4近傍（右・左・下・上）。next_step の方向番号はこの並び
+_NEIGHBORS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+# ASCII コード → 通行可否 の早見表（TILE_TYPES の "walkable" から生成）
+_WALKABLE_LUT = np.zeros(256, dtype=bool)
+for _ch, _info in TILE_TYPES.items():
+    if len(_ch) == 1 and ord(_ch) < 256 and _info.get("walkable"):
+        _WALKABLE_LUT[ord(_ch)] = True
+
+
+def walkable_mask(tile_grid: np.ndarray) -> np.ndarray:
+    """build_tile_grid() の uint8 グリッドから通行可能マスク(bool, H×W)を作る"""
+    return _WALKABLE_LUT[tile_grid]
+
+
+class FlowField:
+    """
+    ゴール（＝プレイヤーのタイル）への BFS 距離マップと“次の一歩”表。
+
+    使い方:
+        ff = FlowField()
+        ff.update(game_state.current_tile_grid, (gx, gy), game_state.tile_grid_version)
+        step = ff.next_step((tx, ty))   # -> (nx, ny) or None
+    """
+
+    def __init__(self) -> None:
+        self._key: Optional[tuple] = None
+        self.goal: Optional[tuple[int, int]] = None
+        self.dist: Optional[np.ndarray] = None     # int32 (H×W)、到達不能は UNREACHABLE
+        self._step_dx: Optional[np.ndarray] = None # int8 (H×W)
+        self._step_dy: Optional[np.ndarray] = None # int8 (H×W)
+        self.rebuilds = 0                          # DEV 用：再計算回数
+
+    # ------------------------------------------------------------
+    # 構築
+    # ------------------------------------------------------------
+    def update(self, tile_grid: np.ndarray, goal_tile: tuple[int, int], version: int) -> bool:
+        """
+        必要なときだけ距離マップを作り直す。
+        戻り値: 作り直したら True（キャッシュ再利用なら False）
+        """
+        gx, gy = int(goal_tile[0]), int(goal_tile[1])
+        key = (int(version), gx, gy, tile_grid.shape)
+        if key == self._key:
+            return False
+        self._key = key
+        self.goal = (gx, gy)
+        self._rebuild(walkable_mask(tile_grid), gx, gy)
+        self.rebuilds += 1
+        return True
+
+    def invalidate(self) -> None:
+        """次回の update() で必ず再計算させる"""
+        self._key = None
+
+    def _rebuild(self, walk: np.ndarray, gx: int, gy: int) -> None:
+        h, w = walk.shape
+        dist = np.full((h, w), UNREACHABLE, dtype=np.int32)
+        self.dist = dist
+        self._step_dx = np.zeros((h, w), dtype=np.int8)
+        self._step_dy = np.zeros((h, w), dtype=np.int8)
+        if not (0 <= gx < w and 0 <= gy < h):
+            return
+
+        # --- BFS を“波面の膨張”として NumPy で一括処理 ---
+        #   frontier を上下左右に1マスずつ広げ、未訪問かつ通行可のマスに距離を書き込む
+        visited = np.zeros((h, w), dtype=bool)
+        frontier = np.zeros((h, w), dtype=bool)
+        frontier[gy, gx] = True   # ゴールは（万一壁でも）起点として扱う
+        visited[gy, gx] = True
+        dist[gy, gx] = 0
+        d = 0
+        while frontier.any():
+            d += 1
+            grown = np.zeros_like(frontier)
+            grown[:, 1:] |= frontier[:, :-1]
+            grown[:, :-1] |= frontier[:, 1:]
+            grown[1:, :] |= frontier[:-1, :]
+            grown[:-1, :] |= frontier[1:, :]
+            frontier = grown & walk & ~visited
+            visited |= frontier
+            dist[frontier] = d
+
+        # --- 各マスの“次の一歩”を事前計算（距離が最小の隣接マスを選ぶ） ---
+        big = np.iinfo(np.int32).max
+        padded = np.full((h + 2, w + 2), big, dtype=np.int32)
+        padded[1:-1, 1:-1] = np.where(dist >= 0, dist, big)
+        cand = np.stack([
+            padded[1 + dy:h + 1 + dy, 1 + dx:w + 1 + dx] for dx, dy in _NEIGHBORS
+        ])                                   # (4, H, W)
+        best = cand.argmin(axis=0)
+        best_d = np.take_along_axis(cand, best[None], axis=0)[0]
+        # 自分より近い隣が無い（ゴール/到達不能）マスは (0,0) のまま
+        downhill = (dist > 0) & (best_d < dist)
+        ndx = np.array([n[0] for n in _NEIGHBORS], dtype=np.int8)
+        ndy = np.array([n[1] for n in _NEIGHBORS], dtype=np.int8)
+        self._step_dx[downhill] = ndx[best[downhill]]
+        self._step_dy[downhill] = ndy[best[downhill]]
+
+    # ------------------------------------------------------------
+    # 参照（O(1)）
+    # ------------------------------------------------------------
+    def distance(self, tile: tuple[int, int]) -> int:
+        """ゴールまでのタイル歩数（到達不能/範囲外は UNREACHABLE）"""
+        if self.dist is None:
+            return UNREACHABLE
+        tx, ty = int(tile[0]), int(tile[1])
+        h, w = self.dist.shape
+        if not (0 <= tx < w and 0 <= ty < h):
+            return UNREACHABLE
+        return int(self.dist[ty, tx])
+
+    def next_step(self, tile: tuple[int, int]) -> Optional[tuple[int, int]]:
+        """tile からゴールへ1歩進んだ隣接タイル。ゴール上/到達不能なら None"""
+        if self.dist is None:
+            return None
+        tx, ty = int(tile[0]), int(tile[1])
+        h, w = self.dist.shape
+        if not (0 <= tx < w and 0 <= ty < h):
+            return None
+        sdx = int(self._step_dx[ty, tx])
+        sdy = int(self._step_dy[ty, tx])
+        if sdx == 0 and sdy == 0:
+            return None
+        return (tx + sdx, ty + sdy)
+
+    def next_steps(self, tiles_x: np.ndarray, tiles_y: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        複数体ぶんの“次の一歩”をまとめて引く（配列版）。
+        戻り値: (nx, ny, valid)  valid=False の要素は進む先なし
+        """
+        tiles_x = np.asarray(tiles_x, dtype=np.int64)
+        tiles_y = np.asarray(tiles_y, dtype=np.int64)
+        if self.dist is None:
+            z = np.zeros_like(tiles_x)
+            return z, z.copy(), np.zeros(tiles_x.shape, dtype=bool)
+        h, w = self.dist.shape
+        inb = (tiles_x >= 0) & (tiles_x < w) & (tiles_y >= 0) & (tiles_y < h)
+        cx = np.clip(tiles_x, 0, w - 1)
+        cy = np.clip(tiles_y, 0, h - 1)
+        sdx = self._step_dx[cy, cx].astype(np.int64)
+        sdy = self._step_dy[cy, cx].astype(np.int64)
+        valid = inb & ((sdx != 0) | (sdy != 0))
+        return tiles_x + sdx, tiles_y + sdy, valid
@@ -0,0 +1,237 @@
+# core/pcm_cache.py
+# -*- coding: utf-8 -*-
+"""
+デコード済み PCM のディスクキャッシュ（SE / ボイス / ムービー音声）。
+
+・復号のあとも、pygame.mixer.Sound を作るたびに SDL_mixer が MP3 をデコードしている。
+  ここでは一度デコードした PCM（Sound.get_raw()）をセーブ先の cache/pcm/ に保存し、
+  次回以降の起動では Sound(buffer=...) で直接作る（MP3 デコードを丸ごと省く）。
+・保存時は core.stream_crypto のコンテナで暗号化する（平文の音声をディスクに置かない）。
+・キーは「元ファイルの中身の sha1 + ミキサー形式（周波数・ビット・ch）」。
+  素材を差し替えても、mixer の設定を変えても、別エントリになるだけで古い PCM は使われない。
+・合計サイズが PCM_CACHE_MAX_BYTES を超えたら、最近使われていないものから消す。
+・PCM_CACHE=0 で無効（従来どおり毎回デコード）。
+
+掃除:
+    python -m core.pcm_cache --info     # 件数とサイズ
+    python -m core.pcm_cache --purge    # すべて削除
+"""
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+import pygame
+
+DEV_MODE = os.getenv("DEV_MODE", "0") == "1"
+ENABLED = os.getenv("PCM_CACHE", "1") != "0"
+
+PCM_CACHE_MAX_BYTES = 256 * 1024 * 1024   # ディスク上の上限
+PCM_CACHE_VERSION = 1
+_SUFFIX = ".pcm"
+
+
+def _cache_dir(game_root: Optional[Path] = None) -> Optional[Path]:
+    """セーブと同じ場所の cache/pcm（map_compiler の cache/maps と並べる）"""
+    try:
+        from core.save_system import get_save_root_dir
+        d = get_save_root_dir(game_root) / "cache" / "pcm"
+        d.mkdir(parents=True, exist_ok=True)
+        return d
+    except Exception:
+        return None
+
+
+class PcmCache:
+    def __init__(self, max_bytes: int = PCM_CACHE_MAX_BYTES) -> None:
+        self.max_bytes = int(max_bytes)
+        self._dir: Optional[Path] = None
+        self._dir_tried = False
+        self._total: Optional[int] = None   # ディスク上の合計（初回に1回だけ数える）
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "purged": 0}
+
+    # ------------------------------------------------------------
+    # 内部
+    # ------------------------------------------------------------
+    def _root(self) -> Optional[Path]:
+        if not self._dir_tried:
+            self._dir_tried = True
+            self._dir = _cache_dir()
+        return self._dir
+
+    @staticmethod
+    def _digest(source: bytes, fmt) -> str:
+        h = hashlib.sha1(f"v{PCM_CACHE_VERSION}:{fmt}".encode())
+        h.update(source)
+        return h.hexdigest()
+
+    def _entries(self) -> list[Path]:
+        root = self._root()
+        return list(root.glob(f"*{_SUFFIX}")) if root is not None else []
+
+    def _trim_locked(self) -> None:
+        """上限を超えていたら、最終使用（mtime）が古い順に消す"""
+        if self._total is None:
+            self._total = sum(p.stat().st_size for p in self._entries())
+        if self._total <= self.max_bytes:
+            return
+        files = sorted(self._entries(), key=lambda p: p.stat().st_mtime)
+        for p in files:
+            if self._total <= self.max_bytes:
+                break
+            try:
+                size = p.stat().st_size
+                p.unlink()
+                self._total -= size
+                self.stats["purged"] += 1
+            except OSError:
+                pass
+
+    def _read(self, digest: str) -> Optional[bytes]:
+        root = self._root()
+        if root is None:
+            return None
+        p = root / f"{digest}{_SUFFIX}"
+        try:
+            blob = p.read_bytes()
+        except OSError:
+            return None
+        from core.sound_manager import stream_key
+        from core.stream_crypto import decrypt_container
+        try:
+            pcm = decrypt_container(blob, stream_key())
+        except Exception:
+            # 壊れている/鍵が変わった：消して作り直させる
+            try:
+                p.unlink()
+            except OSError:
+                pass
+            return None
+        try:
+            os.utime(p)   # LRU 用に“最後に使った時刻”を更新
+        except OSError:
+            pass
+        return pcm
+
+    def _write(self, digest: str, pcm: bytes) -> None:
+        root = self._root()
+        if root is None:
+            return
+        from core.sound_manager import stream_key
+        from core.stream_crypto import encrypt_stream
+        blob = encrypt_stream(pcm, stream_key(), chunk_size=1 << 20)
+        p = root / f"{digest}{_SUFFIX}"
+        tmp = p.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            tmp.write_bytes(blob)
+            os.replace(tmp, p)
+        except OSError as e:
+            if DEV_MODE:
+                print(f"[PCM][WARN] write failed: {e}")
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return
+        with self._lock:
+            if self._total is not None:
+                self._total += len(blob)
+            self.stats["writes"] += 1
+            self._trim_locked()
+
+    # ------------------------------------------------------------
+    # 本体
+    # ------------------------------------------------------------
+    def load_sound(self, path, encrypted: Optional[bool] = None) -> pygame.mixer.Sound:
+        """
+        path（.mp3 / .wav / .mp3.enc）から Sound を作る。
+        キャッシュにあれば PCM から直接、無ければ従来どおり復号＋デコードして PCM を保存。
+        失敗時は例外をそのまま投げる（呼び出し側の従来のエラー処理に任せる）。
+        """
+        path = Path(path)
+        is_enc = encrypted if encrypted is not None else path.name.endswith(".enc")
+        if not ENABLED or self._root() is None:
+            return self._decode(path, is_enc, None)
+
+        fmt = pygame.mixer.get_init()
+        source = path.read_bytes()
+        digest = self._digest(source, fmt)
+        pcm = self._read(digest)
+        if pcm is not None:
+            with self._lock:
+                self.stats["hits"] += 1
+            return pygame.mixer.Sound(buffer=pcm)
+
+        with self._lock:
+            self.stats["misses"] += 1
+        snd = self._decode(path, is_enc, source)
+        try:
+            self._write(digest, snd.get_raw())
+        except Exception as e:
+            if DEV_MODE:
+                print(f"[PCM][WARN] cache failed: {path.name} ({e})")
+        return snd
+
+    @staticmethod
+    def _decode(path: Path, is_enc: bool, source: Optional[bytes]) -> pygame.mixer.Sound:
+        if is_enc:
+            from core.sound_manager import decrypt_audio
+            if source is None:
+                source = path.read_bytes()
+            return pygame.mixer.Sound(io.BytesIO(decrypt_audio(source)))
+        return pygame.mixer.Sound(str(path))
+
+    # ------------------------------------------------------------
+    # 管理
+    # ------------------------------------------------------------
+    def purge(self) -> int:
+        """キャッシュを全部消す。消した件数を返す"""
+        n = 0
+        with self._lock:
+            for p in self._entries():
+                try:
+                    p.unlink()
+                    n += 1
+                except OSError:
+                    pass
+            self._total = 0
+        return n
+
+    def info(self) -> dict:
+        files = self._entries()
+        return {
+            "dir": str(self._root()),
+            "entries": len(files),
+            "bytes": sum(p.stat().st_size for p in files),
+            "max_bytes": self.max_bytes,
+            **self.stats,
+        }
+
+
+# プロセス共通のインスタンス
+PCM_CACHE = PcmCache()
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="デコード済み PCM キャッシュの管理")
+    parser.add_argument("--purge", action="store_true", help="キャッシュをすべて削除")
+    parser.add_argument("--info", action="store_true", help="件数とサイズを表示")
+    args = parser.parse_args()
+    # python -m で起動すると argv[0] が core/ になるので、ゲーム本体（main.py）の場所を基準に
+    # ゲームと同じ解決（書き込めなければホーム配下のフォールバック）をさせる
+    if not getattr(sys, "frozen", False):
+        PCM_CACHE._dir = _cache_dir(Path(__file__).resolve().parent.parent)
+        PCM_CACHE._dir_tried = True
+    if args.purge:
+        print(f"[PCM] purged {PCM_CACHE.purge()} files")
+    info = PCM_CACHE.info()
+    print(f"[PCM] {info['dir']}: {info['entries']} files, "
+          f"{info['bytes'] / (1024 * 1024):.1f}/{info['max_bytes'] / (1024 * 1024):.0f}MB")
@@ -10,6 +10,12 @@ import pygame
 
 
 IsWallFn = Callable[[float, float], bool]
+# (x, y, dx, dy) -> 壁で補正した (new_x, new_y)。core.collision.move_circle を包んだもの
+CollideFn = Callable[[float, float, float, float], Tuple[float, float]]
+
+# player_speed / rot_per_tick は「60fps の1フレーム当たり」の量として定義されている。
+# dt（秒）を渡された場合は BASE_FPS 倍して「1秒当たり」に換算する。
+BASE_FPS = 60.0
 
 def handle_movement(
     *,
@@ -17,12 +23,16 @@ def handle_movement(
     state,                       # game_state モジュール（player_x / player_y / player_angle / player_speed を持つ）
     is_wall: IsWallFn,          # 壁判定コールバック（main.py から渡す）
     tile_size: int,              # TILE（タイルのピクセルサイズ）
+    dt: Optional[float] = None,  # 経過秒（固定ステップ）。None なら従来どおり1フレーム分
+    collide: Optional[CollideFn] = None,  # スイープ衝突解決（指定時は is_wall より優先）
 ) -> tuple[bool, Optional[Tuple[int, int]]]:
     """
     プレイヤーを移動させ、タイル座標を返す。
     - state: game_state モジュール（player_x / player_y / player_angle / player_speed を持つ）
     - keys: pygame.key.get_pressed() の結果
     - is_wall: (x, y) が壁かどうかを判定するコールバック
+    - dt: 指定時は player_speed * BASE_FPS * dt だけ進む（フレームレート非依存）
+    - collide: 指定時は1回の呼び出しで壁沿いスライドまで解決（高速移動でも壁を貫通しない）
     """
     # ★ カットシーン中/イベント抑止中は移動も足音も発火させない
     #   - ムービー再生:  game_state.is_cutscene = True（cinematics.py）
@@ -32,17 +42,28 @@ def handle_movement(
 
     move_x = 0.0
     move_y = 0.0
+    speed = state.player_speed if dt is None else state.player_speed * BASE_FPS * dt
 
     # ↑↓キーで前後移動
     if keys[pygame.K_UP]: # 前進
-        move_x += state.player_speed * math.cos(state.player_angle)
-        move_y += state.player_speed * math.sin(state.player_angle)
+        move_x += speed * math.cos(state.player_angle)
+        move_y += speed * math.sin(state.player_angle)
     if keys[pygame.K_DOWN]: # 後退
-        move_x -= state.player_speed * math.cos(state.player_angle)
-        move_y -= state.player_speed * math.sin(state.player_angle)
+        move_x -= speed * math.cos(state.player_angle)
+        move_y -= speed * math.sin(state.player_angle)
 
     moved = False
 
+    if collide is not None:
+        if abs(move_x) > 1e-6 or abs(move_y) > 1e-6:
+            nx, ny = collide(state.player_x, state.player_y, move_x, move_y)
+            if abs(nx - state.player_x) > 1e-6 or abs(ny - state.player_y) > 1e-6:
+                state.player_x, state.player_y = nx, ny
+                moved = True
+        if not moved:
+            return False, None
+        return True, (int(state.player_x // tile_size), int(state.player_y // tile_size))
+
     # --- X軸移動（“実際に位置が変わったら” moved=True）---
     # 0移動でも is_wall は False になり得るため、差分があるかを必ず確認する
     next_x = state.player_x + move_x
@@ -76,14 +97,18 @@ def handle_rotation(
     rot_per_tick: float = 0.04,
     key_left: int = pygame.K_LEFT,
     key_right: int = pygame.K_RIGHT,
+    dt: Optional[float] = None,  # 経過秒（固定ステップ）。None なら従来どおり1フレーム分
 ) -> bool:
     """
     ←→キーで視点回転を処理する。
     - 回転が発生したら True を返す
     - 角度は [0, 2π) に正規化する
     - キーカスタマイズ可能（将来パッド/マウス対応に拡張しやすいらしい？）
+    - dt 指定時は rot_per_tick * BASE_FPS * dt だけ回る
     """
     rotated = False
+    if dt is not None:
+        rot_per_tick = rot_per_tick * BASE_FPS * dt
 
     # --- 左右回転 ---------------------------------------------------------
     if keys[key_left]:
@@ -0,0 +1,170 @@
+# core/proximity.py
+# -*- coding: utf-8 -*-
+"""
+近接トリガ（maps.py の proximity_triggers）のコンパイル済みテーブル（マップごと）。
+
+・トップレベルと chaser ブロック配下の proximity_triggers をマップロード時に1度だけマージし、
+  symbol_any / pos_tile / pos / radius_* を解釈済みの CompiledTrigger に変換する。
+  半径は二乗（r2）、一度化キー（fired_key）も事前に作っておく。
+・位置型（pos_tile / pos）は、判定円の外接矩形が触れる全タイルに登録（タイル単位のバケット）。
+  → プレイヤーのいるタイルのバケットだけ見れば、円の内側にいる可能性のあるトリガを漏れなく拾える。
+・記号型（symbol_any）は位置が固定でないので常に候補に入れ、判定は記号インデックス側の空間ハッシュに任せる。
+・候補は定義順（index 昇順）で返すので、発火順は従来のマージ済みリストと同じ。
+
+使い方:
+    table = get_trigger_table(map_id, TILE)
+    for ct in table.candidates(px, py):
+        ...
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from core.maps import MAPS
+
+DEFAULT_SYMBOL_RADIUS_PX = 96.0  # symbol_any の既定半径
+DEFAULT_RADIUS_TILE = 1.0        # pos_tile / pos の既定半径（タイル数）
+
+
+@dataclass(frozen=True)
+class CompiledTrigger:
+    index: int                                   # マージ後の定義順
+    kind: str                                    # "video" / "chaser_spawn" など
+    trig_id: str
+    fired_key: str                               # f"{map_id}:{kind}:{id}"
+    symbols: tuple[str, ...] = ()                # symbol_any（空なら記号判定なし）
+    symbol_radius_px: float = DEFAULT_SYMBOL_RADIUS_PX
+    tile: Optional[tuple[int, int]] = None       # pos_tile または pos（require_los の中心にも使う）
+    alt_tile: Optional[tuple[int, int]] = None   # pos_tile と pos の両方がある場合の pos 側
+    cx: float = 0.0                              # tile の中心（px）
+    cy: float = 0.0
+    radius_px: float = 0.0
+    r2: float = 0.0
+    require_los: bool = False
+    raw: dict = field(default_factory=dict, compare=False, repr=False)
+
+    def near(self, px: float, py: float, tile_px: int, near_symbol) -> bool:
+        """近接判定（symbol_any → pos_tile → pos の順、いずれかで成立）"""
+        if self.symbols and near_symbol(self.symbols, self.symbol_radius_px):
+            return True
+        for t in (self.tile, self.alt_tile):
+            if t is None:
+                continue
+            dx = px - (t[0] * tile_px + tile_px * 0.5)
+            dy = py - (t[1] * tile_px + tile_px * 0.5)
+            if dx * dx + dy * dy <= self.r2:
+                return True
+        return False
+
+
+def _merged_trigger_defs(m: dict) -> list[dict]:
+    trigs = list(m.get("proximity_triggers") or [])
+    trigs += list((m.get("chaser") or {}).get("proximity_triggers") or [])
+    return trigs
+
+
+def compile_trigger(map_id: str, index: int, t: dict[str, Any], tile_px: int) -> CompiledTrigger:
+    kind = t.get("kind", "video")
+    trig_id = t.get("id", "?")
+    sym = t.get("symbol_any")
+    r_pos = float(t.get("radius_px", t.get("radius_tile", DEFAULT_RADIUS_TILE) * tile_px))
+
+    pos_tile = t.get("pos_tile", (0, 0)) if "pos_tile" in t else None
+    pos = t.get("pos", (0, 0)) if "pos" in t else None
+    main = pos_tile if pos_tile is not None else pos
+    alt = pos if (pos_tile is not None and pos is not None) else None
+    cx = cy = 0.0
+    if main is not None:
+        main = (int(main[0]), int(main[1]))
+        cx = main[0] * tile_px + tile_px * 0.5
+        cy = main[1] * tile_px + tile_px * 0.5
+    if alt is not None:
+        alt = (int(alt[0]), int(alt[1]))
+
+    return CompiledTrigger(
+        index=index,
+        kind=kind,
+        trig_id=trig_id,
+        fired_key=f"{map_id}:{kind}:{trig_id}",
+        symbols=tuple(sym) if sym else (),
+        symbol_radius_px=float(t.get("radius_px", DEFAULT_SYMBOL_RADIUS_PX)),
+        tile=main,
+        alt_tile=alt,
+        cx=cx,
+        cy=cy,
+        radius_px=r_pos,
+        r2=r_pos * r_pos,
+        require_los=bool(t.get("require_los")) and main is not None,
+        raw=t,
+    )
+
+
+class ProximityTriggerTable:
+    def __init__(self, map_id: str, defs: list[dict], tile_px: int) -> None:
+        self.map_id = map_id
+        self.tile = int(tile_px)
+        self.triggers: list[CompiledTrigger] = [
+            compile_trigger(map_id, i, t, self.tile) for i, t in enumerate(defs)
+        ]
+        self._always: list[CompiledTrigger] = []                     # 記号型（常に候補）
+        self._buckets: dict[tuple[int, int], list[CompiledTrigger]] = {}
+        for ct in self.triggers:
+            if ct.symbols:
+                self._always.append(ct)
+                continue
+            for t in (ct.tile, ct.alt_tile):
+                if t is not None:
+                    self._register(ct, t)
+        self.lookups = 0      # DEV 用
+        self.candidates_seen = 0
+
+    def _register(self, ct: CompiledTrigger, t: tuple[int, int]) -> None:
+        ts = self.tile
+        cx = t[0] * ts + ts * 0.5
+        cy = t[1] * ts + ts * 0.5
+        r = ct.radius_px
+        for ty in range(int(math.floor((cy - r) / ts)), int(math.floor((cy + r) / ts)) + 1):
+            for tx in range(int(math.floor((cx - r) / ts)), int(math.floor((cx + r) / ts)) + 1):
+                lst = self._buckets.setdefault((tx, ty), [])
+                if ct not in lst:
+                    lst.append(ct)
+
+    def __len__(self) -> int:
+        return len(self.triggers)
+
+    def candidates(self, px: float, py: float) -> list[CompiledTrigger]:
+        """(px, py) で成立しうるトリガ（定義順）。最終判定は CompiledTrigger.near() で"""
+        key = (int(math.floor(px / self.tile)), int(math.floor(py / self.tile)))
+        bucket = self._buckets.get(key, ())
+        self.lookups += 1
+        if not self._always:
+            out = list(bucket)
+        elif not bucket:
+            out = list(self._always)
+        else:
+            out = sorted(set(self._always).union(bucket), key=lambda c: c.index)
+        self.candidates_seen += len(out)
+        return out
+
+
+# ---------------------------------------------------------------------
+# マップごとのレジストリ
+# ---------------------------------------------------------------------
+_TABLES: dict[str, tuple[tuple, ProximityTriggerTable]] = {}
+
+
+def get_trigger_table(map_id: str, tile_px: int) -> ProximityTriggerTable:
+    """map_id のコンパイル済みテーブル（定義リストが差し替えられていたら作り直す）"""
+    m = MAPS[map_id]
+    # 定義リストそのものの同一性と長さで“変わっていないか”を安く確認
+    top = m.get("proximity_triggers")
+    sub = (m.get("chaser") or {}).get("proximity_triggers")
+    sig = (id(top), len(top or ()), id(sub), len(sub or ()), int(tile_px))
+    hit = _TABLES.get(map_id)
+    if hit is not None and hit[0] == sig:
+        return hit[1]
+    table = ProximityTriggerTable(map_id, _merged_trigger_defs(m), tile_px)
+    _TABLES[map_id] = (sig, table)
+    return table
@@ -55,9 +55,12 @@ def is_frozen_build() -> bool:
     """PyInstaller 実行形態か？"""
     return getattr(sys, "frozen", False)
 
-def _primary_save_dir() -> Path:
+def _primary_save_dir(game_root: Optional[Path] = None) -> Path:
     """【最優先】保存先＝スクリプト/実行ファイルと同じディレクトリ。"""
-    if is_frozen_build():
+    if game_root is not None:
+        # python -m などで argv[0] が main.py 以外になる呼び出し元（キャッシュ管理 CLI など）用
+        base = Path(game_root).resolve()
+    elif is_frozen_build():
         base = Path(sys.executable).resolve().parent
     else:
         base = Path(sys.argv[0]).resolve().parent
@@ -67,8 +70,12 @@ def _fallback_save_dir() -> Path:
     """書込不可時のフォールバック（ユーザホーム配下）。"""
     return Path.home() / f"{GAME_NAME}_fallback_saves"
 
-def get_save_root_dir() -> Path:
-    primary = _primary_save_dir()
+def get_save_root_dir(game_root: Optional[Path] = None) -> Path:
+    """
+    セーブ・キャッシュの置き場所。書き込めなければホーム配下のフォールバック。
+    game_root: ゲーム本体（main.py）のあるディレクトリ。省略時は実行中のスクリプト/exe の場所
+    """
+    primary = _primary_save_dir(game_root)
     try:
         primary.mkdir(parents=True, exist_ok=True)
     except Exception:
@@ -314,13 +321,14 @@ _LAYOUT_BASELINES: Dict[str, List[str]] = {}     # map_id -> layout 原本行配
 _SPECIAL_BASELINES: Dict[str, Dict[str, dict]] = {}  # map_id -> special 原本（dictのみ）
 
 def _ensure_layout_baseline(map_id: str) -> None:
-    """MAPS[map_id]['_layout_base'] があれば優先、無ければ現行 layout を原本として保存（毎回上書き）。"""
+    """コンパイル済みの原本レイアウトがあれば優先、無ければ現行 layout を原本として保存（毎回上書き）。"""
     try:
         from core.maps import MAPS
+        from core.map_compiler import layout_base
         if not map_id or map_id not in MAPS:
             return
         mp = MAPS[map_id]
-        base_rows = mp.get("_layout_base") or mp.get("layout") or []
+        base_rows = layout_base(map_id) or mp.get("layout") or []
         _LAYOUT_BASELINES[map_id] = [row[:] for row in base_rows]
     except Exception:
         pass
@@ -514,16 +522,17 @@ def _apply_fog_from_flags(map_id: str) -> None:
 # 推定で fog フラグを補完
 def _infer_and_fix_fog_flag_for_current_map() -> None:
     """
-    現行レイアウトと原本(_layout_base)の差から、fog_cleared の抜け落ちを補完する。
+    現行レイアウトと原本（コンパイル済みの原本レイアウト）の差から、fog_cleared の抜け落ちを補完する。
     - 原本に 'F'/'f' があり、現行には無い → fog_cleared に現在マップIDを追加
     """
     try:
         from core.maps import MAPS
+        from core.map_compiler import layout_base
         mid = getattr(gs, "current_map_id", "")
         if not mid or mid not in MAPS:
             return
         mp = MAPS[mid]
-        base_rows = mp.get("_layout_base") or mp.get("layout") or []
+        base_rows = layout_base(mid) or mp.get("layout") or []
         cur_rows  = mp.get("layout") or []
 
         base_has_fog = any(('F' in r) or ('f' in r) for r in base_rows)
@@ -2,9 +2,91 @@
 
 import pygame
 from pathlib import Path
+import atexit
 import json
-from cryptography.fernet import Fernet
 import io
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from core.audio_cache import AUDIO_CACHE
+from core.channel_pool import CHANNEL_GROUPS, ChannelPool
+from core.lazy_import import LazyObject, timed_import
+from core.pcm_cache import PCM_CACHE
+from core.startup_trace import span, traced
+from core.stream_crypto import decrypt_container, derive_stream_key, is_stream_container, open_stream
+
+DEV_MODE = os.getenv("DEV_MODE", "0") == "1"
+
+# SE を並列に読み込むスレッド数（復号も MP3 デコードも大半は GIL の外で走る）
+SE_LOAD_WORKERS = min(8, os.cpu_count() or 4)
+
+# 効果音(SE)の一覧：キー -> ファイル名（se フォルダ内。.mp3.enc があればそちらを優先）
+SE_FILES = {
+    "cursor": "決定ボタンを押す13.mp3",      # カーソル移動
+    "select": "決定ボタンを押す16.mp3",      # 決定・選択
+    "cancel": "警告音2.mp3",         # キャンセル
+    # map
+    # --- ★足音（環境別）★ ---
+    "step_forest": "砂利の上を歩く.mp3", # 森
+    "step_lab":    "革靴で歩く.mp3",    # 研究所
+    "step_tunnel": "アスファルトの上を歩く1.mp3", # 地下道
+    # ------------------------
+    "get_item":"決定ボタンを押す38.mp3", # アイテム取得
+    "kazamidori_y":"キャンセル9.mp3",
+    "kazamidori_n":"キャンセル1.mp3",
+    # menu
+    "menu_open":"メニューを開く2.mp3",
+    "menu_close":"メニューを開く3.mp3",
+    # セーブ/ロード 成功専用SE
+    "save_ok": "メニューを開く4.mp3",
+    "load_ok": "メニューを開く5.mp3",
+    # intro_event
+    "growl_hint":"ゴブリンの鳴き声3.mp3",
+
+    # 霧シーン
+    "fog_intro": "魔法陣を展開.mp3",
+    # 河原シーン
+    "tree_crash": "木が倒れる.mp3",  
+    "river_loop": "河原.mp3",
+    "tree_chop": "打撃5.mp3",
+    # ドア
+    "door_unlock": "鉄の扉を開ける.mp3",
+    # スイッチ系
+    "switch_ok":      "決定ボタンを押す52.mp3", # 正解
+    "switch_ng":      "ビープ音4.mp3",          # 誤答
+    "switch_solved":  "巨大シャッターが開く.mp3",  # 全問正解で封鎖が外れる
+}
+
+# 起動時に読んでおく SE（メニュー/UI 系。どのマップでも使う）。それ以外は初回使用時かマップ入場時に読む
+SE_STARTUP_KEYS = (
+    "cursor", "select", "cancel",
+    "menu_open", "menu_close", "save_ok", "load_ok",
+    "get_item",
+)
+
+# UI 用チャンネルで鳴らす SE（それ以外は "world" グループ）
+SE_UI_KEYS = frozenset({
+    "cursor", "select", "cancel",
+    "menu_open", "menu_close", "save_ok", "load_ok",
+})
+
+# 単発 SE の優先度（省略時はグループの既定値）。チャンネルが埋まっているとき、これ以下の音から譲らせる
+SE_PRIORITY = {
+    "switch_solved": 90,   # 封鎖解除
+    "tree_crash": 80,
+    "door_unlock": 70,
+    "get_item": 70,
+    "switch_ng": 60,
+    "switch_ok": 60,
+}
+
+# 名前付きループのチャンネルグループ（ここに無い名前は "loop"）
+LOOP_CHANNEL_GROUPS = {
+    "ambience": "ambience",
+    "footstep": "loop",
+}
 
 # ==========================================
 # サウンド管理クラス
@@ -12,7 +94,41 @@ import io
 
 # --- Fernet暗号化キー（secret.keyの中身を貼り付けてください） ---
 FERNET_KEY = b"kokoga_secret_key_dayo"
-fernet = Fernet(FERNET_KEY)
+
+def _make_fernet():
+    # cryptography の import と鍵の検証は、最初に復号するときまで遅らせる
+    # （import 文は PyInstaller に依存を見せるためにここへ書いておく）
+    def _load():
+        import cryptography.fernet
+        return cryptography.fernet
+    return timed_import("cryptography.fernet", _load).Fernet(FERNET_KEY)
+
+fernet = LazyObject(_make_fernet)
+
+_STREAM_KEY: bytes | None = None
+
+def stream_key() -> bytes:
+    """チャンク暗号コンテナ（core.stream_crypto）用の鍵。FERNET_KEY から導出"""
+    global _STREAM_KEY
+    if _STREAM_KEY is None:
+        _STREAM_KEY = derive_stream_key(FERNET_KEY)
+    return _STREAM_KEY
+
+def decrypt_audio(data: bytes) -> bytes:
+    """.enc の中身を復号（新しいチャンク形式・従来の Fernet 形式の両方に対応）"""
+    if is_stream_container(data):
+        return decrypt_container(data, stream_key())
+    return fernet.decrypt(data)
+
+def _se_usage_path():
+    """SE 使用実績の保存先：セーブと同じ場所の cache/（map_compiler / pcm_cache のキャッシュと並べる）"""
+    try:
+        from core.save_system import get_save_root_dir
+        d = get_save_root_dir() / "cache"
+        d.mkdir(parents=True, exist_ok=True)
+        return d / "se_usage.json"
+    except Exception:
+        return None
 
 class SoundManager:
     
@@ -34,22 +150,36 @@ class SoundManager:
         self.se_path = base_path / "se"
         self.voice_path = base_path / "voice"
         self.settings_path = base_path.parent / "sound_settings.json"  # 設定ファイルの保存先 
+        self.se_usage_path = _se_usage_path()                           # マップごとの SE 使用実績（実行時データ）
 
         # サウンドチャンネル
-        self.voice_channel = pygame.mixer.Channel(3)  # 独立したボイスチャンネルを確保
+        # チャンネルは用途別のプールから割り当てる（voice / ambience / loop / ui / world）
+        self.channels = ChannelPool(CHANNEL_GROUPS)
+        self.voice_channel = self.channels.named("voice", "voice")  # 独立したボイスチャンネルを確保
+        self._voice_pool: ThreadPoolExecutor | None = None  # ボイス先読み用（最初に使うときに作る）
+        self._voice_futures: dict[str, Future] = {}         # 先読み中/済みのボイス（絶対パス -> Future）
         self.current_bgm = None  # 再生中BGMのフルパス（重複再生防止用）
+        self._bgm_stream = None  # ストリーム再生中の復号リーダ（チャンク暗号のBGM）
 
         # 音量パラメータ（初期値をセット）
         self.bgm_volume = self.DEFAULTS["bgm_volume"]
         self.se_volume = self.DEFAULTS["se_volume"]
         self.voice_volume = self.DEFAULTS["voice_volume"]
 
-        # 効果音(SE)の辞書
+        # 効果音(SE)の辞書（読み込みはワーカースレッドで進み、できた順にここへ入る）
         self.se = {}
+        self._se_futures: dict[str, Future] = {}   # key -> 読み込み完了の Future
+        self._se_lock = threading.Lock()           # self.se と se_volume をまとめて守る
+        self._se_context = ""                      # 使用実績を記録するマップID
+        self._se_usage_dirty = False
+        self._load_se_usage()
+        # 最後に居たマップの実績は warm_se_for_map では書き出されないので、終了時にも保存する
+        # （QUIT / タイトルの「終了」/ 各シーンの SystemExit のどれで抜けても通る）
+        atexit.register(self.save_se_usage)
 
         self.use_encrypted = use_encrypted
 
-        # 効果音の読み込み（暗号化ファイル優先で復号→Soundオブジェクト化）
+        # 効果音の読み込み（起動時に必要な分だけ。スレッドプールで並列に進め、ここでは待たない）
         self._load_se()
 
         # 音量設定ファイル（sound_settings.json）の読み込み（あれば上書き）
@@ -58,73 +188,158 @@ class SoundManager:
         # 読み込んだ音量設定をすべてのサウンドに反映
         self.apply_volume()
 
+    @traced("SoundManager._load_se")
     def _load_se(self):
-        """効果音ファイルを辞書として読み込む（暗号化ファイル優先）"""
-        files = {
-            "cursor": "決定ボタンを押す13.mp3",      # カーソル移動
-            "select": "決定ボタンを押す16.mp3",      # 決定・選択
-            "cancel": "警告音2.mp3",         # キャンセル
-            # map
-            # --- ★足音（環境別）★ ---
-            "step_forest": "砂利の上を歩く.mp3", # 森
-            "step_lab":    "革靴で歩く.mp3",    # 研究所
-            "step_tunnel": "アスファルトの上を歩く1.mp3", # 地下道
-            # ------------------------
-            "get_item":"決定ボタンを押す38.mp3", # アイテム取得
-            "kazamidori_y":"キャンセル9.mp3",
-            "kazamidori_n":"キャンセル1.mp3",
-            # menu
-            "menu_open":"メニューを開く2.mp3",
-            "menu_close":"メニューを開く3.mp3",
-            # セーブ/ロード 成功専用SE
-            "save_ok": "メニューを開く4.mp3",
-            "load_ok": "メニューを開く5.mp3",
-            # intro_event
-            "growl_hint":"ゴブリンの鳴き声3.mp3",
-
-            # 霧シーン※使えてない
-            "fog_intro": "死後の世界.mp3",
-            "fog_intro": "魔法陣を展開.mp3",
-            # 河原シーン
-            "tree_crash": "木が倒れる.mp3",  
-            "river_loop": "河原.mp3",
-            "tree_chop": "打撃5.mp3",
-            # ドア
-            "door_unlock": "鉄の扉を開ける.mp3",
-            # スイッチ系
-            "switch_ok":      "決定ボタンを押す52.mp3", # 正解
-            "switch_ng":      "ビープ音4.mp3",          # 誤答
-            "switch_solved":  "巨大シャッターが開く.mp3",  # 全問正解で封鎖が外れる
-        }
+        """
+        起動時に読む SE（SE_STARTUP_KEYS）だけをスレッドプールへ投げる。
+        それ以外は最初に play_se / get_se / has_se されたとき、またはマップ入場時の warm_se_for_map で読む。
+        """
         self.se = {}
-        for key, fname in files.items():
-            # 暗号化ファイル優先
-            enc_path = self.se_path / (Path(fname).stem + ".mp3.enc")
-            try:
+        self._se_futures = {}
+        self._se_times: dict[str, float] = {}
+        self._se_started = time.perf_counter()
+        self._se_pool = ThreadPoolExecutor(max_workers=SE_LOAD_WORKERS, thread_name_prefix="se-load")
+        self._startup_se = [k for k in SE_STARTUP_KEYS if k in SE_FILES]
+        for key in self._startup_se:
+            self._request_se(key)
+
+    def _request_se(self, key: str) -> Future | None:
+        """未読込・未依頼なら読み込みを依頼（待たない）。表に無いキーは None"""
+        fname = SE_FILES.get(key)
+        if fname is None:
+            return None
+        with self._se_lock:
+            fut = self._se_futures.get(key)
+            if fut is None:
+                fut = self._se_pool.submit(self._load_one_se, key, fname)
+                self._se_futures[key] = fut
+        return fut
+
+    def _load_one_se(self, key: str, fname: str) -> None:
+        """ワーカースレッド：SE を1つ読み込んで self.se に登録"""
+        t0 = time.perf_counter()
+        # 暗号化ファイル優先
+        enc_path = self.se_path / (Path(fname).stem + ".mp3.enc")
+        try:
+            with span(f"SE {key}"):
+                # 2回目以降の起動ではディスクの PCM キャッシュから直接作る（MP3 デコードを省く）
                 if self.use_encrypted and enc_path.exists():
                     # --- 暗号化SEファイルを復号しSoundオブジェクト化 ---
-                    with open(enc_path, "rb") as f:
-                        encrypted_data = f.read()
-                    decrypted_data = fernet.decrypt(encrypted_data)
-                    sound = pygame.mixer.Sound(io.BytesIO(decrypted_data))
-                    sound.set_volume(self.se_volume)
-                    self.se[key] = sound
+                    sound = PCM_CACHE.load_sound(enc_path, encrypted=True)
                 else:
                     # --- 通常ファイル（暗号化されていないSE） ---
                     path = self.se_path / fname
-                    sound = pygame.mixer.Sound(str(path))
-                    sound.set_volume(self.se_volume)
-                    self.se[key] = sound
-            except Exception as e:
-                print(f"[SoundManager] 効果音の読み込み失敗: {key}: {fname} ({e})")
+                    sound = PCM_CACHE.load_sound(path, encrypted=False)
+            # 音量は登録と同じロックの中で設定（load_settings との競合で古い音量が残らないように）
+            with self._se_lock:
+                sound.set_volume(self.se_volume)
+                self.se[key] = sound
+        except Exception as e:
+            print(f"[SoundManager] 効果音の読み込み失敗: {key}: {fname} ({e})")
+        finally:
+            dt = time.perf_counter() - t0
+            with self._se_lock:
+                self._se_times[key] = dt
+                startup_done = all(k in self._se_times for k in self._startup_se)
+            if DEV_MODE:
+                if key not in self._startup_se:
+                    print(f"[SoundManager] SE on-demand: {key} {dt * 1000:.1f}ms")
+                elif startup_done:
+                    self._report_se_load()
+
+    def _report_se_load(self) -> None:
+        """DEV 用：起動時 SE ごとの読み込み時間（遅い順）と全体の所要時間"""
+        wall = time.perf_counter() - self._se_started
+        rows = sorted(((k, self._se_times[k]) for k in self._startup_se), key=lambda kv: kv[1], reverse=True)
+        print(f"[SoundManager] SE {len(rows)}/{len(SE_FILES)} loaded at startup in {wall * 1000:.1f}ms "
+              f"(sum {sum(dt for _, dt in rows) * 1000:.1f}ms, {SE_LOAD_WORKERS} workers)")
+        for key, dt in rows:
+            print(f"[SoundManager]   {dt * 1000:7.1f}ms  {key}")
+
+    def _wait_se(self, key: str) -> None:
+        """その SE を使う直前に呼ぶ：未読込なら読み込み、読み込み中なら終わるまで待つ"""
+        self._note_se_use(key)
+        fut = self._request_se(key)
+        if fut is not None and not fut.done():
+            fut.result()
+
+    # ---------------------------------------------
+    # マップごとの“温めておく SE”（宣言＋前回までの使用実績）
+    # ---------------------------------------------
+    def _note_se_use(self, key: str) -> None:
+        """今のマップで使った SE を覚える（次回そのマップに入ったとき先読みする）"""
+        if self._se_context and key in SE_FILES:
+            used = self._se_usage.setdefault(self._se_context, [])
+            if key not in used:
+                used.append(key)
+                self._se_usage_dirty = True
+
+    def _load_se_usage(self) -> None:
+        if self.se_usage_path is None:
+            self._se_usage = {}
+            return
+        try:
+            with open(self.se_usage_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._se_usage = {str(m): [str(k) for k in keys] for m, keys in data.items()}
+        except Exception:
+            # 無い/壊れている：実績なしから始める
+            self._se_usage = {}
+
+    def save_se_usage(self) -> None:
+        """SE 使用実績を保存（変化があったときだけ）"""
+        if not self._se_usage_dirty or self.se_usage_path is None:
+            return
+        try:
+            with open(self.se_usage_path, "w", encoding="utf-8") as f:
+                json.dump(self._se_usage, f, ensure_ascii=False, indent=1)
+            self._se_usage_dirty = False
+        except Exception as e:
+            print(f"[SoundManager] SE使用実績の保存に失敗: {e}")
+
+    def warm_se_for_map(self, map_id: str, keys=()) -> None:
+        """
+        マップ入場時に呼ぶ。
+        - keys（MAPS の se_warm / 環境音 / 足音）と、前回までにそのマップで使った SE を裏で読み込む
+        - 起動時 SE・今回の温め対象・再生中の音 以外の“オンデマンドで読んだ SE”は手放す（常駐メモリを減らす）
+        """
+        self.save_se_usage()   # 前のマップでの実績をここで書き出す
+        self._se_context = map_id
+        warm = [k for k in keys if k in SE_FILES]
+        for k in self._se_usage.get(map_id, ()):
+            if k not in warm:
+                warm.append(k)
+        for k in warm:
+            self._request_se(k)
+
+        keep = set(self._startup_se) | set(warm)
+        released = []
+        with self._se_lock:
+            for k, fut in list(self._se_futures.items()):
+                if k in keep or not fut.done():
+                    continue
+                snd = self.se.get(k)
+                if snd is not None and snd.get_num_channels() > 0:
+                    continue   # 鳴っている最中（環境音ループなど）は残す
+                self.se.pop(k, None)
+                del self._se_futures[k]
+                released.append(k)
+        if DEV_MODE:
+            print(f"[SoundManager] SE warm map={map_id}: {warm} / released: {released}")
+
+    def wait_all_se(self) -> None:
+        """依頼済みの SE の読み込み完了を待つ"""
+        for fut in list(self._se_futures.values()):
+            fut.result()
 
     def apply_volume(self):
         """
         現在の音量パラメータをBGM/SE/Voiceに反映
         """
         pygame.mixer.music.set_volume(self.bgm_volume)
-        for sound in self.se.values():
-            sound.set_volume(self.se_volume)
+        with self._se_lock:
+            for sound in self.se.values():
+                sound.set_volume(self.se_volume)
         self.voice_channel.set_volume(self.voice_volume)
     # BGMの音量設定
     def set_bgm_volume(self, vol):
@@ -132,9 +347,10 @@ class SoundManager:
         pygame.mixer.music.set_volume(self.bgm_volume)
     # SEの音量設定
     def set_se_volume(self, vol):
-        self.se_volume = max(0.0, min(1.0, vol))
-        for sound in self.se.values():
-            sound.set_volume(self.se_volume)
+        with self._se_lock:
+            self.se_volume = max(0.0, min(1.0, vol))
+            for sound in self.se.values():
+                sound.set_volume(self.se_volume)
     # Voiceの音量設定
     def set_voice_volume(self, vol):
         self.voice_volume = max(0.0, min(1.0, vol))
@@ -163,7 +379,8 @@ class SoundManager:
             with open(self.settings_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
                 self.bgm_volume = float(data.get("bgm_volume", self.DEFAULTS["bgm_volume"]))
-                self.se_volume = float(data.get("se_volume", self.DEFAULTS["se_volume"]))
+                with self._se_lock:
+                    self.se_volume = float(data.get("se_volume", self.DEFAULTS["se_volume"]))
                 self.voice_volume = float(data.get("voice_volume", self.DEFAULTS["voice_volume"]))
         except Exception:
             # ファイルがなければデフォルト値のまま
@@ -175,7 +392,7 @@ class SoundManager:
     def play_bgm(self, filename, loop=True, encrypted=None):
         """
         指定BGMファイルの再生。暗号化ファイル(.mp3.enc)なら復号して再生
-        :param filename: .mp3 または .mp3.enc
+        :param filename: .mp3 または .mp3.enc（Fernet / チャンク暗号のどちらでも可）
         :param loop: ループ再生するか
         :param encrypted: Noneなら自動判定。Trueなら強制的に暗号化ファイルとして扱う
         """
@@ -194,11 +411,16 @@ class SoundManager:
 
         try:
             pygame.mixer.music.stop()
-            if is_encrypted:
-                # --- 暗号化BGM ---
-                with open(full_path, "rb") as f:
-                    encrypted_data = f.read()
-                decrypted_data = fernet.decrypt(encrypted_data)
+            self._close_bgm_stream()
+            stream = open_stream(full_path, stream_key()) if is_encrypted else None
+            if stream is not None:
+                # --- チャンク暗号のBGM：読む位置のチャンクだけ復号しながらストリーム再生 ---
+                #     （mixer が読み続けるので、次の曲に替えるまで開いたまま持っておく）
+                pygame.mixer.music.load(stream)
+                self._bgm_stream = stream
+            elif is_encrypted:
+                # --- 従来の Fernet 形式（復号済みバイト列は AUDIO_CACHE に残るので、2回目以降は復号しない） ---
+                decrypted_data = AUDIO_CACHE.read_bytes(full_path, encrypted=True)
                 mp3_file = io.BytesIO(decrypted_data)
                 pygame.mixer.music.load(mp3_file)
             else:
@@ -211,9 +433,24 @@ class SoundManager:
             print(f"[SoundManager] BGM再生失敗: {filename} ({e})")
             self.current_bgm = None
 
+    def _close_bgm_stream(self):
+        """前の曲のストリーム（復号リーダ）を mixer から外して閉じる"""
+        if self._bgm_stream is None:
+            return
+        try:
+            pygame.mixer.music.unload()
+        except Exception:
+            pass
+        try:
+            self._bgm_stream.close()
+        except Exception:
+            pass
+        self._bgm_stream = None
+
     def stop_bgm(self):
         """BGMを停止"""
         pygame.mixer.music.stop()
+        self._close_bgm_stream()
         self.current_bgm = None
 
     def fadeout_bgm(self, ms=1000):
@@ -226,10 +463,13 @@ class SoundManager:
     # ----------------------------
     def play_se(self, key):
         """
-        効果音を再生（起動時に復号済みのSoundオブジェクトから）
+        効果音を再生（未読込なら初回だけここで読み込む。読み込み中ならその1つだけ待つ）
         """
+        self._wait_se(key)
         if key in self.se:
-            self.se[key].play()
+            # UI 系と世界内の SE でチャンネルを分け、埋まっていたら優先度の低い/古い音から譲らせる
+            group = "ui" if key in SE_UI_KEYS else "world"
+            self.channels.play(group, self.se[key], priority=SE_PRIORITY.get(key))
 
     #----- 本プロジェクトでの☆新規追加☆ ------------
         else:
@@ -238,8 +478,9 @@ class SoundManager:
 
     def has_se(self, key: str) -> bool:
         """
-        指定キーのSEがロード済みかを返す（デバッグ/事前確認用）
+        指定キーのSEが使えるかを返す（未読込ならここで読み込む。デバッグ/事前確認用）
         """
+        self._wait_se(key)
         return key in self.se
 
     # ---------------------------------------------
@@ -247,35 +488,16 @@ class SoundManager:
     # ---------------------------------------------
     def _ensure_channel(self, name: str, channel_index: int | None = None) -> pygame.mixer.Channel:
         """
-        任意の“論理名”に1つだけ pygame.mixer.Channel を割り当ててキャッシュする。
-        - 明示 index が無い場合、**名前ごとに固有のチャンネル番号**を自動採番して衝突回避。
-        """
-        if not hasattr(self, "_named_channels"):
-            self._named_channels = {}
-            self._channel_indices = {}
-        if name in self._named_channels:
-            return self._named_channels[name]
-        # 固定で使いたいものはここで割当（例: voice=3 は別で確保済み）
-        if channel_index is not None:
-            idx = int(channel_index)
-        else:
-            # 6番以降を順に使う（ambience/footstep/…の順で 6,7,8,...）
-            base = 6
-            idx = base + len(self._named_channels)
-        # Mixerに十分なチャンネル数を確保
-        try:
-            cur = pygame.mixer.get_num_channels()
-            if idx >= cur:
-                pygame.mixer.set_num_channels(idx + 1)
-        except Exception:
-            pass
-        ch = pygame.mixer.Channel(idx)
-        self._named_channels[name] = ch
-        self._channel_indices[name] = idx
-        return ch
+        任意の“論理名”に1つだけ pygame.mixer.Channel を割り当てる（ChannelPool の名前付きチャンネル）。
+        - ambience などは LOOP_CHANNEL_GROUPS のグループ、それ以外は "loop" グループから専有する。
+        - channel_index は旧方式（番号の直接指定）の名残。プール導入後は使わない。
+        """
+        group = LOOP_CHANNEL_GROUPS.get(name, "loop")
+        return self.channels.named(group, name)
 
     def get_se(self, key: str) -> pygame.mixer.Sound | None:
         """SE辞書から Sound を取得（存在しなければ None）。"""
+        self._wait_se(key)
         try:
             return self.se.get(key)
         except Exception:
@@ -324,7 +546,9 @@ class SoundManager:
           足音の残響など“鳴りっぱなし”を一括で解消できます。
         - voice_channel（ムービー音声用）は止めません。
         """
-        for key, snd in self.se.items():
+        with self._se_lock:
+            loaded = list(self.se.items())
+        for key, snd in loaded:
             try:
                 if fade_ms > 0:
                     snd.fadeout(int(fade_ms))
@@ -401,18 +625,45 @@ class SoundManager:
         is_encrypted = encrypted if encrypted is not None else str(filename).endswith(".enc")
         path = self.voice_path / filename
         try:
-            if is_encrypted:
-                with open(path, "rb") as f:
-                    encrypted_data = f.read()
-                decrypted_data = fernet.decrypt(encrypted_data)
-                sound = pygame.mixer.Sound(io.BytesIO(decrypted_data))
-            else:
-                sound = pygame.mixer.Sound(str(path))
+            # 先読み中なら、二重にデコードせず終わるのを待つ（先読み済みなら待ち時間なし）
+            fut = self._voice_futures.pop(str(path.resolve()), None)
+            if fut is not None:
+                fut.result()
+            # 同じセリフの再生は AUDIO_CACHE の Sound をそのまま使う（復号もデコードもしない）
+            sound = AUDIO_CACHE.load_sound(path, encrypted=is_encrypted)
             sound.set_volume(self.voice_volume)
             self.voice_channel.play(sound)
         except Exception as e:
             print(f"[SoundManager] ボイス再生失敗: {filename} ({e})")
 
+    def prefetch_voices(self, filenames) -> None:
+        """
+        これから流れるボイスを裏で復号＋デコードして AUDIO_CACHE に入れておく。
+        会話シーンが「次の数行ぶん」を渡す想定。play_voice は行頭で即座に鳴らせる。
+        """
+        # 済んだ先読みは捨てる（再生されずに終わった行の Future を残すと、
+        # AUDIO_CACHE から追い出されたあとも「先読み済み」とみなして読み直さなくなる）
+        for key in [k for k, f in self._voice_futures.items() if f.done()]:
+            del self._voice_futures[key]
+        for filename in filenames:
+            path = (self.voice_path / filename).resolve()
+            key = str(path)
+            if key in self._voice_futures:
+                continue   # まだ読み込み中（済んだものは上で捨てたので、キャッシュに無ければ読み直す）
+            if self._voice_pool is None:
+                # 1本で十分（再生より先に1行ずつ読めればよい。メインスレッドの描画を邪魔しない）
+                self._voice_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="voice-prefetch")
+            self._voice_futures[key] = self._voice_pool.submit(self._prefetch_one_voice, path)
+
+    def _prefetch_one_voice(self, path: Path) -> None:
+        """ワーカースレッド：ボイス1つを AUDIO_CACHE に載せる（失敗は再生時に改めて報告される）"""
+        try:
+            with span(f"voice {path.name}"):
+                AUDIO_CACHE.load_sound(path)
+        except Exception as e:
+            if DEV_MODE:
+                print(f"[SoundManager] ボイス先読み失敗: {path.name} ({e})")
+
     def stop_voice(self):
         """ボイスチャンネルの音声を停止"""
         self.voice_channel.stop()
@@ -455,4 +706,6 @@ class SoundManager:
 # SE（効果音）は短く軽量なため、事前にSoundオブジェクトとして事前にメモリに読み込んでおくことで、
 # 即時再生・レスポンス向上を図っています。
 # ※この方式はPygameに限らず、一般的なゲーム開発でもよく用いられる手法のようです。
+# ただし常駐させるのは UI 系（SE_STARTUP_KEYS）と、いまいるマップで使う SE（warm_se_for_map）だけ。
+# 一度きりの演出用 SE は初回再生時に読み込み、マップを離れたら手放します。
 
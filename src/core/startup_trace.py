@@ -0,0 +1,164 @@
+# core/startup_trace.py
+# -*- coding: utf-8 -*-
+"""
+起動タイムライン計測（起動 → 最初の操作可能フレームまで）。
+
+・span("名前") / begin→end / @traced("名前") で区間を記録する。入れ子もそのまま記録（スレッドごと）。
+・finish_startup_trace() を「最初の操作可能フレーム（タイトル）」で1回呼ぶと記録を締め、
+    - 所要時間の長い順のレポートを表示
+    - STARTUP_TRACE_JSON=<パス> があれば Chrome trace 形式（chrome://tracing / Perfetto）で保存
+  以後の span は何もしない（ゲーム中に呼ばれても無害・ほぼゼロコスト）。
+・有効化: 環境変数 STARTUP_TRACE=1、または DEV_MODE=1。無効時はすべてノーオペ。
+
+時刻の基準はこのモジュールが最初に import された瞬間（main.py の先頭で import する）。
+"""
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+ENABLED = os.getenv("STARTUP_TRACE", "0") == "1" or os.getenv("DEV_MODE", "0") == "1"
+JSON_PATH = os.getenv("STARTUP_TRACE_JSON", "")
+
+_T0 = time.perf_counter()
+_lock = threading.Lock()
+_local = threading.local()
+_spans: list[dict] = []       # {"name", "start", "end", "depth", "parent", "tid", "thread"}
+_marks: list[dict] = []
+_finished = False
+
+
+def _now() -> float:
+    return time.perf_counter() - _T0
+
+
+def _stack() -> list[dict]:
+    st = getattr(_local, "stack", None)
+    if st is None:
+        st = _local.stack = []
+    return st
+
+
+def begin(name: str) -> Optional[dict]:
+    """区間の開始（with が使いにくい場所用）。戻り値を end() に渡す"""
+    if not ENABLED or _finished:
+        return None
+    st = _stack()
+    rec = {
+        "name": name,
+        "start": _now(),
+        "end": None,
+        "depth": len(st),
+        "parent": st[-1]["name"] if st else None,
+        "tid": threading.get_ident(),
+        "thread": threading.current_thread().name,
+    }
+    st.append(rec)
+    return rec
+
+
+def end(rec: Optional[dict]) -> None:
+    if rec is None:
+        return
+    rec["end"] = _now()
+    st = _stack()
+    if rec in st:
+        # 例外などで閉じ忘れた内側の区間もここで閉じる
+        while st:
+            top = st.pop()
+            if top["end"] is None:
+                top["end"] = rec["end"]
+            with _lock:
+                _spans.append(top)
+            if top is rec:
+                break
+
+
+@contextmanager
+def span(name: str):
+    rec = begin(name)
+    try:
+        yield
+    finally:
+        end(rec)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """関数まるごとを区間として記録するデコレータ"""
+    def deco(fn):
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not ENABLED or _finished:
+                return fn(*args, **kwargs)
+            with span(label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return deco
+
+
+def mark(name: str) -> None:
+    """瞬間イベント（区間ではない目印）"""
+    if not ENABLED or _finished:
+        return
+    with _lock:
+        _marks.append({"name": name, "t": _now(), "tid": threading.get_ident()})
+
+
+# ---------------------------------------------------------------------
+# 締め・レポート
+# ---------------------------------------------------------------------
+def finish_startup_trace(label: str = "first interactive frame") -> None:
+    """最初の操作可能フレームで1回だけ呼ぶ（2回目以降は何もしない）"""
+    global _finished
+    if not ENABLED or _finished:
+        return
+    mark(label)
+    _finished = True
+    total = _now()
+    print(report(total, label))
+    if JSON_PATH:
+        try:
+            write_chrome_trace(JSON_PATH)
+            print(f"[TRACE] chrome trace -> {JSON_PATH}")
+        except Exception as e:
+            print(f"[TRACE][WARN] failed to write trace: {e}")
+
+
+def report(total: float, label: str, top: int = 30) -> str:
+    with _lock:
+        spans = [s for s in _spans if s["end"] is not None]
+    spans.sort(key=lambda s: s["end"] - s["start"], reverse=True)
+    lines = [f"[TRACE] startup → {label}: {total * 1000:.1f}ms"]
+    for s in spans[:top]:
+        dur = (s["end"] - s["start"]) * 1000
+        where = f" < {s['parent']}" if s["parent"] else ""
+        thread = "" if s["thread"] == "MainThread" else f" [{s['thread']}]"
+        lines.append(f"  {dur:8.1f}ms  @{s['start'] * 1000:7.1f}  {'  ' * s['depth']}{s['name']}{where}{thread}")
+    return "\n".join(lines)
+
+
+def write_chrome_trace(path: str) -> None:
+    """Chrome trace event 形式（"X"=区間, "i"=目印、単位はマイクロ秒）"""
+    pid = os.getpid()
+    with _lock:
+        events = [
+            {
+                "name": s["name"], "ph": "X", "pid": pid, "tid": s["tid"],
+                "ts": s["start"] * 1e6, "dur": (s["end"] - s["start"]) * 1e6,
+                "args": {"thread": s["thread"]},
+            }
+            for s in _spans if s["end"] is not None
+        ]
+        events += [
+            {"name": m["name"], "ph": "i", "s": "g", "pid": pid, "tid": m["tid"], "ts": m["t"] * 1e6}
+            for m in _marks
+        ]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
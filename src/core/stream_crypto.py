@@ -0,0 +1,228 @@
+# core/stream_crypto.py
+# -*- coding: utf-8 -*-
+"""
+チャンク単位で暗号化した音声コンテナ（BGM のストリーム再生用）。
+
+・Fernet（従来の .mp3.enc）はファイル全体を復号してからでないと再生できず、
+  BGM 1曲ぶんの平文がまるごとメモリに載る。
+・このコンテナは平文を固定長チャンクに分け、チャンクごとに AES-256-GCM で暗号化する。
+  先頭のヘッダにチャンク数と各チャンクのオフセット表を持つので、
+  StreamDecryptReader は「いま読む位置のチャンクだけ」を復号する（シーク可）。
+  pygame.mixer.music.load(reader) にそのまま渡せる。
+・ヘッダ全体を各チャンクの AAD に含め、nonce にチャンク番号を入れるので、
+  チャンクの入れ替え・切り詰め・ヘッダ改ざんは復号時にエラーになる。
+・拡張子は従来どおり .mp3.enc。先頭のマジックで Fernet トークンと見分ける
+  （Fernet トークンは base64 の "gAAAAA" で始まる）。
+
+ファイル形式（数値はリトルエンディアン）:
+    MAGIC(8) | version u8 | chunk_size u32 | n_chunks u32 | plain_size u64 | nonce_prefix(8)
+    | offsets u64 × n_chunks   … 各チャンク（暗号文＋タグ16B）の先頭位置
+    | chunk 0 | chunk 1 | ...
+
+鍵は Fernet と同じ秘密（FERNET_KEY）から HKDF で導出する（derive_stream_key）。
+"""
+from __future__ import annotations
+
+import io
+import os
+import struct
+from pathlib import Path
+from typing import Optional
+
+MAGIC = b"RCSTRM1\0"
+VERSION = 1
+DEFAULT_CHUNK_SIZE = 64 * 1024
+TAG_SIZE = 16
+
+_HEAD = struct.Struct("<8sBIIQ8s")   # MAGIC, version, chunk_size, n_chunks, plain_size, nonce_prefix
+
+
+class StreamFormatError(ValueError):
+    """コンテナとして壊れている / 改ざんされている"""
+
+
+def derive_stream_key(secret: bytes) -> bytes:
+    """Fernet 用の秘密からストリーム用の AES-256 鍵を導出"""
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+    return HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=b"rcstream-v1").derive(secret)
+
+
+def is_stream_container(head: bytes) -> bool:
+    """先頭バイト列がこのコンテナか（Fernet トークンなら False）"""
+    return head[:len(MAGIC)] == MAGIC
+
+
+def is_stream_file(path) -> bool:
+    try:
+        with open(path, "rb") as f:
+            return is_stream_container(f.read(len(MAGIC)))
+    except OSError:
+        return False
+
+
+def _nonce(prefix: bytes, index: int) -> bytes:
+    return prefix + struct.pack("<I", index)
+
+
+# ---------------------------------------------------------------------
+# 暗号化（dev_tools から使う）
+# ---------------------------------------------------------------------
+def encrypt_stream(data: bytes, key: bytes, chunk_size: int = DEFAULT_CHUNK_SIZE) -> bytes:
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    chunk_size = int(chunk_size)
+    n_chunks = max(1, -(-len(data) // chunk_size))
+    prefix = os.urandom(8)
+    head = _HEAD.pack(MAGIC, VERSION, chunk_size, n_chunks, len(data), prefix)
+
+    # 各チャンクの位置はヘッダ（固定部＋オフセット表）の直後から順に並ぶ
+    offsets = []
+    pos = len(head) + 8 * n_chunks
+    for i in range(n_chunks):
+        plain_len = min(chunk_size, len(data) - i * chunk_size)
+        offsets.append(pos)
+        pos += max(0, plain_len) + TAG_SIZE
+    header = head + struct.pack(f"<{n_chunks}Q", *offsets)
+
+    aes = AESGCM(key)
+    out = [header]
+    for i in range(n_chunks):
+        chunk = data[i * chunk_size:(i + 1) * chunk_size]
+        out.append(aes.encrypt(_nonce(prefix, i), chunk, header))
+    return b"".join(out)
+
+
+# ---------------------------------------------------------------------
+# 復号
+# ---------------------------------------------------------------------
+class StreamDecryptReader(io.RawIOBase):
+    """
+    コンテナを“平文のファイル”として読む（読み取り専用・シーク可）。
+    復号済みチャンクは直近1つだけ持つので、常駐メモリはチャンク1つぶん。
+    """
+
+    def __init__(self, fileobj, key: bytes) -> None:
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+        super().__init__()
+        self._f = fileobj
+        head = self._f.read(_HEAD.size)
+        if len(head) != _HEAD.size or not is_stream_container(head):
+            raise StreamFormatError("not a stream container")
+        _, version, chunk_size, n_chunks, plain_size, prefix = _HEAD.unpack(head)
+        if version != VERSION or chunk_size <= 0 or n_chunks <= 0:
+            raise StreamFormatError(f"unsupported header (version={version})")
+        table = self._f.read(8 * n_chunks)
+        if len(table) != 8 * n_chunks:
+            raise StreamFormatError("truncated offset table")
+        self._header = head + table
+        self._offsets = struct.unpack(f"<{n_chunks}Q", table)
+        self._chunk_size = chunk_size
+        self._n_chunks = n_chunks
+        self._size = plain_size
+        self._prefix = prefix
+        self._aes = AESGCM(key)
+        self._pos = 0
+        self._cur_index = -1
+        self._cur_plain = b""
+
+    @classmethod
+    def open(cls, path, key: bytes) -> "StreamDecryptReader":
+        return cls(open(Path(path), "rb"), key)
+
+    # --- io.RawIOBase ---
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self._size + offset
+        else:
+            raise ValueError(f"invalid whence: {whence}")
+        self._pos = max(0, int(pos))
+        return self._pos
+
+    def _chunk(self, index: int) -> bytes:
+        if index == self._cur_index:
+            return self._cur_plain
+        start = self._offsets[index]
+        plain_len = min(self._chunk_size, self._size - index * self._chunk_size)
+        self._f.seek(start)
+        blob = self._f.read(plain_len + TAG_SIZE)
+        try:
+            plain = self._aes.decrypt(_nonce(self._prefix, index), blob, self._header)
+        except Exception as e:
+            raise StreamFormatError(f"chunk {index} failed authentication") from e
+        self._cur_index, self._cur_plain = index, plain
+        return plain
+
+    def readinto(self, b) -> int:
+        # チャンク境界で短く返さない（SDL の RWops は短い read を終端とみなすことがある）。
+        # 要求サイズを満たすか終端に達するまでチャンクをまたいで埋める
+        view = memoryview(b).cast("B")
+        want = len(view)
+        got = 0
+        while got < want and self._pos < self._size:
+            index, inner = divmod(self._pos, self._chunk_size)
+            plain = self._chunk(index)
+            n = min(want - got, len(plain) - inner)
+            view[got:got + n] = plain[inner:inner + n]
+            got += n
+            self._pos += n
+        return got
+
+    def close(self) -> None:
+        if not self.closed:
+            self._f.close()
+            self._cur_plain = b""
+        super().close()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+
+def decrypt_container(data: bytes, key: bytes) -> bytes:
+    """コンテナ全体をまとめて復号（SE/ボイスのように全体を Sound にする用途）"""
+    with StreamDecryptReader(io.BytesIO(data), key) as r:
+        return r.read()
+
+
+def open_stream(path, key: bytes) -> Optional[StreamDecryptReader]:
+    """path がコンテナならストリーム読み出しを返す（従来の Fernet 形式なら None）"""
+    if not is_stream_file(path):
+        return None
+    return StreamDecryptReader.open(path, key)
+
+
+if __name__ == "__main__":
+    # 自己診断: python -m core.stream_crypto
+    # チャンク境界をまたぐ seek+read が途中で短く切れず、平文と一致するか確かめる
+    import random
+
+    key = os.urandom(32)
+    chunk = 4096
+    plain = os.urandom(chunk * 5 + 123)
+    blob = encrypt_stream(plain, key, chunk_size=chunk)
+    assert decrypt_container(blob, key) == plain
+    with StreamDecryptReader(io.BytesIO(blob), key) as r:
+        for off, n in ((chunk - 10, 20), (chunk - 1, chunk * 3), (0, len(plain) + 50), (len(plain) - 5, 100)):
+            r.seek(off)
+            assert r.read(n) == plain[off:off + n], (off, n)
+        rng = random.Random(0)
+        for _ in range(500):
+            off, n = rng.randrange(len(plain)), rng.randrange(1, chunk * 3)
+            r.seek(off)
+            assert r.read(n) == plain[off:off + n], (off, n)
+    print("[STREAM] self-test ok")
@@ -0,0 +1,161 @@
+# core/symbol_index.py
+# -*- coding: utf-8 -*-
+"""
+マップ記号の位置インデックス（マップごと）。
+
+・「記号 → タイル座標のソート済みリスト」と、近傍検索用の小さな空間ハッシュ
+  （CELL_TILES×CELL_TILES タイル単位のセル）を持つ。
+・レイアウトの書き換え（ドア開放 / 霧晴れ / 伐採 / ロード時の復元 など）は
+  どのモジュールからでも `layout[y] = 新しい行` の形で行われるため、
+  参照のたびに sync() で「変わった行だけ」を差分パッチする。
+  行は不変文字列なので、変化していない行は同一オブジェクト比較（is）で即スキップ。
+
+使い方:
+    idx = get_symbol_index(map_id)
+    idx.first('>')                      # 行優先で最初の位置 (x, y) or None
+    idx.positions('E')                  # [(x, y), ...]（行優先順）
+    idx.count('F')
+    idx.near_any(('F', 'f'), px, py, 96.0, TILE)
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import Iterable, Optional
+
+from core.maps import MAPS
+
+CELL_TILES = 4  # 空間ハッシュ1セルの一辺（タイル数）
+
+
+class SymbolIndex:
+    def __init__(self, layout: list[str]) -> None:
+        self._rows: list[str] = []
+        self._pos: dict[str, list[tuple[int, int]]] = {}      # ch -> [(y, x), ...]（ソート済み）
+        self._cells: dict[tuple[int, int], dict[str, list[tuple[int, int]]]] = {}
+        self.patches = 0  # DEV 用：差分パッチした行数の累計
+        self._rebuild(layout)
+
+    # ------------------------------------------------------------
+    # 構築・差分更新
+    # ------------------------------------------------------------
+    def _rebuild(self, layout: list[str]) -> None:
+        self._rows = list(layout)
+        self._pos.clear()
+        self._cells.clear()
+        for y, row in enumerate(self._rows):
+            for x, ch in enumerate(row):
+                self._add(ch, x, y)
+
+    def _add(self, ch: str, x: int, y: int) -> None:
+        insort(self._pos.setdefault(ch, []), (y, x))
+        cell = self._cells.setdefault((x // CELL_TILES, y // CELL_TILES), {})
+        cell.setdefault(ch, []).append((x, y))
+
+    def _remove(self, ch: str, x: int, y: int) -> None:
+        lst = self._pos.get(ch)
+        if lst:
+            i = bisect_left(lst, (y, x))
+            if i < len(lst) and lst[i] == (y, x):
+                lst.pop(i)
+        cell = self._cells.get((x // CELL_TILES, y // CELL_TILES))
+        if cell and ch in cell:
+            try:
+                cell[ch].remove((x, y))
+            except ValueError:
+                pass
+
+    def sync(self, layout: list[str]) -> int:
+        """layout と突き合わせ、変わった行だけパッチする。戻り値: パッチした行数"""
+        rows = self._rows
+        if len(layout) != len(rows) or any(len(a) != len(b) for a, b in zip(layout, rows)):
+            self._rebuild(layout)
+            return len(layout)
+        patched = 0
+        for y, new in enumerate(layout):
+            old = rows[y]
+            if new is old or new == old:
+                rows[y] = new
+                continue
+            for x, (a, b) in enumerate(zip(old, new)):
+                if a != b:
+                    self._remove(a, x, y)
+                    self._add(b, x, y)
+            rows[y] = new
+            patched += 1
+        self.patches += patched
+        return patched
+
+    # ------------------------------------------------------------
+    # 参照
+    # ------------------------------------------------------------
+    def positions(self, ch: str) -> list[tuple[int, int]]:
+        """記号 ch のタイル座標 (x, y) を行優先順で"""
+        return [(x, y) for (y, x) in self._pos.get(ch, ())]
+
+    def first(self, ch: str) -> Optional[tuple[int, int]]:
+        lst = self._pos.get(ch)
+        if not lst:
+            return None
+        y, x = lst[0]
+        return (x, y)
+
+    def count(self, ch: str) -> int:
+        return len(self._pos.get(ch, ()))
+
+    def has_any(self, symbols: Iterable[str]) -> bool:
+        return any(self._pos.get(ch) for ch in symbols)
+
+    def nearest(self, symbols: Iterable[str], px: float, py: float,
+                radius_px: float, tile: int) -> Optional[tuple[int, int]]:
+        """(px, py) から半径内で最も近い記号タイル (x, y)。タイル中心で距離を測る"""
+        symbols = tuple(symbols)
+        r2 = radius_px * radius_px
+        span = CELL_TILES * tile
+        cx0 = int((px - radius_px) // span)
+        cx1 = int((px + radius_px) // span)
+        cy0 = int((py - radius_px) // span)
+        cy1 = int((py + radius_px) // span)
+        best, best_d2 = None, r2
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                cell = self._cells.get((cx, cy))
+                if not cell:
+                    continue
+                for ch in symbols:
+                    for (x, y) in cell.get(ch, ()):
+                        dx = px - (x * tile + tile * 0.5)
+                        dy = py - (y * tile + tile * 0.5)
+                        d2 = dx * dx + dy * dy
+                        if d2 <= best_d2:
+                            best, best_d2 = (x, y), d2
+        return best
+
+    def near_any(self, symbols: Iterable[str], px: float, py: float,
+                 radius_px: float, tile: int) -> bool:
+        return self.nearest(symbols, px, py, radius_px, tile) is not None
+
+
+# ---------------------------------------------------------------------
+# マップごとのレジストリ
+# ---------------------------------------------------------------------
+_INDEXES: dict[str, SymbolIndex] = {}
+
+
+def get_symbol_index(map_id: str) -> SymbolIndex:
+    """map_id のインデックスを返す（初回に構築、以降は差分同期）"""
+    layout = MAPS[map_id]["layout"]
+    idx = _INDEXES.get(map_id)
+    if idx is None:
+        idx = SymbolIndex(layout)
+        _INDEXES[map_id] = idx
+    else:
+        idx.sync(layout)
+    return idx
+
+
+def symbol_index_for_layout(layout: list[str]) -> Optional[SymbolIndex]:
+    """layout（MAPS 内のリストそのもの）からインデックスを引く。該当なしは None"""
+    for map_id, m in MAPS.items():
+        if m.get("layout") is layout:
+            return get_symbol_index(map_id)
+    return None
@@ -5,6 +5,8 @@ import pygame
 import numpy as np
 
 from .config import TILE
+from .asset_cache import ASSET_CACHE, load_image
+from .texture_pack import get_texture_pack
 
 # 既存のユーティリティがあれば使う（無ければフォールバック）
 try:
@@ -55,13 +57,65 @@ def _load_surface(base_dir: Path, rel: str | None) -> pygame.Surface | None:
     p = _resolve_path(base_dir, rel)
     if not p:
         return None
-    try:
-        # 透過があるかもしれないので convert_alpha
-        return pygame.image.load(str(p)).convert_alpha()
-    except Exception as e:
-        print(f"[WARN] texture load failed: {rel} ({e})")
+
+    def _load():
+        try:
+            # 事前ベイク済みパックがあれば PNG デコードを省く
+            pack = get_texture_pack(base_dir)
+            baked = pack.surface(p, None, "alpha") if pack else None
+            if baked is not None:
+                return baked.convert_alpha()
+            # 透過があるかもしれないので convert_alpha
+            return load_image(str(p)).convert_alpha()
+        except Exception as e:
+            print(f"[WARN] texture load failed: {rel} ({e})")
+            return None
+
+    # 2回目以降（別マップ→戻ってきた時など）はデコードせずキャッシュから
+    return ASSET_CACHE.get_or_load((str(p), None, "alpha"), _load)
+
+
+def _load_tile_array3(base_dir: Path, rel: str | None) -> np.ndarray | None:
+    """床/天井用：TILE×TILE の RGB 配列（縮小・配列化済みをキャッシュ）"""
+    p = _resolve_path(base_dir, rel)
+    if not p:
         return None
 
+    def _load():
+        pack = get_texture_pack(base_dir)
+        baked = pack.arrays(p, (TILE, TILE), "rgb3") if pack else None
+        if baked:
+            return baked[0]   # memmap のビュー（コピー無し）
+        return _surf_to_tile_array3(_load_surface(base_dir, rel))
+
+    return ASSET_CACHE.get_or_load((str(p), (TILE, TILE), "rgb3"), _load)
+
+
+def _pair_or_none(pair):
+    return pair if pair[0] is not None else None
+
+
+def _load_tile_arrays_rgba(base_dir: Path, rel: str | None) -> tuple[np.ndarray | None, np.ndarray | None]:
+    """床の特殊タイル用：(RGB, Alpha) の配列ペア（キャッシュ付き）"""
+    p = _resolve_path(base_dir, rel)
+    if not p:
+        return None, None
+
+    def _load():
+        pack = get_texture_pack(base_dir)
+        baked = pack.arrays(p, (TILE, TILE), "rgba_tile") if pack else None
+        if baked:
+            return tuple(baked)
+        return _pair_or_none(_surf_to_tile_arrays_rgba(_load_surface(base_dir, rel)))
+
+    pair = ASSET_CACHE.get_or_load((str(p), (TILE, TILE), "rgba_tile"), _load)
+    return pair if pair is not None else (None, None)
+
+
+def _placeholder(kind: str, make):
+    """プレースホルダ生成（床のチェッカーなどは Python ループで遅いので1度だけ作る）"""
+    return ASSET_CACHE.get_or_load((f"<placeholder:{kind}>", (TILE, TILE), kind), make)
+
 
 def _surf_to_tile_array3(surf: pygame.Surface | None) -> np.ndarray | None:
     """(TILE, TILE, 3) の ndarray へ。alphaは捨ててRGBにする。"""
@@ -110,6 +164,15 @@ def _build_special_floor(base_dir: Path, mapping: dict) -> dict:
             out[sym] = val
             continue
 
+        # 文字列パス（※ '.' や単文字など“ファイルでない”ものは採用しない）
+        #   → 配列化まで済ませた結果をキャッシュから引く
+        if isinstance(val, str):
+            if "." in val or "/" in val or "\\" in val:
+                rgb, alpha = _load_tile_arrays_rgba(base_dir, val)
+                if rgb is not None:
+                    out[sym] = {"arr": rgb, "alpha": alpha}
+            continue
+
         surf = None
         # 直接 Surface
         if isinstance(val, pygame.Surface):
@@ -118,13 +181,6 @@ def _build_special_floor(base_dir: Path, mapping: dict) -> dict:
         elif isinstance(val, dict) and isinstance(val.get("surf"), pygame.Surface):
             surf = val["surf"]
 
-        # 文字列パス（※ '.' や単文字など“ファイルでない”ものは採用しない）
-        elif isinstance(val, str):
-            # 簡易判定：拡張子を含まない／パスとして解決できないものは無視
-            if "." in val or "/" in val or "\\" in val:
-                surf = _load_surface(base_dir, val)
-            else:
-                surf = None
 
         if surf is None:
             # ★ 要件：current_textures["special"] に文字列は絶対に入れない
@@ -156,23 +212,25 @@ def load_textures(base_dir: Path, map_def: dict) -> dict:
     # 壁（必須）
     wall_surf = _load_surface(base_dir, tex_cfg.get("wall"))
     if wall_surf is None:
-        wall_surf = make_wall_placeholder_surface(TILE)
+        wall_surf = _placeholder("wall", lambda: make_wall_placeholder_surface(TILE))
 
     # 床
     floor_arr = None
     if tex_cfg.get("floor") is None:
         floor_arr = None
     else:
-        f_surf = _load_surface(base_dir, tex_cfg.get("floor"))
-        floor_arr = _surf_to_tile_array3(f_surf) if f_surf is not None else make_floor_placeholder_array(TILE)
+        floor_arr = _load_tile_array3(base_dir, tex_cfg.get("floor"))
+        if floor_arr is None:
+            floor_arr = _placeholder("floor", lambda: make_floor_placeholder_array(TILE))
 
     # 天井
     ceil_arr = None
     if tex_cfg.get("ceiling") is None:
         ceil_arr = None
     else:
-        c_surf = _load_surface(base_dir, tex_cfg.get("ceiling"))
-        ceil_arr = _surf_to_tile_array3(c_surf) if c_surf is not None else make_ceiling_placeholder_array(TILE)
+        ceil_arr = _load_tile_array3(base_dir, tex_cfg.get("ceiling"))
+        if ceil_arr is None:
+            ceil_arr = _placeholder("ceiling", lambda: make_ceiling_placeholder_array(TILE))
 
     # 壁の差し替え（ドア/封鎖/肖像など）
     wall_special = _build_wall_special(base_dir, tex_cfg.get("wall_special") or {})
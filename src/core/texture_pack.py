@@ -0,0 +1,152 @@
+# core/texture_pack.py
+# -*- coding: utf-8 -*-
+"""
+事前ベイク済みテクスチャパック（dev_tools/build_texture_pack.py で生成）の読み込み。
+
+・assets/texture_pack.bin  : 最終サイズの生配列（RGB / Alpha / RGBA）を並べただけのバイナリ
+  assets/texture_pack.json : 索引（エントリごとの offset / shape と、元 PNG の sha1・サイズ・mtime）
+・np.memmap でファイルごとマップし、各エントリはそのビュー（コピー無し）で返す。
+  床/天井/特殊床の配列はそのまま描画に使え、壁/スプライトは frombuffer → convert_alpha だけで済む。
+・元 PNG が差し替えられていたら（サイズ/mtime が違い、かつ sha1 も違う）そのエントリは使わず、
+  呼び出し側が従来どおり PNG からロードする。TILE が違うパックは丸ごと無視。
+
+エントリのキーは ASSET_CACHE と同じ考え方の (相対パス, サイズ, モード)：
+    "rgb3"      : (TILE, TILE, 3)             床/天井
+    "rgba_tile" : (TILE, TILE, 3) + (TILE, TILE)  特殊床（RGB と Alpha の2配列）
+    "alpha"     : (H, W, 4) RGBA 原寸          壁
+    "sprite"    : (h, w, 4) RGBA 指定サイズ     スプライト
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from .config import TILE
+
+DEV_MODE = os.getenv("DEV_MODE", "0") == "1"
+
+PACK_VERSION = 1
+PACK_BIN = "assets/texture_pack.bin"
+PACK_INDEX = "assets/texture_pack.json"
+
+
+def file_sha1(path: Path) -> str:
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def entry_key(rel: str, size: Optional[tuple[int, int]], mode: str) -> str:
+    """索引 JSON 上のキー文字列（相対パスは / 区切り）"""
+    sz = "native" if size is None else f"{int(size[0])}x{int(size[1])}"
+    return f"{rel.replace(os.sep, '/')}|{sz}|{mode}"
+
+
+class TexturePack:
+    def __init__(self, base_dir: Path, index: dict, data: np.memmap) -> None:
+        self.base_dir = Path(base_dir).resolve()
+        self._entries: dict = index.get("entries", {})
+        self._sources: dict = index.get("sources", {})
+        self._data = data
+        self._fresh: dict[str, bool] = {}   # 相対パス -> 元 PNG と一致するか（1回だけ調べる）
+        # DEV 用の統計
+        self.hits = 0
+        self.stale = 0
+
+    # ------------------------------------------------------------
+    # 鮮度チェック
+    # ------------------------------------------------------------
+    def _is_fresh(self, rel: str) -> bool:
+        ok = self._fresh.get(rel)
+        if ok is not None:
+            return ok
+        src = self._sources.get(rel)
+        p = self.base_dir / rel
+        ok = False
+        if src is not None and p.exists():
+            st = p.stat()
+            if st.st_size == src.get("size") and st.st_mtime_ns == src.get("mtime_ns"):
+                ok = True                                  # 速い経路：サイズと mtime が一致
+            elif st.st_size == src.get("size"):
+                ok = file_sha1(p) == src.get("sha1")       # mtime だけ違う（チェックアウト等）→ 内容で確認
+        if not ok:
+            self.stale += 1
+            if DEV_MODE:
+                print(f"[TEXPACK] stale: {rel}")
+        self._fresh[rel] = ok
+        return ok
+
+    def _rel(self, path) -> Optional[str]:
+        try:
+            return Path(path).resolve().relative_to(self.base_dir).as_posix()
+        except (ValueError, OSError):
+            return None
+
+    def _view(self, spec: dict) -> np.ndarray:
+        off = int(spec["offset"])
+        shape = tuple(spec["shape"])
+        n = int(np.prod(shape))
+        return self._data[off:off + n].reshape(shape)
+
+    # ------------------------------------------------------------
+    # 参照（見つからない/古いときは None → 呼び出し側で PNG にフォールバック）
+    # ------------------------------------------------------------
+    def arrays(self, path, size: Optional[tuple[int, int]], mode: str) -> Optional[list[np.ndarray]]:
+        rel = self._rel(path)
+        if rel is None:
+            return None
+        ent = self._entries.get(entry_key(rel, size, mode))
+        if ent is None or not self._is_fresh(rel):
+            return None
+        self.hits += 1
+        return [self._view(spec) for spec in ent["arrays"]]
+
+    def surface(self, path, size: Optional[tuple[int, int]], mode: str):
+        """RGBA エントリから pygame.Surface（未 convert）を作る"""
+        arrs = self.arrays(path, size, mode)
+        if not arrs:
+            return None
+        import pygame
+        rgba = arrs[0]
+        h, w = rgba.shape[:2]
+        return pygame.image.frombuffer(rgba, (w, h), "RGBA")
+
+
+_PACK: Optional[TexturePack] = None
+_PACK_TRIED = False
+
+
+def get_texture_pack(base_dir: Path) -> Optional[TexturePack]:
+    """パックを1度だけ開く。無い/壊れている/TILE 違いなら None（以後 PNG のみ）"""
+    global _PACK, _PACK_TRIED
+    if _PACK_TRIED:
+        return _PACK
+    _PACK_TRIED = True
+    if os.getenv("TEXTURE_PACK", "1") == "0":
+        return None
+    base_dir = Path(base_dir).resolve()
+    idx_path = base_dir / PACK_INDEX
+    bin_path = base_dir / PACK_BIN
+    if not (idx_path.exists() and bin_path.exists()):
+        return None
+    try:
+        index = json.loads(idx_path.read_text(encoding="utf-8"))
+        if index.get("version") != PACK_VERSION or int(index.get("tile", -1)) != TILE:
+            if DEV_MODE:
+                print("[TEXPACK] version/TILE mismatch -> ignored")
+            return None
+        data = np.memmap(bin_path, dtype=np.uint8, mode="r")
+        _PACK = TexturePack(base_dir, index, data)
+        if DEV_MODE:
+            print(f"[TEXPACK] loaded {len(_PACK._entries)} entries ({bin_path.stat().st_size / (1024 * 1024):.1f}MB)")
+    except Exception as e:
+        print(f"[WARN] texture pack load failed: {e}")
+        _PACK = None
+    return _PACK
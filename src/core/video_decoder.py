@@ -0,0 +1,190 @@
+# core/video_decoder.py
+# -*- coding: utf-8 -*-
+"""
+動画のデコードを別スレッドで行うパイプライン（core.video_player から使う）。
+
+・以前は再生ループ（イベント処理・display.flip と同じスレッド）で
+  cap.read() → cvtColor → resize → tobytes → Surface 化 をしていたので、
+  ディスクや CPU が遅いとデコード待ちでカクつき、スキップ入力への反応も遅れた。
+・VideoDecoder はワーカースレッドで「レターボックス後のサイズの RGB 配列」まで作り、
+  小さな上限付きキュー（VIDEO_QUEUE_FRAMES 枚）に積む。再生側は時刻合わせと転送・blit だけ。
+・フレームごとの確保はしない：cap.read / cvtColor / resize はすべて start() で用意した
+  配列に dst= で書き込み、表示サイズの配列は輪番（リング）で使い回す。
+  再生側は使い回しの Surface 1枚に upload()（surfarray.blit_array で1回コピー）する。
+・キューが満杯ならワーカーは待つ（先読みしすぎてメモリを食わない）。
+・再生側が due_index（いま出すべきフレーム番号）を書き込み、ワーカーはそれより遅れている
+  フレームを cap.grab() で読み捨てる（デコードしない）ので、遅いマシンでも音声との同期に追いつく。
+・stop() はすぐ戻る：停止フラグを立ててキューを空にするだけ。
+  cap の解放はワーカー自身が抜けるときに行う（読み込み中の cap を別スレッドから触らない）。
+
+使い方:
+    dec = VideoDecoder(path)
+    if dec.opened:
+        dec.start((w, h))
+        frame = dec.get(timeout=0.1)   # DecodedFrame / END（終端）/ None（まだ無い）
+        dec.stop()
+"""
+from __future__ import annotations
+
+import queue
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pygame
+
+from core.lazy_import import lazy_module
+
+# OpenCV は import が重いので、最初に動画を再生するときに読み込む（タイトル中に先読みもされる）
+def _import_cv2():
+    # import 文を残しておく（PyInstaller が OpenCV を同梱するため。文字列からの import は追えない）
+    import cv2
+    return cv2
+
+cv2 = lazy_module("cv2", _import_cv2)
+
+VIDEO_QUEUE_FRAMES = 4   # 先読みする最大フレーム数（24fps で約 0.17 秒ぶん）
+GRAB_BEHIND = 1          # 表示予定からこの枚数より遅れたフレームは grab() で飛ばす
+
+# キューに入れる終端の印
+END = object()
+
+
+@dataclass
+class DecodedFrame:
+    index: int           # 動画内のフレーム番号（0 始まり）
+    pixels: np.ndarray   # 表示サイズの RGB 配列 (h, w, 3)。リングの1枠なので upload() したら手放す
+
+
+class VideoDecoder:
+    def __init__(self, path: Path, queue_frames: int = VIDEO_QUEUE_FRAMES) -> None:
+        self.path = Path(path)
+        self.cap = None
+        try:
+            self.cap = cv2.VideoCapture(str(self.path))
+        except Exception as e:
+            print(f"[VIDEO][ERR] cv2.VideoCapture failed: {e}")
+        self.opened = bool(self.cap is not None and self.cap.isOpened())
+        if self.opened:
+            self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH) or 0)
+            self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT) or 0)
+            self.fps_src = float(self.cap.get(cv2.CAP_PROP_FPS) or 0.0)
+        else:
+            self.width = self.height = 0
+            self.fps_src = 0.0
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, int(queue_frames)))
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._target_size: tuple[int, int] = (self.width, self.height)
+        self._queue_frames = max(1, int(queue_frames))
+        # 使い回しのバッファ（start() で確保）
+        self._bgr: Optional[np.ndarray] = None        # cap.read の書き込み先（元サイズ）
+        self._rgb_src: Optional[np.ndarray] = None    # 元サイズの RGB（リサイズが要るときだけ）
+        self._ring: list[np.ndarray] = []             # 表示サイズの RGB（輪番）
+        # 再生側が毎ループ書き込む「いま表示すべきフレーム番号」。これより大きく遅れたら grab() で飛ばす
+        self.due_index = 0
+        self.skipped = 0   # grab() でデコードせずに飛ばした枚数
+
+    # ------------------------------------------------------------
+    # ワーカー
+    # ------------------------------------------------------------
+    def start(self, target_size: tuple[int, int]) -> None:
+        if not self.opened or self._thread is not None:
+            return
+        self._target_size = (int(target_size[0]), int(target_size[1]))
+        tw, th = self._target_size
+        self._bgr = np.empty((self.height, self.width, 3), np.uint8)
+        if (self.width, self.height) != (tw, th):
+            self._rgb_src = np.empty((self.height, self.width, 3), np.uint8)
+        # 同時に“使用中”になりうる枠：キューの中 queue_frames 枚 ＋ 再生側が持つ2枚
+        # （表示待ちの pending と、追い越し判定中の chosen）＋ ワーカーが書いている1枚
+        self._ring = [np.empty((th, tw, 3), np.uint8) for _ in range(self._queue_frames + 3)]
+        self._thread = threading.Thread(target=self._run, name="video-decode", daemon=True)
+        self._thread.start()
+
+    def _convert(self, frame_bgr: np.ndarray, out: np.ndarray) -> None:
+        """BGR → RGB → 表示サイズ を out に書き込む（ワーカースレッドで実行・確保なし）"""
+        if self._rgb_src is None:
+            cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB, dst=out)
+        else:
+            cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB, dst=self._rgb_src)
+            cv2.resize(self._rgb_src, self._target_size, dst=out, interpolation=cv2.INTER_AREA)
+
+    def _put(self, item) -> bool:
+        """キューに積む（満杯なら空くまで待つ）。停止を頼まれたら False"""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self) -> None:
+        index = 0
+        slot = 0
+        try:
+            while not self._stop.is_set():
+                # 表示予定より GRAB_BEHIND 枚以上遅れているフレームは、デコード（retrieve）せずに読み捨てる
+                if index < self.due_index - GRAB_BEHIND:
+                    if not self.cap.grab():
+                        break
+                    index += 1
+                    self.skipped += 1
+                    continue
+                ret, frame = self.cap.read(self._bgr)
+                if not ret:
+                    break
+                if frame is not self._bgr:
+                    # 解像度が宣言と違い別の配列が返った：以後はそちらを使い回し、必ずリサイズを通す
+                    self._bgr = frame
+                    self._rgb_src = np.empty_like(frame)
+                out = self._ring[slot]
+                slot = (slot + 1) % len(self._ring)
+                self._convert(frame, out)
+                if not self._put(DecodedFrame(index, out)):
+                    return
+                index += 1
+            self._put(END)
+        except Exception as e:
+            print(f"[VIDEO][ERR] decode failed: {e}")
+            self._put(END)
+        finally:
+            try:
+                self.cap.release()
+            except Exception:
+                pass
+
+    # ------------------------------------------------------------
+    # 再生側
+    # ------------------------------------------------------------
+    def get(self, timeout: Optional[float] = None):
+        """次のフレーム（DecodedFrame）、終端なら END、まだ無ければ None"""
+        try:
+            if timeout is None:
+                return self._queue.get_nowait()
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    @staticmethod
+    def upload(frame: DecodedFrame, surface: pygame.Surface) -> None:
+        """frame の画素を使い回しの Surface に転送（(h, w, 3) → surfarray の (w, h, 3) は転置ビューなのでコピーなし）"""
+        pygame.surfarray.blit_array(surface, frame.pixels.swapaxes(0, 1))
+
+    def stop(self) -> None:
+        """デコードを打ち切る（待たずに戻る）"""
+        self._stop.set()
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        if self._thread is None and self.cap is not None:
+            # start 前に止めた：cap はここで閉じる
+            try:
+                self.cap.release()
+            except Exception:
+                pass
@@ -2,24 +2,28 @@
 # -*- coding: utf-8 -*-
 """
 OpenCV + pygame で動画を再生する共通モジュール。
-- 映像: OpenCV (cv2.VideoCapture) でフレームを取り出し、pygame.Surface 化して描画
+- 映像: OpenCV (cv2.VideoCapture) のデコードと Surface 化は core.video_decoder のワーカースレッドで行い、
+        ここ（メインスレッド）は時刻合わせと描画・入力だけ
 - 音声: pygame.mixer.Sound で WAV を並行再生（任意）
 - フレーム間隔は「再生開始からの経過時間 × fps」による“壁時計基準”でスキップ追従
 - 画面比率はレターボックスで保持
+- 動画を開く・先頭フレームのデコード・音声の復号は VideoPreroll で裏に回し、フェードインと重ねる
 - Enter/Space/左クリック/ESC でスキップ（ESC は確認ダイアログは上位シーンで）
 """
 
 from __future__ import annotations
 from pathlib import Path
-import io
+import os
+import threading
 import time
 import pygame
-import cv2
-import numpy as np
 
 from core.config import WIDTH, HEIGHT
 from core.transitions import fade_in, fade_out
-from core.sound_manager import fernet  # ← 復号に使う（キーの二重管理を避ける）
+from core.audio_cache import AUDIO_CACHE  # 復号済み音声のキャッシュ（鍵は sound_manager 側）
+from core.video_decoder import END, VideoDecoder
+
+DEV_MODE = os.getenv("DEV_MODE", "0") == "1"
 
 # --- ユーティリティ: フルスクリーンの黒下地を描く（レターボックス用） ---
 def _fill_black(surface: pygame.Surface):
@@ -36,19 +40,127 @@ def _make_letterbox_rect(video_w: int, video_h: int) -> pygame.Rect:
     y = (HEIGHT - h) // 2
     return pygame.Rect(x, y, w, h)
 
-def _frame_to_surface(frame_bgr: np.ndarray, target_size: tuple[int, int]) -> pygame.Surface:
-    """OpenCV(BGR) → RGB → pygame.Surface（ターゲットサイズにリサイズ）"""
-    if frame_bgr is None:
+class VideoStats:
+    """1本ぶんの再生統計（DEV 用）：表示枚数・捨てた枚数・表示時刻のずれ"""
+
+    def __init__(self) -> None:
+        self.shown = 0
+        self.dropped = 0        # デコード済みだが表示前に追い越されたフレーム
+        self.drift_sum = 0.0    # 表示した瞬間の (実時刻 - 予定時刻) の合計
+        self.drift_max = 0.0
+
+    def note_shown(self, drift: float) -> None:
+        self.shown += 1
+        self.drift_sum += drift
+        self.drift_max = max(self.drift_max, drift)
+
+    def report(self, name: str, skipped: int) -> None:
+        avg = (self.drift_sum / self.shown) if self.shown else 0.0
+        print(f"[VIDEO] stats {name}: shown={self.shown} dropped={self.dropped} grab_skipped={skipped} "
+              f"drift avg={avg * 1000:.1f}ms max={self.drift_max * 1000:.1f}ms")
+
+# 既定の“環境音マップ”：audio_path が渡されていない時だけ自動適用 ---
+# ムービーに環境音を付けたいときはここに1行足すだけで音を紐づけできます👍
+DEFAULT_AUDIO_MAP = {
+    # fogムービー専用の環境音（暗号化/非暗号化いずれもOK拡張子は合わせて💦）
+    "assets/movies/fog_block_intro.mp4": "assets/sounds/se/死後の世界.mp3",
+    "assets/movies/river_warning.mp4":"assets/sounds/se/河原.mp3.enc",
+    "assets/movies/trunk_intro.mp4":"assets/sounds/se/河原.mp3.enc",
+     # ★追跡者導入ムービー：デフォルトで警告系の効果音を付与
+    "assets/movies/chaser_intro.mp4":"assets/sounds/se/狂気.mp3.enc",
+    "assets/movies/chaser_caught.mp4":"assets/sounds/se/狂気.mp3.enc",
+    "doctor_burst_out.mp4":"映写機.mp3.enc",
+}
+
+# 何度も流れる（リトライのたびに再生される）ムービー：音声を AUDIO_CACHE に pin して追い出さない
+PINNED_AUDIO_MOVIES = {
+    "assets/movies/chaser_caught.mp4",
+}
+
+def _load_movie_audio(base_dir: Path, audio_rel_path: str | None, *, pin: bool = False):
+    """ムービー音声を Sound にする（無し/失敗なら None）"""
+    if not audio_rel_path:
         return None
-    # BGR → RGB
-    frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
-    # リサイズ（高品質）
-    if target_size is not None and (frame_rgb.shape[1], frame_rgb.shape[0]) != target_size:
-        frame_rgb = cv2.resize(frame_rgb, target_size, interpolation=cv2.INTER_AREA)
-    # 連続メモリに
-    frame_rgb = np.ascontiguousarray(frame_rgb)
-    surf = pygame.image.frombuffer(frame_rgb.tobytes(), target_size, "RGB")
-    return surf
+    # --- パス解決（拡張子省略時のオート補完に対応） -------------------
+    cand = []
+    p = base_dir / audio_rel_path
+    if p.suffix:  # すでに拡張子あり
+        cand.append(p)
+    else:
+        # よく使う順で探索（mp3→wav→ogg→mp3.enc）
+        for suf in (".mp3", ".wav", ".ogg", ".mp3.enc"):
+            cand.append(p.with_suffix(suf))
+
+    real_path = None
+    for cp in cand:
+        if cp.exists():
+            real_path = cp
+            break
+
+    # --- ロード処理（暗号化なら復号、通常ならそのまま） --------------
+    try:
+        if real_path is None:
+            raise FileNotFoundError(f"no candidate found for {audio_rel_path!r}")
+        if not pygame.mixer.get_init():
+            pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=1024)
+
+        # 暗号化なら復号して Sound 化（AUDIO_CACHE に残すので、すぐ流し直すときは即座に始まる）
+        # pin は PINNED_AUDIO_MOVIES のものだけ（それ以外は普通の LRU で予算内に収める）
+        return AUDIO_CACHE.load_sound(real_path, pin=pin)
+    except Exception as e:
+        print(f"[VIDEO] Audio load failed ({audio_rel_path} -> {real_path}): {e}")
+        print("[VIDEO] HINT: If MP3 codec is not available on your SDL_mixer, try WAV/OGG instead.")
+        return None
+
+class VideoPreroll:
+    """
+    ムービーの“出だし”を裏のスレッドで準備する。
+    cap を開いて先頭フレームのデコードを始め（キューが埋まるまで）、音声を復号して Sound にしておく。
+    play_video はこれをフェードインと並行して走らせ、キューの次のムービーは前のムービーの再生中に作っておける。
+    """
+
+    def __init__(self, base_dir: Path, video_rel_path: str, audio_rel_path: str | None = None) -> None:
+        if audio_rel_path is None:
+            audio_rel_path = DEFAULT_AUDIO_MAP.get(str(video_rel_path))
+        self.base_dir = base_dir
+        self.video_rel_path = video_rel_path
+        self.audio_rel_path = audio_rel_path
+        self.video_path = base_dir / video_rel_path
+        self.decoder: VideoDecoder | None = None
+        self.dst_rect = pygame.Rect(0, 0, WIDTH, HEIGHT)
+        self.sound = None
+        self._done = threading.Event()
+        threading.Thread(target=self._run, name="video-preroll", daemon=True).start()
+
+    def _run(self) -> None:
+        try:
+            # OpenCVで動画を開く（デコードは VideoDecoder のワーカースレッドで行う）
+            decoder = VideoDecoder(self.video_path)
+            if decoder.opened:
+                self.dst_rect = _make_letterbox_rect(decoder.width, decoder.height)
+                decoder.start((self.dst_rect.width, self.dst_rect.height))
+            self.decoder = decoder
+            self.sound = _load_movie_audio(self.base_dir, self.audio_rel_path,
+                                           pin=str(self.video_rel_path) in PINNED_AUDIO_MOVIES)
+        except Exception as e:
+            print(f"[VIDEO][ERR] preroll failed: {e}")
+        finally:
+            self._done.set()
+
+    def matches(self, base_dir: Path, video_rel_path: str, audio_rel_path: str | None) -> bool:
+        if audio_rel_path is None:
+            audio_rel_path = DEFAULT_AUDIO_MAP.get(str(video_rel_path))
+        return (self.base_dir == base_dir and self.video_rel_path == video_rel_path
+                and self.audio_rel_path == audio_rel_path)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._done.wait(timeout)
+
+    def close(self) -> None:
+        """使わずに捨てる（デコードスレッドを止める）"""
+        self._done.wait()
+        if self.decoder is not None:
+            self.decoder.stop()
 
 def play_video(
     screen: pygame.Surface,
@@ -63,6 +175,7 @@ def play_video(
     override_fps: float | None = 24.0,   # ←CFR固定推奨（素材がVFRでも安定）
     sound_manager=None,                  # ← SoundManager を受け取り
     se_cues: list[tuple[float, str]] | None = None, # ムービーと同期して鳴らすワンショットSE（秒指定）
+    preroll: VideoPreroll | None = None,  # 先に作っておいた準備（キューの次のムービーなど）
 ) -> bool:
     """True=最後まで再生 / False=途中スキップ"""
 
@@ -97,37 +210,36 @@ def play_video(
     print(f"[VIDEO] try open: {video_path}")
     if not video_path.exists():
         print(f"[VIDEO][ERR] file not found: {video_path}")
+        if preroll is not None:
+            preroll.close()
         return False
     
-    # 既定の“環境音マップ”：audio_path が渡されていない時だけ自動適用 ---
-    # ムービーに環境音を付けたいときはここに1行足すだけで音を紐づけできます👍
-    if audio_rel_path is None:
-        default_audio_map = {
-            # fogムービー専用の環境音（暗号化/非暗号化いずれもOK拡張子は合わせて💦）
-            "assets/movies/fog_block_intro.mp4": "assets/sounds/se/死後の世界.mp3",
-            "assets/movies/river_warning.mp4":"assets/sounds/se/河原.mp3.enc",
-            "assets/movies/trunk_intro.mp4":"assets/sounds/se/河原.mp3.enc",
-             # ★追跡者導入ムービー：デフォルトで警告系の効果音を付与
-            "assets/movies/chaser_intro.mp4":"assets/sounds/se/狂気.mp3.enc",
-            "assets/movies/chaser_caught.mp4":"assets/sounds/se/狂気.mp3.enc",
-            "doctor_burst_out.mp4":"映写機.mp3.enc",
-        }
-        audio_rel_path = default_audio_map.get(str(video_rel_path))
-
-    # --- 1) OpenCVで動画を開く ---
-    try:
-        cap = cv2.VideoCapture(str(video_path))
-    except Exception as e:
-        print(f"[VIDEO][ERR] cv2.VideoCapture failed: {e}")
-        return False
-    if not cap or not cap.isOpened():
+    # --- 1) 動画を開く・先頭フレームのデコード・音声の復号（VideoPreroll のスレッドで） ---
+    #     フェードインの間に並行して進める。別の動画向けの準備が渡されたら捨てて作り直す
+    if preroll is not None and not preroll.matches(base_dir, video_rel_path, audio_rel_path):
+        preroll.close()
+        preroll = None
+    if preroll is None:
+        preroll = VideoPreroll(base_dir, video_rel_path, audio_rel_path)
+
+    # --- 3) フェードイン（黒背景で下地を描画） ---
+    def draw_under():
+        _fill_black(screen)
+        pygame.display.flip()
+    fade_in(screen, fade_ms, draw_under=draw_under)
+
+    # フェードが終わるまでに準備が済んでいなければ、ここで待つ
+    t_wait = time.perf_counter()
+    preroll.wait()
+    if DEV_MODE:
+        print(f"[VIDEO] preroll wait {(time.perf_counter() - t_wait) * 1000:.1f}ms")
+    decoder = preroll.decoder
+    if decoder is None or not decoder.opened:
         print(f"[VIDEO][ERR] cannot open video: {video_path}")
         return False
 
     # メタ情報
-    vid_w  = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)  or 0)
-    vid_h  = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT) or 0)
-    fps_src = float(cap.get(cv2.CAP_PROP_FPS) or 0.0)
+    fps_src = decoder.fps_src
     if fps_src <= 1e-3:
         fps_src = 24.0  # フォールバック
 
@@ -137,55 +249,12 @@ def play_video(
     frame_period = 1.0 / fps_target
     print(f"[VIDEO] src_fps={fps_src:.3f}, target_fps={fps_target:.3f}, speed={playback_speed}x")
 
-    dst_rect = _make_letterbox_rect(vid_w, vid_h)
+    dst_rect = preroll.dst_rect
 
     # --- 2) 音声（任意） ---
-    sound = None
+    sound = preroll.sound
     channel = None
     audio_started = False
-    if audio_rel_path:
-        # --- 2-1) パス解決（拡張子省略時のオート補完に対応） -------------------
-        cand = []
-        p = base_dir / audio_rel_path
-        if p.suffix:  # すでに拡張子あり
-            cand.append(p)
-        else:
-            # よく使う順で探索（mp3→wav→ogg→mp3.enc）
-            for suf in (".mp3", ".wav", ".ogg", ".mp3.enc"):
-                cand.append(p.with_suffix(suf))
-
-        real_path = None
-        for cp in cand:
-            if cp.exists():
-                real_path = cp
-                break
-
-        # --- 2-2) ロード処理（暗号化なら復号、通常ならそのまま） --------------
-        try:
-            if real_path is None:
-                raise FileNotFoundError(f"no candidate found for {audio_rel_path!r}")
-            if not pygame.mixer.get_init():
-                pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=1024)
-
-            if str(real_path).endswith(".enc"):
-                # 暗号化データを復号してメモリから読み込む
-                with open(real_path, "rb") as f:
-                    encrypted = f.read()
-                decrypted = fernet.decrypt(encrypted)
-                sound = pygame.mixer.Sound(io.BytesIO(decrypted))
-            else:
-                # 通常ファイル（mp3/wav/ogg）をそのまま読み込み
-                sound = pygame.mixer.Sound(str(real_path))
-        except Exception as e:
-            print(f"[VIDEO] Audio load failed ({audio_rel_path} -> {real_path}): {e}")
-            print("[VIDEO] HINT: If MP3 codec is not available on your SDL_mixer, try WAV/OGG instead.")
-            sound = None
-
-    # --- 3) フェードイン（黒背景で下地を描画） ---
-    def draw_under():
-        _fill_black(screen)
-        pygame.display.flip()
-    fade_in(screen, fade_ms, draw_under=draw_under)
 
     # ムービー開始前に、足音など既存SEを静かに消す
     try:
@@ -195,18 +264,26 @@ def play_video(
         print(f"[VIDEO] stop_all_se failed: {e}")
 
     # --- 4) 再生ループ（“時刻が来たら1枚だけ読む”） ---
-    start_time = time.perf_counter()
-
-    # 最初のフレームを読む（失敗なら終了）
-    ret, frame = cap.read()
-    if not ret:
-        cap.release()
+    # 最初のフレームを待つ（開けたのに読めない/すぐ終端なら終了）
+    first = decoder.get(timeout=2.0)
+    if first is None or first is END:
+        decoder.stop()
         if channel: channel.stop()
         fade_out(screen, fade_ms, draw_under=draw_under)
         return True
 
-    current_surf = _frame_to_surface(frame, (dst_rect.width, dst_rect.height))
-    next_frame_time = start_time  # 次フレーム切り替え時刻（現在＝即切替OK）
+    # 時計は最初のフレームを出す瞬間から（音声もこのループの先頭で鳴り始める）
+    start_time = time.perf_counter()
+    # 表示用の Surface は1枚だけ作って使い回す（画面と同じ形式にして blit も速く）
+    current_surf = pygame.Surface(dst_rect.size)
+    try:
+        current_surf = current_surf.convert()
+    except pygame.error:
+        pass
+    decoder.upload(first, current_surf)
+    shown_index = first.index   # いま表示しているフレーム番号
+    pending = None              # 取り出したが、まだ表示時刻が来ていないフレーム
+    stats = VideoStats()
     finished = True
 
     fired = set()  # どのキューを鳴らしたかのインデックス集合
@@ -215,17 +292,21 @@ def play_video(
         # 1) 入力（スキップ）
         for ev in pygame.event.get():
             if ev.type == pygame.QUIT:
-                cap.release(); pygame.quit(); raise SystemExit
+                decoder.stop(); pygame.quit(); raise SystemExit
             if allow_skip:
                 if ev.type == pygame.KEYDOWN and ev.key in (pygame.K_RETURN, pygame.K_SPACE, pygame.K_ESCAPE):
                     finished = False
-                    cap.release()
+                    decoder.stop()  # デコードを即打ち切り（待たない）
+                    if DEV_MODE:
+                        stats.report(video_rel_path, decoder.skipped)
                     if channel: channel.stop()
                     fade_out(screen, fade_ms, draw_under=draw_under)
                     return finished
                 if ev.type == pygame.MOUSEBUTTONDOWN:
                     finished = False
-                    cap.release()
+                    decoder.stop()
+                    if DEV_MODE:
+                        stats.report(video_rel_path, decoder.skipped)
                     if channel: channel.stop()
                     fade_out(screen, fade_ms, draw_under=draw_under)
                     return finished
@@ -266,13 +347,33 @@ def play_video(
             except Exception as e:
                 print(f"[VIDEO] se_cues failed: {e}")
 
-        # 4) 時刻が来たら次フレームを“1枚だけ”読む
-        if now >= next_frame_time:
-            ret, frame = cap.read()
-            if not ret:
-                break  # 終端
-            current_surf = _frame_to_surface(frame, (dst_rect.width, dst_rect.height))
-            next_frame_time += frame_period
+        # 4) 時計から「いま表示すべきフレーム番号」を決めて、そこまで進める
+        #    - 進みすぎ（次のフレームの時刻がまだ）: 今のフレームを保つ
+        #    - 遅れ: 届いている中で due 以下の最新を出し、それより古いものは捨てる（dropped）
+        #            デコーダ側も due を見て、大きく遅れた分は grab() でデコードせずに飛ばす
+        due = int(elapsed * fps_target)
+        decoder.due_index = due
+        chosen = None
+        ended = False
+        while True:
+            if pending is None:
+                pending = decoder.get()
+            if pending is None:
+                break                      # まだ届いていない
+            if pending is END:
+                ended = True
+                break
+            if pending.index > due:
+                break                      # 先のフレーム：時刻が来るまで保持
+            if chosen is not None:
+                stats.dropped += 1         # 表示する前に次が間に合った＝このフレームは捨てる
+            chosen, pending = pending, None
+        if chosen is not None:
+            decoder.upload(chosen, current_surf)
+            shown_index = chosen.index
+            stats.note_shown(now - (start_time + shown_index * frame_period))
+        if ended and due > shown_index:
+            break  # 終端（最後のフレームも表示時間ぶん出し終えた）
 
         # 5) 描画（時刻前なら同じフレームを保つ）
         _fill_black(screen)
@@ -281,12 +382,15 @@ def play_video(
         pygame.display.flip()
 
         # 6) CPU負荷を軽く抑える（最大10msだけ眠る）
-        sleep_sec = max(0.0, min(0.010, next_frame_time - now))
+        next_due_time = start_time + (max(due, shown_index) + 1) * frame_period
+        sleep_sec = max(0.0, min(0.010, next_due_time - now))
         if sleep_sec > 0:
             time.sleep(sleep_sec)
 
     # --- 5) 正常終了 → フェードアウト ---
-    cap.release()
+    decoder.stop()
+    if DEV_MODE:
+        stats.report(video_rel_path, decoder.skipped)
     if channel: channel.stop()
     fade_out(screen, fade_ms, draw_under=draw_under)
     return True
@@ -68,16 +68,17 @@ Special thanks to all developers and contributors who made these libraries possi
 """
 
 
+from core.startup_trace import begin as trace_begin, end as trace_end, span as trace_span, traced
+_trace_imports = trace_begin("import: main modules")  # 起動計測（STARTUP_TRACE=1 / DEV_MODE=1 で有効）
+
 from pathlib import Path
 import sys
 import pygame
 import math
 import numpy as np
 import os
-import copy
 import re
 from typing import Optional
-from cryptography.fernet import Fernet
 
 DEV_MODE = os.getenv("DEV_MODE", "0") == "1"  # 環境変数 DEV_MODE=1 の時だけ開発機能ON
 # --- DEV_MODE 使い方 ------------------------------------------------------
@@ -100,9 +101,14 @@ BASE_DIR = Path(__file__).resolve().parent
 
 # --- 各種モジュール読み込み ---
 from core.config import WIDTH, HEIGHT, FOV, NUM_RAYS, MAX_DEPTH, TILE, PLAYER_SPEED, DELTA_ANGLE
+from core.config import SIM_DT, MAX_FRAME_DT, RENDER_FPS_CAP
 from core.maps import MAPS
+from core.map_compiler import prepare_map_cache, layout_base, textures_base, pristine_grid, get_compiled_map
 import core.game_state as game_state
 from core.texture_loader import load_textures
+from core.asset_cache import ASSET_CACHE
+from core.audio_cache import AUDIO_CACHE
+from core.asset_prefetch import AssetPrefetcher, PrefetchPlan
 from core.interactions import (
     try_pickup_item,
     try_open_door,
@@ -117,7 +123,10 @@ from core.interactions import (
 from core.tile_types import TILE_TYPES
 from core.ui import ToastManager, draw_label, blit_pill_label_midtop, begin_world_toasts, flush_world_toasts
 from scenes.menu import MenuScene
-from core.items import get_sprite_meta, display_name
+from core.items import (
+    get_sprite_meta, display_name, sprite_path_for,
+    ALWAYS_SPRITES, ALWAYS_SPRITE_SIZE, ITEM_SPRITE_SIZE,
+)
 from core.fonts import render_text  # 縁取り/影つき文字の生成に使う
 
 from core.asset_utils import (
@@ -130,7 +139,7 @@ from core.transitions import fade_in, fade_out
 from scenes.intro_event import IntroEventScene
 from scenes.startup import run_startup_sequence
 from scenes.doctor_event import run_doctor_event
-from collections import deque
+from collections import deque, OrderedDict
 from collections.abc import Callable
 from core.player import handle_movement, handle_rotation
 from core.save_system import (
@@ -152,10 +161,15 @@ from core.cinematics import (
     trigger_proximity_movie_once as cin_trigger_once,
     run_doctor_gate_sequence as cin_run_doctor_gate,
 )
-from core.enemies import Chaser
-from scenes.ending_event import run_ending_sequence
+from core.enemies import EnemyPool, ENEMY_GROUP_MAP, ENEMY_GROUP_SPAWNED
+from core.navigation import FlowField
+from core.line_of_sight import LineOfSight
+from core.collision import move_circle
+from core.symbol_index import get_symbol_index, symbol_index_for_layout
+from core.proximity import get_trigger_table
 
 from core.sound_manager import SoundManager
+trace_end(_trace_imports)
 
 # タスクバーのタイトル用の定数（Pygame初期化のあと）
 GAME_TITLE: str = "Experiment Protocol ─ The Experiment continues ─"
@@ -163,8 +177,8 @@ GAME_TITLE: str = "Experiment Protocol ─ The Experiment continues ─"
 PROX_MOVIES_ENABLED = False  # 近接ムービー（霧/川/大木）の自動再生を一時停止
 
 # main.py のグローバル付近
-if not hasattr(game_state, "current_enemies"):
-    game_state.current_enemies = []  # 今のマップに存在する敵インスタンス一覧
+if not hasattr(game_state, "enemy_pools"):
+    game_state.enemy_pools = {}  # map_id -> EnemyPool（追跡者の配列プール）
 
 # 敵の生成・更新
 game_state.FLAGS.setdefault("videos_played", set())
@@ -177,15 +191,14 @@ CHASER_SAFE_MS = 3000        # スポーン直後は3秒は捕獲しない
 CHASER_CATCH_COOLDOWN = 1500 # 捕獲後1.5秒は再捕獲しない
 CHASER_CATCH_RADIUS = 18.0   # 既存値に合わせる（必要なら調整）
 CHASER_WAKE_DELAY_MS = 700     # ★ 追跡者が動き始めるまでの“待ち”を新設
+CHASER_SPEED_PX_PER_SEC = 80.0 # 追跡速度（px/秒）
 
-# --- 起動時に一度だけ「原本レイアウト」を確保 --------------------------------
-# ・文字列は不変なので、行リストのシャローコピーでOK
-# ・setdefaultで“二重実行時の上書き”を防止（ホットリロード対策）
-
-for _mid, _m in MAPS.items():
-    _m.setdefault("_layout_base", _m["layout"][:])
-    # extures の原本を丸ごと保持（deepcopy）
-    _m.setdefault("_textures_base", copy.deepcopy(_m.get("textures") or {}))
+# --- 起動時に一度だけ「マップ定義のコンパイル済みキャッシュ」を準備 ----------------
+# ・原本レイアウト/原本 textures/診断結果は core.map_compiler がマップごとに保持
+#   （maps.py が変わっていなければ manifest を読むだけ。各マップは初回参照時にロード）
+# ・layout が書き換えられる前（＝ここ）で呼ぶこと
+with trace_span("prepare_map_cache"):
+    prepare_map_cache(MAPS)
 
 def _get_footprint_base():
     """
@@ -304,13 +317,7 @@ def _normalize_item_entry_fallback(it: dict) -> dict:
 # 実際に使う入り口（外部があればそちら優先）
 normalize_item_entry = _normalize_item_entry_external or _normalize_item_entry_fallback
 
-# 2) マップ健診：core.maps.run_maps_health_check があれば使う
-try:
-    from core.maps import run_maps_health_check as _run_maps_health_check
-except Exception:
-    _run_maps_health_check = None
-
-# 3) ミニマップ色：core.config.MINIMAP_COLORS があれば使う
+# 2) ミニマップ色：core.config.MINIMAP_COLORS があれば使う
 try:
     from core.config import MINIMAP_COLORS as MMC
 except Exception:
@@ -322,22 +329,6 @@ except Exception:
         "border":   (0, 0, 0, 180),
     }
 
-# 起動時マップチェック：マップは矩形か？
-def _assert_rectangular(map_id: str, map_def: dict):
-    layout = map_def["layout"]
-    w0 = len(layout[0])
-    for y, row in enumerate(layout):
-        if len(row) != w0:
-            # 問題行の中身も併記（デバッグ短縮）
-            raise ValueError(
-                f"[{map_id}] Map layout is not rectangular at row {y}: expected {w0}, got {len(row)} -> {row!r}"
-            )
-
-# 旧式の簡易矩形検査（run_maps_health_check が別にあればそちらで包括チェック）
-if _run_maps_health_check is None:
-    for mid, m in MAPS.items():
-        _assert_rectangular(mid, m)
-
 # 壁/床/天井が無い時は自動でプレースホルダーに置換
 def _ensure_placeholder_textures_for_current_map():
     """
@@ -377,26 +368,34 @@ def _ensure_placeholder_textures_for_current_map():
     tex.setdefault("special", {})
 
 def _count_char(layout, ch):
-    """マップlayout中に含まれる文字chの個数を数える"""
+    """マップlayout中に含まれる文字chの個数を数える（MAPS 内のレイアウトなら記号インデックスを使う）"""
+    idx = symbol_index_for_layout(layout)
+    if idx is not None:
+        return idx.count(ch)
     return sum(r.count(ch) for r in layout)
 
-def build_tile_grid(layout: list[str]) -> np.ndarray:
+def build_tile_grid(layout: list[str], map_id: str | None = None) -> np.ndarray:
     """
     ★ マップの文字レイアウトを数値(ASCII)配列に変換してキャッシュ。
     例: '.' -> ord('.')、'a' -> ord('a')
+    map_id を渡すと、layout が原本どおりのときはコンパイル済みグリッドを使う。
     """
-    h = len(layout)
-    w = len(layout[0]) if h else 0
-    arr = np.empty((h, w), dtype=np.uint8)
-    for j, row in enumerate(layout):
-        # 行長は矩形前提（起動時に検査済み）
-        arr[j, :] = np.frombuffer(row.encode('ascii'), dtype=np.uint8)
+    arr = pristine_grid(map_id, layout) if map_id else None
+    if arr is None:
+        h = len(layout)
+        w = len(layout[0]) if h else 0
+        arr = np.empty((h, w), dtype=np.uint8)
+        for j, row in enumerate(layout):
+            # 行長は矩形前提（起動時に検査済み）
+            arr[j, :] = np.frombuffer(row.encode('ascii'), dtype=np.uint8)
+    # 版番号を進める（フローフィールド等のキャッシュはこれで作り直しを判断）
+    game_state.tile_grid_version += 1
     return arr
 
-def _merge_textures_from_base(cur_map: dict) -> dict:
-    """cur_map['textures'] を _textures_base で補完（special を必ず復元）"""
-    base = cur_map.get("_textures_base") or {}
-    cur  = cur_map.get("textures") or {}
+def _merge_textures_from_base(map_id: str) -> dict:
+    """MAPS[map_id]['textures'] を原本 textures で補完（special を必ず復元）"""
+    base = textures_base(map_id) or {}
+    cur  = MAPS[map_id].get("textures") or {}
 
     merged = dict(base)  # 基本は原本
 
@@ -412,6 +411,7 @@ def _merge_textures_from_base(cur_map: dict) -> dict:
 
     return merged
 
+@traced("load_current_map_assets")
 def load_current_map_assets():
     """
     ロード時に “原本 textures” と現在の定義をマージしてから読み込む。
@@ -433,7 +433,7 @@ def load_current_map_assets():
 
     # textures を原本で補完（失敗時は現行の textures をそのまま使用）
     try:
-        merged_tex = _merge_textures_from_base(cur_map)
+        merged_tex = _merge_textures_from_base(cur_map_id)
     except Exception:
         merged_tex = cur_map.get("textures", {}) or {}
     merged_mapdef["textures"] = merged_tex
@@ -445,6 +445,9 @@ def load_current_map_assets():
     if DEV_MODE:
         spec_keys = list((game_state.current_textures.get("special") or {}).keys())
         print(f"[TEX] map={cur_map_id} special keys: {spec_keys}")
+        info = ASSET_CACHE.info()
+        print(f"[TEX] asset cache: {info['entries']} entries, "
+              f"{info['bytes'] / (1024 * 1024):.1f}MB, hit {info['hits']}/{info['hits'] + info['misses']}")
 
     # 欠品のプレースホルダ適用 & special の自己修復（“常に dict”を保証）
     _ensure_placeholder_textures_for_current_map()
@@ -474,8 +477,10 @@ def load_current_map_assets():
     except Exception:
         pass
 
-    # タイルグリッド再構築
-    game_state.current_tile_grid = build_tile_grid(cur_map["layout"])
+    # タイルグリッド再構築（記号インデックスもここで同期/初回構築）
+    game_state.current_tile_grid = build_tile_grid(cur_map["layout"], cur_map_id)
+    get_symbol_index(cur_map_id)
+    get_trigger_table(cur_map_id, TILE)   # 近接トリガのコンパイル
 
     # アイテムの正規化＆スプライト準備
     normalize_and_spawn_items_for_map(cur_map_id)
@@ -488,6 +493,9 @@ def load_current_map_assets():
     except Exception:
         pass
 
+    # 隣のマップのテクスチャ/スプライトを裏で先読み
+    _schedule_neighbour_prefetch(force=True)
+
 # save_system.apply_snapshot からも呼べるように 1 回だけ外でエクスポート
 game_state.load_current_map_assets = load_current_map_assets
 
@@ -527,13 +535,48 @@ def on_world_rebuild_for_current_map() -> None:
         build_enemies_for_current_map()
     except Exception:
         pass
-    # 6) ★環境音の適用
+    # 6) ★このマップで使う SE を裏で読み込み（使わなくなった SE は手放す）→ 環境音の適用
+    try:
+        _warm_map_se()
+    except Exception as e:
+        print("[SE][WARN] warm failed:", e)
     try:
         _apply_map_ambience()
     except Exception:
         # ここで失敗してもゲーム継続を優先
         pass
 
+def _footstep_env_key(map_id: str) -> str:
+    """マップIDから足音SEのキーを決める（warm と足音ループの両方で使う）"""
+    mid = (map_id or "").lower()
+    # 明示指定がある場合:  maps[map_id]["footstep"] == "forest|lab|tunnel"
+    explicit = (MAPS.get(map_id, {}).get("footstep") or "").lower()
+    if explicit in ("forest", "lab", "tunnel"):
+        return f"step_{explicit}"
+    # 自動判定（必要に応じて規則を足してください）
+    if mid.startswith("forest"):
+        return "step_forest"
+    if ("dungeon" in mid) or ("tunnel" in mid) or ("underground" in mid):
+        return "step_tunnel"
+    if ("lab" in mid) or ("research" in mid):
+        return "step_lab"
+    return "step_forest"
+
+def _warm_map_se() -> None:
+    """
+    現在マップで使う SE を先読みする。
+    - MAPS[cur]["se_warm"] の宣言 + 環境音ループ + 足音
+    - 前回までの使用実績（SoundManager が se_usage.json に記録）も SoundManager 側で足される
+    """
+    cur_id = getattr(game_state, "current_map_id", "")
+    m = MAPS.get(cur_id, {}) or {}
+    keys = list(m.get("se_warm", ()))
+    amb_key = (m.get("ambience") or {}).get("se_loop")
+    if amb_key:
+        keys.append(amb_key)
+    keys.append(_footstep_env_key(cur_id))
+    sound_manager.warm_se_for_map(cur_id, keys)
+
 def _apply_map_ambience() -> None:
     """
     現在マップの 'ambience' を見て、ループSEを開始/停止する。
@@ -556,21 +599,33 @@ def _apply_map_ambience() -> None:
     except Exception as e:
         print("[AMBIENCE][WARN]", e)
 
+def _enemy_pool(map_id: str | None = None, create: bool = True) -> EnemyPool | None:
+    """指定マップ（省略時は現在マップ）の追跡者プールを返す"""
+    mid = map_id or game_state.current_map_id
+    pool = game_state.enemy_pools.get(mid)
+    if pool is None and create:
+        pool = EnemyPool(mid)
+        game_state.enemy_pools[mid] = pool
+    return pool
+
 def build_enemies_for_current_map():
-    game_state.current_enemies = []
+    """maps.py 定義の追跡者を現在マップのプールへ作り直す（出現済みの個体は残す）"""
     cur_id = game_state.current_map_id
     cur_map = MAPS.get(cur_id, {})
     tile = TILE
+    pool = _enemy_pool(cur_id)
+    pool.remove_group(ENEMY_GROUP_MAP)
 
     # 互換1: "enemies": [{"kind":"chaser","pos":(x,y),"speed":...}, ...]
+    #   ※ speed は旧仕様の「px/フレーム(60fps基準)」なので px/秒 に換算
     use_count = 0
     for e in cur_map.get("enemies", []):
         if e.get("kind") != "chaser":
             continue
         tx, ty = e.get("pos", (0, 0))
         px, py = tx * tile + tile * 0.5, ty * tile + tile * 0.5
-        speed = float(e.get("speed", 2.2))
-        game_state.current_enemies.append(Chaser(spawn_px=(px, py), speed=speed))
+        speed = float(e.get("speed", 2.2)) * 60.0
+        pool.spawn(px, py, speed=speed, group=ENEMY_GROUP_MAP, anim_offset=use_count)
         use_count += 1
 
     # 互換2: "chaser": {"enabled":True, "spawn":(x,y), "speed":...}
@@ -578,8 +633,8 @@ def build_enemies_for_current_map():
     if use_count == 0 and isinstance(ch_def, dict) and ch_def.get("enabled"):
         tx, ty = tuple(ch_def.get("spawn", (0, 0)))
         px, py = tx * tile + tile * 0.5, ty * tile + tile * 0.5
-        speed = float(ch_def.get("speed", 2.2))
-        game_state.current_enemies.append(Chaser(spawn_px=(px, py), speed=speed))
+        speed = float(ch_def.get("speed", 2.2)) * 60.0
+        pool.spawn(px, py, speed=speed, group=ENEMY_GROUP_MAP)
 
 # ------------------------------------------------------------
 # ビルボード投影して描画するヘルパ（フレーム画像を渡して描画）
@@ -672,12 +727,12 @@ INPUT_LOCK_EXTRA_MS = 150    # 回転完了後に少しだけ追いロック（
 # ※ 合計で 600ms 前後の入力無効になる想定
 
 # === 追跡者ナビ用（軽量） ===
-NAV_REPATH_MS = 300        # 再探索は0.3秒間隔
-LOS_STEP_PX   = 8          # 視界チェックのサンプリング間隔(px)
+# 視線判定は DDA でタイル境界を正確にたどる共有サービス（結果は1フレームだけキャッシュ）
+LOS = LineOfSight(TILE)
 
-# 追跡者ステートにウェイポイント等を足す（setdefault 群の近く）
-st = game_state.state
-st.setdefault("__nav", {"next_wp": None, "repath_at": 0})
+# プレイヤーのタイルをゴールにした共有フローフィールド
+# （プレイヤーのタイル or グリッド版が変わった時だけ再計算。追跡者は何体でも O(1) で参照）
+CHASER_FLOW_FIELD = FlowField()
 
 st = game_state.state
 # 既存 setdefault 群の近くに追加
@@ -711,11 +766,12 @@ def _start_auto_turn_180_and_lock_input():
 
 
 # === 追跡者：背後スポーン（最小版） ========================================
-def _spawn_chaser_behind(distance_px: float = 72.0) -> None:
+def _spawn_chaser_behind(distance_px: float = 72.0, replace: bool = True) -> None:
     """
     プレイヤーの“背後”に追跡者を出現させる。
-    ・位置の決定と state への書き込みのみを担当（※アニメ進行は update_chaser_anim() が一元管理）
+    ・位置の決定とプールへの追加のみを担当（※アニメ進行は update_chaser_anim() が一元管理）
     ・衝突しない足場を最大6回まで手前に寄せて探索
+    ・replace=False なら既存の追跡者を残したまま追加（DEV の多数体テスト用）
     """
     # --- 現在のマップ情報を取得 ---
     cur_map = MAPS[game_state.current_map_id]
@@ -745,18 +801,20 @@ def _spawn_chaser_behind(distance_px: float = 72.0) -> None:
     sx = max(TILE * 0.5, min(sx, (len(layout[0]) - 0.5) * TILE))
     sy = max(TILE * 0.5, min(sy, (len(layout) - 0.5) * TILE))
 
-    # --- 追跡者ステートを書き込む（描画・更新と揃える） ---
-    st = game_state.state.setdefault("chaser", {})
+    # --- 追跡者プールへ追加（replace=True なら既存の“出現個体”を置き換える） ---
+    if replace:
+        for pool in game_state.enemy_pools.values():
+            pool.remove_group(ENEMY_GROUP_SPAWNED)
+    pool = _enemy_pool()
     now_ms = pygame.time.get_ticks()
-    st.update({
-        "active": True,
-        "map_id": game_state.current_map_id,
-        "x": sx,
-        "y": sy,
-        "since_ms": now_ms,                      # 出現時刻
-        "wake_at_ms": now_ms + CHASER_WAKE_DELAY_MS,  # 目覚め（稼働）開始の遅延
-        "anim_frame": 0,                         # 旧設計互換用（使わなくてもOK）
-    })
+    pool.spawn(
+        sx, sy,
+        speed=CHASER_SPEED_PX_PER_SEC,
+        wake_at_ms=now_ms + CHASER_WAKE_DELAY_MS,   # 目覚め（稼働）開始の遅延
+        safe_until_ms=now_ms + CHASER_SAFE_MS,      # スポーン直後の“捕獲無効”時間
+        group=ENEMY_GROUP_SPAWNED,
+        anim_offset=len(pool),                      # 複数体のとき足並みをずらす
+    )
 
     # --- アニメ初期化（※進行は update_chaser_anim() が担当） ---
     #     グローバルの現在フレームと、最後に進めた時刻をリセット
@@ -764,90 +822,16 @@ def _spawn_chaser_behind(distance_px: float = 72.0) -> None:
     CHASER_CUR_INDEX = 0
     CHASER_LAST_ADV_MS = now_ms
 
-    # --- スポーン直後の“捕獲無効”時間を設定（既存の定数を利用） ---
-    game_state.state["__chaser_safe_until"] = now_ms + CHASER_SAFE_MS
-
-    print("[CHASER] spawned behind player at (%.1f, %.1f)" % (sx, sy))
-
-    st = game_state.state.setdefault("chaser", {})
-    st.clear()  # ← ゴミを持ち越さない
-    st["active"]  = True
-    st["map_id"]  = game_state.current_map_id
-    st["x"]       = float(sx)
-    st["y"]       = float(sy)
-    st["speed"]   = float(st.get("speed", 2.2))
-
-    now_ms = pygame.time.get_ticks()
-
-    # --- 起床待ち（最大でも 700ms） ---
-    st["wake_at_ms"] = now_ms + 700
-
-    # --- 捕獲の無敵時間（移動は許可・捕獲のみ禁止） ---
-    st["__chaser_safe_until"] = now_ms + 900   # 0.9s 程度に短縮／確定
-
-    # --- 捕獲のクールダウン（0 で開始） ---
-    st["cooldown_until"] = 0
-    st["__catch_lock_until"] = 0
-
-    # --- 経路ヘルパ初期化（必要なら） ---
-    st["repath_at"] = 0
+    print("[CHASER] spawned behind player at (%.1f, %.1f) [%d on map]" % (sx, sy, len(pool)))
 
 # ========================================================================
 
 def _los_clear(x0, y0, x1, y1) -> bool:
-    """x0,y0→x1,y1 に壁が無ければ True（px座標で簡易サンプリング）"""
-    dx, dy = x1 - x0, y1 - y0
-    dist = max(1.0, math.hypot(dx, dy))
-    steps = int(dist // LOS_STEP_PX)
-    if steps <= 1:
+    """x0,y0→x1,y1 に壁が無ければ True（px座標。現在マップのタイルグリッドで DDA 判定）"""
+    grid = getattr(game_state, "current_tile_grid", None)
+    if grid is None:
         return True
-    sx, sy = dx / steps, dy / steps
-    cx, cy = x0, y0
-    for _ in range(steps):
-        if is_wall(cx, cy, radius=6):  # 半径は小さめに
-            return False
-        cx += sx; cy += sy
-    return True
-
-def _a_star_next_step(layout, start_tile, goal_tile):
-    """layout から壁/床を判定して A*。返すのは “startの次の1タイル” or None。"""
-    W, H = len(layout[0]), len(layout)
-    def passable(tx, ty):
-        if not (0 <= tx < W and 0 <= ty < H): return False
-        return layout[ty][tx] in ('.','E','<','>',' ')
-    sx, sy = start_tile
-    gx, gy = goal_tile
-    if (sx, sy) == (gx, gy):
-        return None
-    # オープン/クローズ（リストで十分）
-    open_list = [(0, sx, sy, None)]
-    came = {}  # (x,y)->parent
-    g = {(sx, sy): 0}
-    # 4近傍
-    NB = [(1,0),(-1,0),(0,1),(0,-1)]
-    while open_list:
-        open_list.sort(key=lambda e: e[0])  # f最小
-        _, x, y, _ = open_list.pop(0)
-        if (x, y) == (gx, gy):
-            # 逆辿りで startの次の1歩を返す
-            path = [(x,y)]
-            while (x,y) in came:
-                x,y = came[(x,y)]
-                path.append((x,y))
-            path.reverse()
-            return path[1] if len(path) >= 2 else None
-        for dx,dy in NB:
-            nx, ny = x+dx, y+dy
-            if not passable(nx, ny): continue
-            ng = g[(x,y)] + 1
-            if ng < g.get((nx,ny), 1e9):
-                g[(nx,ny)] = ng
-                # ヒューリスティック：マンハッタン🗽
-                h = abs(nx-gx) + abs(ny-gy)
-                f = ng + h
-                came[(nx,ny)] = (x,y)
-                open_list.append((f, nx, ny, (x,y)))
-    return None
+    return LOS.clear(grid, game_state.tile_grid_version, x0, y0, x1, y1)
 
 def _ensure_special_ready_for_current_map(verbose: bool = False) -> None:
     """
@@ -899,43 +883,94 @@ def normalize_and_spawn_items_for_map(map_id: str) -> None:
     # 正規化で置き換え
     m["items"] = normalized
 
-def prepare_item_sprites_for_current_map(base_dir: Path) -> None:
+def _item_sprite_specs(map_id: str, item_types=None) -> list[tuple[str, str, tuple[int, int], str]]:
     """
-    現在マップに存在する item.type の画像をロードして
-    game_state.current_textures["sprites"] に格納する。
-    ★守人（guardian）はアイテムの有無に関わらず必ずロード。
+    map_id で使うスプライトの (key, パス, サイズ, ラベル) 一覧（アイテム→固定の順）。
+    item_types を渡すとそれを使う（先読みではコンパイル済みの一覧を渡す）。
     """
-    sprites: dict[str, pygame.Surface] = {}
-    # --- アイテム（ある分だけ） ---
-    for raw in MAPS[game_state.current_map_id].get("items", []):
-        it = normalize_item_entry(raw)
-        key = it["type"]
-        if key in sprites:
+    if item_types is None:
+        item_types = [normalize_item_entry(raw)["type"] for raw in MAPS[map_id].get("items", [])]
+    specs = []
+    seen = set()
+    for key in item_types:
+        if key in seen:
             continue
-        meta = get_sprite_meta(key)
-        rel = meta.get("file") or ""
-        path = f"assets/sprites/{rel}" if rel and not rel.startswith("assets/") else rel
+        seen.add(key)
+        path = sprite_path_for(get_sprite_meta(key))
 
         short = "??"
         if key == "axe": short = "AX"
         elif key == "spirit_orb": short = "OR"
         elif key == "key_forest": short = "KY"
+        specs.append((key, path, ITEM_SPRITE_SIZE, short))
 
-        surf = load_or_placeholder(base_dir, path or "", size=(64, 64), shape="circle", label=short)
-        sprites[key] = surf
-
-    # --- 固定スプライト（常時ロード） ---
-    always = {
-        "guardian": ("assets/textures/forest_guardian.png", "GU"),
-        "fog":      ("assets/textures/forest_fog.png",      "FG"),
-        "trunk":    ("assets/textures/forest_trunk.png",    "TR"),
-    }
-    for key, (path, label) in always.items():
-        surf = load_or_placeholder(base_dir, path, size=(96, 96), shape="circle", label=label)
-        sprites[key] = surf
+    for key, (path, label) in ALWAYS_SPRITES.items():
+        specs.append((key, path, ALWAYS_SPRITE_SIZE, label))
+    return specs
 
+def prepare_item_sprites_for_current_map(base_dir: Path) -> None:
+    """
+    現在マップに存在する item.type の画像をロードして
+    game_state.current_textures["sprites"] に格納する。
+    ★守人（guardian）はアイテムの有無に関わらず必ずロード。
+    """
+    sprites: dict[str, pygame.Surface] = {}
+    for key, path, size, label in _item_sprite_specs(game_state.current_map_id):
+        sprites[key] = load_or_placeholder(base_dir, path, size=size, shape="circle", label=label)
     game_state.current_textures["sprites"] = sprites
 
+def _tile_center_px(tx: int | float, ty: int | float) -> tuple[float, float]:
+    """タイル座標から“そのタイルの中心ピクセル”を返す小関数"""
+    return (tx * TILE + TILE * 0.5, ty * TILE + TILE * 0.5)
+
+# ---------------------------------------------------------
+# 隣接マップの先読み（triggers の target_map を1ホップ）
+#  - マップロード直後に全隣接マップを、近い出口の順に積む
+#  - タイルをまたいで“いちばん近い出口”が変わったら、その先を優先して積み直す
+#    （古い世代のジョブは捨てられる）
+# ---------------------------------------------------------
+PREFETCHER = AssetPrefetcher(BASE_DIR)
+_prefetch_first: str | None = None   # 直近で最優先にした隣接マップ
+
+def _neighbour_maps_by_distance(map_id: str) -> list[str]:
+    """map_id の triggers が指す target_map を、プレイヤーから近い出口の順に"""
+    px, py = game_state.player_x, game_state.player_y
+    best: dict[str, float] = {}
+    for t in MAPS[map_id].get("triggers") or []:
+        dst = t.get("target_map")
+        if not dst or dst == map_id or dst not in MAPS:
+            continue
+        tx, ty = t.get("pos", (0, 0))
+        cx, cy = _tile_center_px(tx, ty)
+        d2 = (px - cx) ** 2 + (py - cy) ** 2
+        if d2 < best.get(dst, float("inf")):
+            best[dst] = d2
+    return sorted(best, key=best.get)
+
+def _prefetch_plan_for_map(map_id: str) -> PrefetchPlan:
+    item_types = get_compiled_map(map_id).item_types
+    sprites = [(path, size) for _, path, size, _ in _item_sprite_specs(map_id, item_types) if path]
+    return PrefetchPlan(map_id, _merge_textures_from_base(map_id), sprites)
+
+def _schedule_neighbour_prefetch(force: bool = False) -> None:
+    """隣接マップの先読みを（必要なら）積み直す"""
+    global _prefetch_first
+    try:
+        order = _neighbour_maps_by_distance(game_state.current_map_id)
+        first = order[0] if order else None
+        if not force and first == _prefetch_first:
+            return
+        _prefetch_first = first
+        if not order:
+            PREFETCHER.cancel()
+            return
+        PREFETCHER.request([_prefetch_plan_for_map(m) for m in order])
+        if DEV_MODE:
+            print(f"[PREFETCH] queue: {order}")
+    except Exception as e:
+        if DEV_MODE:
+            print("[PREFETCH][WARN]", e)
+
 def set_tile(layout, x, y, ch):
     """layout[y] の x 文字目を ch へ差し替える（文字列は不変なので作り直し）。"""
     row = layout[y]
@@ -961,7 +996,27 @@ def is_wall(x, y, radius=8):
                 return True  # マップ外は壁扱い
     return False
 
+PLAYER_RADIUS_PX = 8  # is_wall() の既定半径と同じ
+
+def _player_collide(x: float, y: float, dx: float, dy: float) -> tuple[float, float]:
+    """
+    プレイヤー移動の衝突解決（core.collision のスイープ判定）。
+    タイルグリッドが未構築/レイアウトと不一致のときは従来の is_wall 判定にフォールバック。
+    """
+    grid = getattr(game_state, "current_tile_grid", None)
+    layout = MAPS[game_state.current_map_id]["layout"]
+    if grid is None or grid.shape != (len(layout), len(layout[0]) if layout else 0):
+        nx = x + dx if not is_wall(x + dx, y) else x
+        ny = y + dy if not is_wall(nx, y + dy) else y
+        return nx, ny
+    walk = LOS.walkable(grid, game_state.tile_grid_version)
+    nx, ny, _, _ = move_circle(walk, x, y, dx, dy, PLAYER_RADIUS_PX, TILE)
+    return nx, ny
+
 def find_tile_pos(layout, symbol):
+    idx = symbol_index_for_layout(layout)
+    if idx is not None:
+        return idx.first(symbol) or (1, 1)  # fallback
     for y, row in enumerate(layout):
         for x, ch in enumerate(row):
             if ch == symbol:
@@ -1176,6 +1231,11 @@ def _collect_guide_points_for_map_bi(cur_map: dict) -> dict[str, list[tuple[floa
     """
     layout = cur_map["layout"]
     result = {"forward": [], "back": []}
+    idx = symbol_index_for_layout(layout)
+    if idx is not None:
+        result["forward"] = [(x*TILE + TILE*0.5, y*TILE + TILE*0.5) for x, y in idx.positions('>')]
+        result["back"] = [(x*TILE + TILE*0.5, y*TILE + TILE*0.5) for x, y in idx.positions('<')]
+        return result
     for y, row in enumerate(layout):
         for x, ch in enumerate(row):
             if ch == '>':
@@ -1217,7 +1277,7 @@ def _apply_fog_state_for_map(map_id: str) -> None:
     ※ ドア開閉など他の改変は触らない（安全に霧だけ同期）。
     """
     cur_map = MAPS[map_id]
-    base_rows = cur_map.get("_layout_base")
+    base_rows = layout_base(map_id)
     if not base_rows:
         return  # 念のため
 
@@ -1258,7 +1318,7 @@ def _apply_guardian_state_for_map(map_id: str) -> None:
     他の改変（ドア等）は触らない。
     """
     cur_map = MAPS[map_id]
-    base_rows = cur_map.get("_layout_base")
+    base_rows = layout_base(map_id)
     if not base_rows:
         return
 
@@ -1289,7 +1349,7 @@ def _apply_guardian_state_for_map(map_id: str) -> None:
 def _apply_doors_state_for_map(map_id: str) -> None:
     """開いたドアを '.' にする（原本で壁の場所のみ安全に床へ）"""
     cur_map = MAPS[map_id]
-    base_rows = cur_map.get("_layout_base") or cur_map["layout"][:]
+    base_rows = layout_base(map_id)
     layout = cur_map["layout"]
     opened = game_state.FLAGS.get("doors_opened", set())
 
@@ -1401,68 +1461,37 @@ def _check_map_triggers_at_current_tile():
     
 def _check_proximity_triggers_from_map():
     """
-    マップ/チェイサーブロック配下の proximity_triggers をマージして、近接発火させる正準版。
+    マップ/チェイサーブロック配下の proximity_triggers を近接発火させる正準版。
+    トリガはマップロード時に core.proximity のテーブルへコンパイル済み（タイル単位のバケット）。
+    ここではプレイヤーのいるタイルに登録された候補＋記号型だけを、定義順に判定する。
     近接条件: symbol_any / pos_tile / pos を順に判定。radius_px または radius_tile(タイル数)に対応。
+    "require_los": True を付けると、pos_tile/pos の中心が壁越しでない時だけ発火。
     一度化: kind != 'video' は triggers_fired セットで抑止（動画はqueueに積む都合で別管理でもOK）。
     """
     cur_id = game_state.current_map_id
-    cur_map = MAPS[cur_id]
-
-    # トップレベル＋chaser配下をマージ
-    trigs = list(cur_map.get("proximity_triggers") or [])
-    ch_def = cur_map.get("chaser") or {}
-    trigs += list(ch_def.get("proximity_triggers") or [])
-    if not trigs:
+    table = get_trigger_table(cur_id, TILE)
+    if not len(table):
         return
 
     px, py = game_state.player_x, game_state.player_y
     fired_set = game_state.FLAGS.setdefault("triggers_fired", set())
 
-    def _near_symbol_any(sym_seq, r_px):
-        return _player_near_any_symbol(tuple(sym_seq), float(r_px))
-
-    def _near_pos_tile(tx, ty, r_px):
-        cx, cy = _tile_center_px(tx, ty)
-        dx, dy = (px - cx), (py - cy)
-        return (dx*dx + dy*dy) <= (r_px * r_px)
-
-    def _near_pos(tx, ty, r_px):
-        cx, cy = _tile_center_px(tx, ty)   # タイル座標前提のため center を利用
-        dx, dy = (px - cx), (py - cy)
-        return (dx*dx + dy*dy) <= (r_px * r_px)
-
-    for t in trigs:
-        kind = t.get("kind", "video")  # 既定は video
-        trig_name = t.get("id", "?")
-        fired_key = f"{cur_id}:{kind}:{trig_name}"
+    for ct in table.candidates(px, py):
+        t = ct.raw
+        kind = ct.kind
+        trig_name = ct.trig_id
+        fired_key = ct.fired_key
 
         # --- 一度化制御（video以外は triggers_fired で管理）
-        if kind != "video":
-            if fired_key in game_state.FLAGS.setdefault("triggers_fired", set()):
-                continue
+        if kind != "video" and fired_key in fired_set:
+            continue
+
+        # --------- 近接判定（symbol_any / pos_tile / pos）---------
+        if not ct.near(px, py, TILE, _player_near_any_symbol):
+            continue
 
-        # --------- 近接判定（pos_tile / pos / symbol_any をサポート）---------
-        near = False
-        sym = t.get("symbol_any")
-        if sym:
-            r_px = float(t.get("radius_px", 96.0))
-            near = _player_near_any_symbol(tuple(sym), r_px)
-
-        if not near and ("pos_tile" in t):
-            tx, ty = t.get("pos_tile", (0, 0))
-            cx, cy = _tile_center_px(tx, ty)
-            r_px = float(t.get("radius_px", t.get("radius_tile", 1.0) * TILE))
-            dx, dy = (px - cx), (py - cy)
-            near = (dx*dx + dy*dy) <= (r_px * r_px)
-
-        if not near and ("pos" in t):
-            tx, ty = t.get("pos", (0, 0))
-            cx, cy = _tile_center_px(tx, ty)
-            r_px = float(t.get("radius_px", t.get("radius_tile", 1.0) * TILE))
-            dx, dy = (px - cx), (py - cy)
-            near = (dx*dx + dy*dy) <= (r_px * r_px)
-
-        if not near:
+        # 任意："require_los": True なら、トリガ中心が壁越しでない時だけ発火
+        if ct.require_los and not _los_clear(px, py, ct.cx, ct.cy):
             continue
 
         # --------- 発火：種別ごと ---------
@@ -1484,7 +1513,7 @@ def _check_proximity_triggers_from_map():
         # 追跡者スポーン
         if kind == "chaser_spawn":
             # 一度化
-            game_state.FLAGS.setdefault("triggers_fired", set()).add(fired_key)
+            fired_set.add(fired_key)
 
             # いま追跡BGMが鳴っていたかどうかを記録しておく
             ch_st = game_state.state.setdefault("chaser", {})
@@ -1540,7 +1569,7 @@ def apply_visual_pipeline_final(map_id: str) -> None:
         _apply_guardian_state_for_map(map_id)   # 守人の消去
 
         # --- グリッド/スプライトの再構築（衝突＆見た目の整合） ---
-        game_state.current_tile_grid = build_tile_grid(MAPS[map_id]["layout"])
+        game_state.current_tile_grid = build_tile_grid(MAPS[map_id]["layout"], map_id)
         build_world_sprites_for_map(map_id)
 
     except Exception:
@@ -1598,13 +1627,117 @@ def update_chaser_anim() -> None:
         CHASER_CUR_INDEX = (CHASER_CUR_INDEX + 1) % len(CHASER_FRAMES)
         CHASER_LAST_ADV_MS = now
 
-def get_chaser_frame_current() -> pygame.Surface:
+# ---------------------------------------------------------
+# 追跡者フレームの「高さ別スケール済み」キャッシュ（サイズピラミッド）
+#  - 毎フレーム smoothscale すると追跡中に重くなるため、
+#    (コマ番号, 量子化した高さ) ごとに一度だけ縮小して使い回す
+#  - 高さは小さいほど細かく、大きいほど粗く量子化（約3%刻み）
+#  - エントリ数とバイト数の上限を超えたら古い順に捨てる（LRU）
+# ---------------------------------------------------------
+CHASER_SCALE_QUANTUM_PX = 4              # 最小の量子化ステップ（px）
+CHASER_SCALE_MAX_H = HEIGHT * 2          # これより大きい高さ（至近距離）はキャッシュせず、画面に写る部分だけ拡大して描く
+CHASER_SCALE_CACHE_MAX_ENTRIES = 192
+CHASER_SCALE_CACHE_MAX_BYTES = 48 * 1024 * 1024
+
+_CHASER_SCALED: "OrderedDict[tuple[int, int], pygame.Surface]" = OrderedDict()
+CHASER_SCALE_STATS = {"hits": 0, "misses": 0, "evictions": 0, "bytes": 0}
+
+def _quantize_chaser_height(h: int) -> int:
+    """投影高さを“近いピラミッド段”に丸める（小さい高さほど細かい刻み）"""
+    h = max(1, int(h))
+    step = max(CHASER_SCALE_QUANTUM_PX, h >> 5)
+    return max(step, ((h + step // 2) // step) * step)
+
+def clear_chaser_scale_cache() -> None:
+    """フレームの再ロード/再変換時に呼ぶ（古いフォーマットの縮小画像を捨てる）"""
+    _CHASER_SCALED.clear()
+    CHASER_SCALE_STATS["bytes"] = 0
+
+def chaser_scale_cache_info() -> dict:
+    """DEV表示用：キャッシュの件数・バイト数・ヒット率"""
+    total = CHASER_SCALE_STATS["hits"] + CHASER_SCALE_STATS["misses"]
+    return {
+        "entries": len(_CHASER_SCALED),
+        "bytes": CHASER_SCALE_STATS["bytes"],
+        "hits": CHASER_SCALE_STATS["hits"],
+        "misses": CHASER_SCALE_STATS["misses"],
+        "evictions": CHASER_SCALE_STATS["evictions"],
+        "hit_rate": (CHASER_SCALE_STATS["hits"] / total) if total else 0.0,
+    }
+
+def _get_chaser_frame_scaled(index: int, target_h: int) -> pygame.Surface:
+    """コマ index を target_h 付近の高さに縮小した Surface を返す（キャッシュ付き）"""
+    qh = _quantize_chaser_height(target_h)
+    key = (index, qh)
+    surf = _CHASER_SCALED.get(key)
+    if surf is not None:
+        _CHASER_SCALED.move_to_end(key)
+        CHASER_SCALE_STATS["hits"] += 1
+        return surf
+
+    CHASER_SCALE_STATS["misses"] += 1
+    src = CHASER_FRAMES[index]
+    sw, sh = src.get_size()
+    qw = max(1, int(sw * (qh / max(1, sh))))
+    surf = src if (qw, qh) == (sw, sh) else pygame.transform.smoothscale(src, (qw, qh))
+    _CHASER_SCALED[key] = surf
+    CHASER_SCALE_STATS["bytes"] += qw * qh * 4
+
+    # 上限超過分を古い順に追い出す（直前に入れたものは残す）
+    while len(_CHASER_SCALED) > 1 and (
+        len(_CHASER_SCALED) > CHASER_SCALE_CACHE_MAX_ENTRIES
+        or CHASER_SCALE_STATS["bytes"] > CHASER_SCALE_CACHE_MAX_BYTES
+    ):
+        _, old = _CHASER_SCALED.popitem(last=False)
+        ow, oh = old.get_size()
+        CHASER_SCALE_STATS["bytes"] -= ow * oh * 4
+        CHASER_SCALE_STATS["evictions"] += 1
+    return surf
+
+def get_chaser_frame_current(target_h: Optional[int] = None, offset: int = 0) -> pygame.Surface:
+    """
+    現在のコマ画像を返す。
+    target_h を渡すと、その高さに最も近い“スケール済み”の Surface を返す。
+    offset は個体ごとのコマずらし（複数体の足並みを揃えないため）。
+    """
     if not CHASER_FRAMES:
         print("[CHASER][WARN] CHASER_FRAMES is empty at draw-time")
         surf = pygame.Surface((64, 64), pygame.SRCALPHA)
         pygame.draw.circle(surf, (220, 40, 40), (32, 32), 22)
         return surf
-    return CHASER_FRAMES[CHASER_CUR_INDEX]
+    index = (CHASER_CUR_INDEX + offset) % len(CHASER_FRAMES)
+    if target_h is None:
+        return CHASER_FRAMES[index]
+    return _get_chaser_frame_scaled(index, target_h)
+
+def _blit_chaser_frame_clipped(dst: pygame.Surface, offset: int, full_h: int,
+                               midbottom: tuple[int, int]) -> None:
+    """
+    至近距離（高さ CHASER_SCALE_MAX_H 超）のコマを描く。
+    全体を full_h まで拡大すると巨大な Surface になるので、画面に写る範囲だけを元画像から切り出して拡大する。
+    見た目は全体を拡大して midbottom に置いたのと同じ（頭打ちにはしない）。キャッシュはしない。
+    """
+    if not CHASER_FRAMES:
+        return
+    src = CHASER_FRAMES[(CHASER_CUR_INDEX + offset) % len(CHASER_FRAMES)]
+    sw, sh = src.get_size()
+    scale = full_h / max(1, sh)
+    full = pygame.Rect(0, 0, max(1, int(sw * scale)), int(full_h))
+    full.midbottom = midbottom
+    vis = full.clip(dst.get_rect())
+    if vis.width <= 0 or vis.height <= 0:
+        return
+    # 画面に写る範囲 → 元画像の範囲（端は外側へ丸めて、拡大後のはみ出しは blit が切る）
+    x0 = max(0, int((vis.left - full.left) / scale))
+    y0 = max(0, int((vis.top - full.top) / scale))
+    x1 = min(sw, int(math.ceil((vis.right - full.left) / scale)))
+    y1 = min(sh, int(math.ceil((vis.bottom - full.top) / scale)))
+    if x1 <= x0 or y1 <= y0:
+        return
+    part = src.subsurface((x0, y0, x1 - x0, y1 - y0))
+    size = (max(1, round((x1 - x0) * scale)), max(1, round((y1 - y0) * scale)))
+    dst.blit(pygame.transform.smoothscale(part, size),
+             (full.left + round(x0 * scale), full.top + round(y0 * scale)))
 
 # =========================================================
 # 【暫定対策】作業ディレクトリを BASE_DIR に固定する
@@ -1618,12 +1751,14 @@ except Exception as e:
 
 CHASER_FRAMES: list[pygame.Surface] = []  
 
+@traced("load_chaser_frames")
 def load_chaser_frames(count: int = 6, base_dir: Optional[str] = None) -> None:
     """
     追跡者の歩行フレームをロード。
     【重要】CHASER_FRAMES を再代入せず、内容だけ更新します。
     """
     CHASER_FRAMES.clear()  # 既存リストを空にする（参照は保たれる）
+    clear_chaser_scale_cache()
 
     root = base_dir or _detect_base_dir()
     sprite_dir = os.path.join(root, "assets", "sprites", "chaser")
@@ -1657,6 +1792,7 @@ def load_chaser_frames(count: int = 6, base_dir: Optional[str] = None) -> None:
 # -------------------------------
 # Pygame初期化
 # -------------------------------
+_trace_display = trace_begin("pygame.init + display")
 pygame.init()
 
 # ウィンドウのタイトル（タスクバーに表示される文字列）を設定
@@ -1679,6 +1815,7 @@ try:
         pygame.display.set_icon(icon_surf)
 except Exception as e:
     print(f"[WARN] failed to set window icon: {e}")
+trace_end(_trace_display)
 
 def post_convert_chaser_frames_alpha() -> None:
     """
@@ -1698,6 +1835,7 @@ def post_convert_chaser_frames_alpha() -> None:
         # すでに SRCALPHA の Surface でも、convert_alpha で
         # 現在の display に最適化されます。
         CHASER_FRAMES[i] = CHASER_FRAMES[i].convert_alpha()
+    clear_chaser_scale_cache()  # 縮小済み画像も新しいフォーマットで作り直す
 
 def toggle_fullscreen() -> bool:
     """
@@ -1736,9 +1874,9 @@ def toggle_fullscreen() -> bool:
 pygame.mixer.init()  # ★重要：これが無いとサウンドが鳴りません！詳しくはsound_manager.pyで
 from core.sound_manager import SoundManager # 初期化の後にインポートこれ大事
 # サウンドマネージャのインスタンスを作成
-sound_manager = SoundManager(BASE_DIR / "assets" / "sounds")
+with trace_span("SoundManager()"):
+    sound_manager = SoundManager(BASE_DIR / "assets" / "sounds")
 print("[SE] loaded keys:", list(sound_manager.se.keys())[:20])
-print("[SE] has tree_crash?:", sound_manager.has_se("tree_crash"))
 # # お試しで直接音を鳴らす
 # print("[SE] keys loaded:", list(sound_manager.se.keys()))  # => ["cursor","select",...]
 # sound_manager.play_se("cursor")  # 起動直後にポンと鳴るはず（ボリューム確認にも有効）
@@ -1906,18 +2044,12 @@ def build_world_sprites_for_map(map_id: str) -> None:
     - F : 霧   (fog)        [非walkable / スプライト描画]
     - O : 大木 (trunk)      [非walkable / スプライト描画]
     """
-    m = MAPS[map_id]
-    layout = m["layout"]
+    idx = get_symbol_index(map_id)
     entries = []
 
-    for y, row in enumerate(layout):
-        for x, ch in enumerate(row):
-            if ch == 'M':
-                entries.append({"key": "guardian", "tile": (x, y)})
-            elif ch in ('F', 'f'):
-                entries.append({"key": "fog", "tile": (x, y)})
-            elif ch == 'O':
-                entries.append({"key": "trunk", "tile": (x, y)})
+    for ch, key in (('M', "guardian"), ('F', "fog"), ('f', "fog"), ('O', "trunk")):
+        for x, y in idx.positions(ch):
+            entries.append({"key": key, "tile": (x, y)})
 
     game_state.world_sprites[map_id] = entries
 
@@ -1935,7 +2067,7 @@ def draw_world_sprites(zbuffer: np.ndarray):
     cur_map = MAPS[cur_id]
     # レイアウトに M/F/O が1つでもあるのに未構築なら再構築
     if not game_state.world_sprites.get(cur_id):
-        if any(('M' in row) or ('F' in row) or ('O' in row) for row in cur_map["layout"]):
+        if get_symbol_index(cur_id).has_any(('M', 'F', 'O')):
             build_world_sprites_for_map(cur_id)
 
     sprites_dict = game_state.current_textures.get("sprites", {})
@@ -2039,9 +2171,7 @@ def draw_world_sprites(zbuffer: np.ndarray):
 # -------------------------------
 
 # --- 初期ロード ---
-# 診断（あれば）
-if _run_maps_health_check:
-    _run_maps_health_check(MAPS)
+# 診断は prepare_map_cache() が済ませている（結果はキャッシュに焼き込み済み）
 
 load_current_map_assets()
 
@@ -2060,7 +2190,6 @@ st.setdefault("switch_blink_active", set())  # 点滅対象のスイッチ集合
 st.setdefault("switch_solved", False)        # クリア済み（封鎖解除済み）か
 st.setdefault("last_tile_xy", None)
 # --- 追跡者関連の安全制御 ---
-st.setdefault("__chaser_safe_until", 0)      # スポーン直後の“捕獲無効”期間（ms）
 st.setdefault("__chaser_cooldown_until", 0)  # 連続捕獲を防ぐクールダウン（ms）
 st.setdefault("__caught_lock", False)        # 捕獲シーケンス中の再入防止
 
@@ -2251,6 +2380,9 @@ def _collect_end_points_for_map(cur_map: dict) -> list[tuple[float, float]]:
     """
     pts: list[tuple[float, float]] = []
     layout = cur_map.get("layout", [])
+    idx = symbol_index_for_layout(layout)
+    if idx is not None:
+        return [((tx + 0.5) * TILE, (ty + 0.5) * TILE) for tx, ty in idx.positions('E')]
     for ty, row in enumerate(layout):
         for tx, ch in enumerate(row):
             if ch == 'E':
@@ -3444,43 +3576,6 @@ def draw_interaction_hints(zbuffer: np.ndarray):
         text = "E：供物を捧げる" if have else "供物（幽き珠）が必要"
         emit_label_for_tile(tx, ty, text, zbuffer, overlap_frac=0.20)
 
-    # --- 敵の追跡更新と捕獲処理（毎フレーム） ---
-    #    ローカル関数として壁判定コールバックを必ず定義してから使用します。
-    def _enemy_is_block_px(nx: float, ny: float) -> bool:
-        """
-        追跡者AI用の“ピクセル座標での通行不可判定”コールバック。
-        - Chaser.update() へ渡すための軽量ラッパ
-        - 半径を小さめ(6px)にして角での引っかかりを抑制
-        """
-        return is_wall(int(nx), int(ny), radius=6)  # ← main.py 既存の is_wall を想定
-
-    def _respawn_player_to_map_start(cur_id: str):
-        """suggested_player_start をリスポーン地点として使用"""
-        m = MAPS.get(cur_id, {})
-        sx, sy = m.get("suggested_player_start", (1.5, 1.5))
-        # タイル中心 → ピクセル
-        game_state.player_x = sx * TILE
-        game_state.player_y = sy * TILE
-        game_state.player_dir = 0.0
-
-    # ループ内：敵更新 → 捕獲 → リスポーン
-    for ch in getattr(game_state, "current_enemies", []):
-        caught = ch.update((game_state.player_x, game_state.player_y), _enemy_is_block_px)
-        if caught:
-            # 既存のフェード演出を優先利用（あれば）
-            # fade_out(screen, duration=300)
-            # suggested_player_start へリスポーン（maps の推奨開始位置）
-            m = MAPS.get(game_state.current_map_id, {})
-            sx, sy = m.get("suggested_player_start", (1.5, 1.5))
-            game_state.player_x = sx * TILE
-            game_state.player_y = sy * TILE
-            game_state.player_dir = 0.0
-            # 敵も初期化
-            for c in game_state.current_enemies:
-                c.reset()
-            # fade_in(screen, duration=300)
-            break  # 1体でも捕獲したら今フレームは終了
-    
 def _draw_small_progress_bar_midtop(surface, center_x, top_y, cur, need, w=90, h=8):
     """小型の進捗バーを描画（midtopアンカー）"""
     x = int(center_x - w // 2); y = int(top_y)
@@ -3514,6 +3609,57 @@ def draw_inventory_overlay(surface): # インベントリオーバーレイ（
                     anchor="topleft", bg_color=(0,0,0,130))
     y = rect.bottom + 6
     x = 10
+    # 追跡者フレームのスケールキャッシュ状況（件数 / 使用量 / ヒット率）
+    info = chaser_scale_cache_info()
+    rect = draw_label(
+        surface,
+        f"CHASER cache: {info['entries']} ({info['bytes'] / (1024 * 1024):.1f}MB) "
+        f"hit {info['hit_rate'] * 100:.0f}% evict {info['evictions']}",
+        size=16,
+        pos=(x, y),
+        anchor="topleft",
+        bg_color=(0, 0, 0, 130),
+    )
+    y = rect.bottom + 6
+    # マップ共通アセットキャッシュ（テクスチャ/スプライト）
+    info = ASSET_CACHE.info()
+    rect = draw_label(
+        surface,
+        f"ASSET cache: {info['entries']} ({info['bytes'] / (1024 * 1024):.1f}"
+        f"/{info['max_bytes'] / (1024 * 1024):.0f}MB) "
+        f"hit {info['hit_rate'] * 100:.0f}% evict {info['evictions']}",
+        size=16,
+        pos=(x, y),
+        anchor="topleft",
+        bg_color=(0, 0, 0, 130),
+    )
+    y = rect.bottom + 6
+    # 復号済み音声キャッシュ（ボイス/BGM/ムービー音声）
+    info = AUDIO_CACHE.info()
+    rect = draw_label(
+        surface,
+        f"AUDIO cache: {info['entries']} pin {info['pinned']} ({info['bytes'] / (1024 * 1024):.1f}"
+        f"/{info['max_bytes'] / (1024 * 1024):.0f}MB) "
+        f"hit {info['hit_rate'] * 100:.0f}% evict {info['evictions']}",
+        size=16,
+        pos=(x, y),
+        anchor="topleft",
+        bg_color=(0, 0, 0, 130),
+    )
+    y = rect.bottom + 6
+    # ミキサーのチャンネルプール（使用中/本数、横取り・破棄の累計）
+    mix = sound_manager.channels.info()
+    rect = draw_label(
+        surface,
+        "MIX " + " ".join(f"{g}:{v['busy']}/{v['capacity']}" for g, v in mix.items())
+        + f"  steal {sum(v['stolen'] for v in mix.values())}"
+        + f" drop {sum(v['dropped'] for v in mix.values())}",
+        size=16,
+        pos=(x, y),
+        anchor="topleft",
+        bg_color=(0, 0, 0, 130),
+    )
+    y = rect.bottom + 6
     for name, cnt in game_state.inventory.items():
         rect = draw_label(
             surface,
@@ -3529,17 +3675,9 @@ _has_played_video = cin_has_played # このマップで指定IDのムービー
 _mark_video_played = cin_mark_played # 再生済みマークを立てる（JSON保存時にlist化→ロードでsetに復元される想定）
 
 def _player_near_any_symbol(symbols: tuple[str, ...], radius_px: float) -> bool:
-    """マップ内の指定記号（例: 'F','f'）のいずれかに半径r以内で近接しているかを判定"""
-    layout = MAPS[game_state.current_map_id]["layout"]
-    px, py = game_state.player_x, game_state.player_y
-    r2 = radius_px * radius_px
-    for y, row in enumerate(layout):
-        for x, ch in enumerate(row):
-            if ch in symbols:
-                cx, cy = x * TILE + TILE * 0.5, y * TILE + TILE * 0.5
-                if (px - cx)**2 + (py - cy)**2 <= r2:
-                    return True
-    return False
+    """マップ内の指定記号（例: 'F','f'）のいずれかに半径r以内で近接しているかを判定（空間ハッシュ）"""
+    idx = get_symbol_index(game_state.current_map_id)
+    return idx.near_any(symbols, game_state.player_x, game_state.player_y, radius_px, TILE)
 
 def _check_auto_fog_movie_once():
     """
@@ -3684,48 +3822,46 @@ def _process_cinematic_queue():
 
 # -----------------------------------------------------------------------------------------
 
-# 追跡者の足元Yを覚えて、フレーム間の移動量を制限するための状態変数
-_CHASER_GROUND_Y: float | None = None
-
-# 接近/離脱の判定用に前回距離を保持
-_CHASER_PREV_DIST: float | None = None
-
 def _draw_chaser_billboard(screen_surf: pygame.Surface, zbuf: list[float | None]) -> None:
     """
-    追跡者スプライトをレイキャスト画面にビルボードとして描画する。
-    - 投影（位置→画面座標）はプレイヤー基準の相対角と深度を用いる
-    - アニメ進行は update_chaser_anim() / get_chaser_frame_current() に一元化
-    - zバッファで壁に隠れる場合は描画しない
+    現在マップの追跡者（プール内の全個体）をレイキャスト画面にビルボードとして描画する。
+    - 距離と相対角はプール全体をまとめて配列で計算し、視野外は一括で除外
+    - 残った個体を奥→手前の順に _draw_chaser_billboard_one() で描く
     """
-    # --- 状態取得と基本チェック ---
-    st = game_state.state.get("chaser", {})
-    if not st or not st.get("active"):
-        return
-    if st.get("map_id") != game_state.current_map_id:
+    pool = _enemy_pool(create=False)
+    if pool is None or pool.count == 0:
         return
 
-    # ワールド座標（ピクセル）
-    sx, sy = float(st.get("x", 0.0)), float(st.get("y", 0.0))
-    px, py = game_state.player_x, game_state.player_y
-    ang    = game_state.player_angle
-
-    # プレイヤー基準の相対ベクトル（2D）
-    dx, dy = (sx - px), (sy - py)
-    dist = math.hypot(dx, dy)
-    if dist < 1e-6:
-        return  # 同一座標のときは描かない
-
-    # スプライト方向と相対角（-π..+π）
-    target_ang = math.atan2(dy, dx)
-    rel_ang = (target_ang - ang + math.pi) % (2 * math.pi) - math.pi
+    n = pool.count
+    dx = pool.x[:n] - game_state.player_x
+    dy = pool.y[:n] - game_state.player_y
+    dist = np.hypot(dx, dy)
+    rel_ang = (np.arctan2(dy, dx) - game_state.player_angle + math.pi) % (2 * math.pi) - math.pi
 
     # 視野角（水平FOV）：エンジン定義があれば優先
-    FOV = FOV_RAD if 'FOV_RAD' in globals() else math.radians(60.0)
-
-    # FOV外（少し余裕を持たせる）
-    if abs(rel_ang) > (FOV * 0.55):
+    fov = FOV_RAD if 'FOV_RAD' in globals() else math.radians(60.0)
+    # 同一座標 / FOV外（少し余裕を持たせる）は描かない
+    visible = (dist >= 1e-6) & (np.abs(rel_ang) <= fov * 0.55)
+    if not visible.any():
         return
 
+    # --- アニメ進行（中央集権）：全個体で1回だけ ---
+    update_chaser_anim()
+
+    idx = np.nonzero(visible)[0]
+    for i in idx[np.argsort(-dist[idx])]:   # 奥から描いて手前で上書き
+        _draw_chaser_billboard_one(screen_surf, zbuf, pool, int(i),
+                                   float(dist[i]), float(rel_ang[i]), fov)
+
+def _draw_chaser_billboard_one(screen_surf: pygame.Surface, zbuf: list[float | None],
+                               pool: EnemyPool, i: int, dist: float, rel_ang: float,
+                               FOV: float) -> None:
+    """
+    追跡者1体をビルボードとして描画する。
+    - 投影（位置→画面座標）はプレイヤー基準の相対角と深度を用いる
+    - zバッファで壁に隠れる場合は描画しない
+    - 足元Yの平滑化状態は個体ごとに pool.ground_y / pool.prev_dist に持つ
+    """
     W, H = screen_surf.get_width(), screen_surf.get_height()
     HALF_W, HALF_H = W * 0.5, H * 0.5
 
@@ -3743,10 +3879,6 @@ def _draw_chaser_billboard(screen_surf: pygame.Surface, zbuf: list[float | None]
     if wall_d is not None and wall_d > 0 and dist > wall_d:
         return
 
-    # --- アニメ進行（中央集権） ---
-    update_chaser_anim()                 # 毎フレーム1回呼ぶ想定（ここでOK）
-    frame = get_chaser_frame_current()   # 現在のコマ画像（CHASER_FRAMES[CHASER_CUR_INDEX]）
-
     # --- 投影スケールの計算 ---
     # 「距離dist」そのものではなく、視線方向の“前方成分” cam_y = dist * cos(rel_ang) を使うと歪みが少ない
     cam_y = dist * max(1e-6, math.cos(rel_ang))  # 正面に近いほど大きい
@@ -3759,8 +3891,13 @@ def _draw_chaser_billboard(screen_surf: pygame.Surface, zbuf: list[float | None]
     screen_h = int(base_world_size_px * (dist_to_plane / cam_y))
     if screen_h <= 0:
         return
-    # 幅はアスペクト維持
-    screen_w = int(frame.get_width() * (screen_h / max(1, frame.get_height())))
+    # 量子化済みの高さでスケール済みコマを取得（幅はアスペクト維持）
+    #   至近距離で CHASER_SCALE_MAX_H を超える高さは、最後に画面内の部分だけ拡大して描く
+    close_up = screen_h > CHASER_SCALE_MAX_H
+    sprite = None
+    if not close_up:
+        sprite = get_chaser_frame_current(screen_h, offset=int(pool.anim_offset[i]))
+        screen_w, screen_h = sprite.get_size()
 
     # --- 足元Yの“透視投影” + 近距離安定化ブレンド ---
     # 1) 遠距離：透視投影（距離で地平線に寄る）を使う
@@ -3799,13 +3936,11 @@ def _draw_chaser_billboard(screen_surf: pygame.Surface, zbuf: list[float | None]
     ground_y = int(min(max_ground, max(min_ground, ground_y_f)))
 
     # === ここから「上に逃げないブレーキ（時間方向の制限）」を追加 ===
-    global _CHASER_GROUND_Y
-
     # 初回は現状に同期（いきなり飛ばないように）
-    if _CHASER_GROUND_Y is None:
-        _CHASER_GROUND_Y = float(ground_y)
+    if math.isnan(pool.ground_y[i]):
+        pool.ground_y[i] = float(ground_y)
 
-    prev = _CHASER_GROUND_Y
+    prev = float(pool.ground_y[i])
     target = float(ground_y)
 
     # 1) 距離帯に応じて“なめらか係数”を少し変える（近距離ほど強めに安定）
@@ -3835,36 +3970,24 @@ def _draw_chaser_billboard(screen_surf: pygame.Surface, zbuf: list[float | None]
         raw = prev + MAX_DOWN_PER_FRAME
 
     # --- 接近中は「上がらない」単方向ブレーキを追加 ---
-    global _CHASER_PREV_DIST
-    if _CHASER_PREV_DIST is None:
-        _CHASER_PREV_DIST = dist
+    if math.isnan(pool.prev_dist[i]):
+        pool.prev_dist[i] = dist
 
     # 接近（今回のdistが前回より短い）なら、上方向の変化をさらに抑制
-    if dist < _CHASER_PREV_DIST:
+    if dist < pool.prev_dist[i]:
         # 接近中に以前より上（Yが小）へは行かせない
         if raw < prev:
             raw = prev  # ← “上に逃げない”を保証（必要なら 0.5px など微量許容に変えてもOK）
 
-    _CHASER_PREV_DIST = dist  # 距離を記録
-
-    # 状態更新 & ground_y 確定
-    _CHASER_GROUND_Y = raw
-    ground_y = int(raw)
+    pool.prev_dist[i] = dist  # 距離を記録
 
     # 状態更新 & 実際に使う ground_y を確定
-    _CHASER_GROUND_Y = raw
+    pool.ground_y[i] = raw
     ground_y = int(raw)
 
-    # --- スケールしてスプライト作成 ---
-    if (screen_w, screen_h) != frame.get_size():
-        sprite = pygame.transform.smoothscale(frame, (screen_w, screen_h))
-    else:
-        sprite = frame
-
     # --- 足元基準で配置（下辺中央＝midbottom を地面に合わせる） ---
-    rect = sprite.get_rect()
     FOOT_OFFSET = 6  # 画像下端の余白に合わせて 4～8 で微調整
-    rect.midbottom = (int(screen_x), int(ground_y + FOOT_OFFSET))
+    foot = (int(screen_x), int(ground_y + FOOT_OFFSET))
 
     # --- 影（任意。接地感UP）---
     rx = max(4, int(18 * (screen_h / 120)))  # 横半径（距離に伴って少し変化）
@@ -3874,14 +3997,15 @@ def _draw_chaser_billboard(screen_surf: pygame.Surface, zbuf: list[float | None]
     screen_surf.blit(shadow, shadow.get_rect(center=(int(screen_x), int(ground_y))))
 
     # --- 本体を最後に描く ---
-    screen_surf.blit(sprite, rect)
+    if close_up:
+        _blit_chaser_frame_clipped(screen_surf, int(pool.anim_offset[i]), screen_h, foot)
+    else:
+        rect = sprite.get_rect()
+        rect.midbottom = foot
+        screen_surf.blit(sprite, rect)
 
 # ----------------------------------------------------------------------------------------
 
-def _tile_center_px(tx: int | float, ty: int | float) -> tuple[float, float]:
-    """タイル座標から“そのタイルの中心ピクセル”を返す小関数"""
-    return (tx * TILE + TILE * 0.5, ty * TILE + TILE * 0.5)
-
 # ----------------------------------------------
 # 追跡者BGM（開始／停止）ヘルパ
 # ----------------------------------------------
@@ -3893,7 +4017,8 @@ def _start_chaser_bgm_if_needed() -> None:
     - どちらも無ければ何もしない（警告を出すだけ）
     """
     st = game_state.state.setdefault("chaser", {})
-    if not st.get("active"):
+    pool = _enemy_pool(create=False)
+    if pool is None or pool.active_count() == 0:
         return
     if st.get("__bgm_on"):
         return  # 多重起動を防止
@@ -3937,114 +4062,96 @@ def _stop_chaser_bgm(fade_ms: int = 500) -> None:
     st = game_state.state.setdefault("chaser", {})
     st["__bgm_on"] = False
 
+def _chaser_targets(pool: EnemyPool, px: float, py: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    各追跡者の“今向かう点”を配列で返す。
+    - プレイヤーが見えていればプレイヤーへ直進
+    - 見えなければ共有フローフィールドを1歩下った先のタイル中心へ
+      （距離マップはプレイヤーのタイル/グリッド版が変わった時だけ再計算される）
+    """
+    n = pool.count
+    tx = np.full(n, float(px))
+    ty = np.full(n, float(py))
+    los = np.fromiter((_los_clear(pool.x[k], pool.y[k], px, py) for k in range(n)),
+                      dtype=bool, count=n)
+    if los.all():
+        return tx, ty
+    grid = getattr(game_state, "current_tile_grid", None)
+    if grid is None:
+        return tx, ty
+
+    gx, gy = int(px // TILE), int(py // TILE)
+    CHASER_FLOW_FIELD.update(grid, (gx, gy), game_state.tile_grid_version)
+    nx, ny, valid = CHASER_FLOW_FIELD.next_steps(
+        (pool.x[:n] // TILE).astype(np.int64), (pool.y[:n] // TILE).astype(np.int64))
+    use = ~los & valid
+    tx[use] = nx[use] * TILE + TILE * 0.5
+    ty[use] = ny[use] * TILE + TILE * 0.5
+    return tx, ty
+
 def _update_chaser_and_check_caught(dt_sec: float):
     """
-    追跡者が有効なら、プレイヤーへ向かって少し前進し、一定距離で“捕捉”。
-    - 出現マップ外では動かない
-    - 壁衝突は簡易に抑止（そのフレーム動かさない）
-    - 捕獲は安全時間／クールダウン／ロックで多重発火を防止
-    - 分岐で引っかからないよう、プレイヤーが見えない時だけ簡易A*で経路補助
+    現在マップの追跡者（プール全体）をプレイヤーへ向けて前進させ、一定距離で“捕捉”。
+    - 出現マップ外の個体は動かない（プールはマップ別）
+    - 起床/安全時間は個体ごとのタイマーで判定
+    - 壁に当たったら X→Y の順でスライド（配列で一括処理）
+    - 捕獲はクールダウン／ロックで多重発火を防止
     """
-    st = game_state.state.setdefault("chaser", {})
-    if not st.get("active"):
-        return
-    if st.get("map_id") != game_state.current_map_id:
+    pool = _enemy_pool(create=False)
+    if pool is None or pool.count == 0:
         return
     # ★ 出現中BGM：ここで一度だけ起動（既に起動済みなら何もしない）
     _start_chaser_bgm_if_needed()
 
     now = pygame.time.get_ticks()
-    # ★ 追跡者の“起床”までは動かさない
-    wake_at = st.get("wake_at_ms", 0)
-    if now < wake_at:
-        return
-
-    # 現在位置とプレイヤー位置
-    cx, cy = float(st.get("x", game_state.player_x)), float(st.get("y", game_state.player_y))
     px, py = game_state.player_x, game_state.player_y
-
-    # プレイヤーまでの距離
-    dx, dy = (px - cx), (py - cy)
-    dist = math.hypot(dx, dy)
-    if dist <= 1e-6:
-        return
-
-    # --- パラメータ ---
-    speed_px_per_sec = 80.0      # 追跡速度
-    catch_radius_px  = CHASER_CATCH_RADIUS  # 定数化（例:22.0）
+    catch_radius_px = CHASER_CATCH_RADIUS
 
     # --- 捕獲ガード ---
-    if now < game_state.state.get("__chaser_safe_until", 0):
-        return  # スポーン直後の安全時間
     if now < game_state.state.get("__chaser_cooldown_until", 0):
         return  # クールダウン中
     if game_state.state.get("__caught_lock", False):
         return  # 捕獲シーケンス中
 
-    # --- 捕獲チェック（移動前） ---
-    if dist <= catch_radius_px:
+    def _caught(idx: int) -> None:
+        if pool.group[idx] == ENEMY_GROUP_MAP:
+            # maps.py 定義の追跡者：従来どおりマップの推奨開始位置へ戻し、追跡者も初期位置へ
+            _respawn_after_map_chaser_catch()
+            return
         game_state.state["__caught_lock"] = True
         game_state.state["__chaser_cooldown_until"] = now + CHASER_CATCH_COOLDOWN
         # ★ まず追跡BGMを止めてから → 捕獲ムービーへ
         _stop_chaser_bgm(fade_ms=500)
         _on_player_caught_by_chaser()
+
+    # --- 捕獲チェック（移動前） ---
+    hit = pool.capture_index(px, py, catch_radius_px, now)
+    if hit >= 0:
+        _caught(hit)
         return
 
-    # --- 目的地を決定 ---
-    nav = game_state.state.setdefault("__nav", {"next_wp": None, "repath_at": 0})
-    target_x, target_y = px, py  # デフォルトはプレイヤー
-
-    # プレイヤーが壁で見えていなければ簡易A*でウェイポイントを使う
-    if not _los_clear(cx, cy, px, py):
-        if now >= nav.get("repath_at", 0) or not nav.get("next_wp"):
-            layout = MAPS[game_state.current_map_id]["layout"]
-            sx, sy = int(cx // TILE), int(cy // TILE)
-            gx, gy = int(px // TILE), int(py // TILE)
-            step = _a_star_next_step(layout, (sx, sy), (gx, gy))
-            if step:
-                wx = step[0] * TILE + TILE * 0.5
-                wy = step[1] * TILE + TILE * 0.5
-                nav["next_wp"] = (wx, wy)
-            else:
-                nav["next_wp"] = None
-            nav["repath_at"] = now + NAV_REPATH_MS
-        if nav.get("next_wp"):
-            target_x, target_y = nav["next_wp"]
-
-    # ウェイポイントに到達したら消す
-    if nav.get("next_wp"):
-        wx, wy = nav["next_wp"]
-        if (target_x - cx) ** 2 + (target_y - cy) ** 2 <= (TILE * 0.3) ** 2:
-            nav["next_wp"] = None
-
-    # --- 前進 ---
-    dirx, diry = target_x - cx, target_y - cy
-    d = max(1e-6, math.hypot(dirx, diry))
-    step = speed_px_per_sec * max(0.0, float(dt_sec))
-    vx, vy = (dirx / d) * step, (diry / d) * step
-
-    nx, ny = cx + vx, cy + vy
-
-    # 壁衝突チェック（スライド移動も試す）
-    if not is_wall(nx, ny, radius=8):
-        st["x"], st["y"] = nx, ny
-    elif not is_wall(nx, cy, radius=8):
-        st["x"], st["y"] = nx, cy
-    elif not is_wall(cx, ny, radius=8):
-        st["x"], st["y"] = cx, ny
-    else:
-        st["x"], st["y"] = cx, cy
+    # 起きている個体がいなければ移動も経路計算も不要
+    if not pool.awake_mask(now).any():
+        return
+
+    # --- 目的地を決定 → 一括で前進 ---
+    target_x, target_y = _chaser_targets(pool, px, py)
+    grid = getattr(game_state, "current_tile_grid", None)
+    if grid is None:
+        return
+    walk = LOS.walkable(grid, game_state.tile_grid_version)
+    pool.step(dt_sec, now, target_x, target_y, walk, TILE, radius=8.0)
 
     # --- 捕獲チェック（移動後） ---
-    dx2, dy2 = (px - st["x"]), (py - st["y"])
-    if dx2 * dx2 + dy2 * dy2 <= (catch_radius_px ** 2):
-        game_state.state["__caught_lock"] = True
-        game_state.state["__chaser_cooldown_until"] = now + CHASER_CATCH_COOLDOWN
-        _on_player_caught_by_chaser()
+    hit = pool.capture_index(px, py, catch_radius_px, now)
+    if hit >= 0:
+        _caught(hit)
+        return
 
     # DEVログ
     if DEV_MODE and now % 500 < 16:
-        print(f"[CHASER] x={st['x']:.1f}, y={st['y']:.1f}, can_catch={can_catch}, dist={dist:.1f}")
+        d = np.hypot(pool.x[:pool.count] - px, pool.y[:pool.count] - py)
+        print(f"[CHASER] n={pool.count}, nearest={float(d.min()):.1f}, flow_rebuilds={CHASER_FLOW_FIELD.rebuilds}")
 
 # ---------------------------------------------------------------------
 # 追跡者トリガの“発火済み”を、指定マップ分だけリセットするユーティリティ
@@ -4069,6 +4176,18 @@ def _reset_chaser_triggers_for_map(map_id: str) -> None:
         if DEV_MODE:
             print("[CHASER][RESET][WARN]", e)
 
+def _respawn_after_map_chaser_catch() -> None:
+    """
+    maps.py 定義（ENEMY_GROUP_MAP）の追跡者に捕まったとき：
+    プレイヤーを suggested_player_start へ戻し、マップ定義の追跡者を初期位置から作り直す。
+    （近接トリガ/DEV で出現した追跡者は _on_player_caught_by_chaser のムービー＋ワープ）
+    """
+    m = MAPS.get(game_state.current_map_id, {})
+    sx, sy = m.get("suggested_player_start", (1.5, 1.5))
+    game_state.player_x = sx * TILE
+    game_state.player_y = sy * TILE
+    build_enemies_for_current_map()
+
 def _on_player_caught_by_chaser():
     """
     追跡者に捕まったときの一連の処理：
@@ -4146,9 +4265,10 @@ def _on_player_caught_by_chaser():
     except Exception:
         pass
 
-    # 4) 追跡者を無効化（以降の更新・描画を止める）
+    # 4) 追跡者を無効化（出現済みの個体を全マップから除去して更新・描画を止める）
+    for pool in game_state.enemy_pools.values():
+        pool.remove_group(ENEMY_GROUP_SPAWNED)
     st = game_state.state.setdefault("chaser", {})
-    st["active"] = False
     st["__bgm_on"] = False
 
     # 5) 捕獲ロック解除
@@ -4220,16 +4340,9 @@ def _is_near_forest_end_door(radius_px: float = 96.0) -> bool:
         return False
     R2 = radius_px * radius_px
     px, py = game_state.player_x, game_state.player_y
-    layout = MAPS["forest_end"]["layout"]
     # 1) レイアウト上の 'D'
-    for y, row in enumerate(layout):
-        for x, ch in enumerate(row):
-            if ch == 'D':
-                cx = x * TILE + TILE * 0.5
-                cy = y * TILE + TILE * 0.5
-                dx, dy = px - cx, py - cy
-                if dx*dx + dy*dy <= R2:
-                    return True
+    if get_symbol_index("forest_end").near_any(('D',), px, py, radius_px, TILE):
+        return True
     # 2) doors リストの座標（'D' が床に置換されても検出可能）
     for d in MAPS["forest_end"].get("doors", []):
         x, y = d.get("tile", (None, None))
@@ -4331,8 +4444,122 @@ last_tile = (
 )
 just_teleported = False  # テレポート直後判定用フラグ
 
+# -------------------------------
+# 固定タイムステップ（シミュレーションと描画の分離）
+#  - 移動・追跡者・タイマーは SIM_HZ の一定刻みで進める（fpsに依存しない）
+#  - 描画は何fpsでもよく、カメラ姿勢だけ前後ステップの間を補間して滑らかに見せる
+# -------------------------------
+sim_accum = 0.0                                  # 未消化のシミュレーション時間（秒）
+MAX_SIM_STEPS = int(MAX_FRAME_DT / SIM_DT) + 1   # 1フレームで回す最大ステップ数
+_sim_prev_pose = (game_state.player_x, game_state.player_y, game_state.player_angle)
+moved = rotated = False                          # 直近ステップで移動/回転したか（足音用）
+
+def _sim_snapshot_pose() -> None:
+    """現在のカメラ姿勢を“前ステップ”として保存（補間の起点）"""
+    global _sim_prev_pose
+    _sim_prev_pose = (game_state.player_x, game_state.player_y, game_state.player_angle)
+
+def _begin_interpolated_pose(alpha: float):
+    """
+    描画の間だけ、前ステップと現ステップの間で補間したカメラ姿勢を game_state に適用する。
+    ワープ等で大きく飛んだ直後は補間しない。戻り値は _end_interpolated_pose() に渡す。
+    """
+    x, y, a = game_state.player_x, game_state.player_y, game_state.player_angle
+    px, py, pa = _sim_prev_pose
+    if (x - px) ** 2 + (y - py) ** 2 > TILE * TILE:
+        return None
+    alpha = max(0.0, min(1.0, alpha))
+    da = (a - pa + math.pi) % (2 * math.pi) - math.pi   # 0/2π をまたぐ回転も最短で
+    applied = (px + (x - px) * alpha, py + (y - py) * alpha, (pa + da * alpha) % (2 * math.pi))
+    game_state.player_x, game_state.player_y, game_state.player_angle = applied
+    return ((x, y, a), applied)
+
+def _end_interpolated_pose(token) -> None:
+    """描画後に本来の姿勢へ戻す（描画中に誰かが姿勢を書き換えていたらそちらを優先）"""
+    if token is None:
+        return
+    real, applied = token
+    if (game_state.player_x, game_state.player_y, game_state.player_angle) == applied:
+        game_state.player_x, game_state.player_y, game_state.player_angle = real
+
+# 記号に近づいたら1回だけ流す自動ムービー（タイルをまたいだ時に判定）
+_AUTO_PROXIMITY_MOVIES = (
+    # fog
+    dict(
+        video_id="assets/movies/fog_block_intro.mp4", # ムービー
+        audio_path="assets/sounds/se/死後の世界.mp3.enc", # ムービーの音
+        symbols=('F', 'f'),
+        enable_if=lambda: game_state.current_map_id not in game_state.FLAGS.get("fog_cleared", set()),
+        toast_on_end="霧が立ちこめて進めない……",
+        toast_cb=lambda m, ms: toast.show(m, ms),
+    ),
+    # river
+    dict(
+        video_id="assets/movies/river_warning.mp4",
+        audio_path="assets/sounds/se/河原.mp3.enc",
+        symbols=('w', 'W'),
+        enable_if=lambda: True,
+        toast_on_end="川の流れが激しい…橋があれば渡れそうだ。",
+        toast_cb=_toast_adapter,
+    ),
+    # trunk
+    dict(
+        video_id="assets/movies/trunk_intro.mp4",
+        audio_path="assets/sounds/se/河原.mp3.enc",
+        symbols=('O',),
+        enable_if=lambda: True,
+        toast_on_end="太い大木が行く手をふさいでいる…",
+        toast_cb=_toast_adapter,
+    ),
+)
+
+def _on_player_tile_crossed(curr_tile: tuple[int, int]) -> None:
+    """
+    プレイヤーが別タイルへ移った瞬間の処理（ここが唯一の“タイル跨ぎ”入口）。
+    固定ステップ内で呼ばれるので、低fpsで1フレームに複数タイル進んでも取りこぼさない。
+    """
+    global last_tile
+    last_tile = curr_tile
+    check_map_triggers()                         # 出口・階段などのタイル上トリガ
+    _schedule_neighbour_prefetch()               # 向かっている出口が変わったら先読みを積み直す
+    _check_proximity_triggers_from_map()         # 近接型トリガ（追跡者/ムービー 等）
+    _cancel_confirm_if_moved_off_tile()          # 確認ダイアログ中に動いたら解除
+    # 必要ならここでムービーキュー処理などを呼び出す
+    # _process_cinematic_queue()
+    
+    # 近接ムービーの発火（旧 if move_x or move_y ブロックから移設）
+    #   記号がこのマップに1つも無い／再生済みのものは、呼び出し自体を省く
+    cur_id = game_state.current_map_id
+    sym_idx = get_symbol_index(cur_id)
+    for spec in _AUTO_PROXIMITY_MOVIES:
+        if not sym_idx.has_any(spec["symbols"]) or cin_has_played(cur_id, spec["video_id"]):
+            continue
+        cin_trigger_once(
+            screen, BASE_DIR,
+            radius_px=96.0,
+            toast_on_skip="……（スキップ）",
+            # ▼▼▼ SoundManager を渡す（VideoEvent → play_video が voice音量に連動させる）
+            sound_manager=sound_manager,
+            **spec,
+        )
+
+    # --- ★重要：ムービー再生があった場合でも、戻ってきたら環境音を再適用 ---
+    # ここは cin_trigger_once が“再生しなかった”場合でも呼んでOK（無害）。
+    # ループ環境音が止まっていれば再開し、同じ音が鳴っていれば内部でノーオペになります。
+    try:
+        _apply_map_ambience()
+    except Exception:
+        pass
+
 while True:
+    # ---- 0. フレーム時間（描画は RENDER_FPS_CAP まで。0 なら無制限） ----
+    frame_dt = clock.tick(RENDER_FPS_CAP) / 1000.0
+    if frame_dt > MAX_FRAME_DT:
+        # ムービー/イベント/ロード等でブロックしていた → 取り戻さず1ステップ分だけ進める
+        frame_dt = SIM_DT
+
     ensure_current_map_assets_synced() # 強制同期
+    LOS.begin_frame()                  # 視線キャッシュは1フレーム限り
     # ---- 1. イベント処理 ----
     for event in pygame.event.get():
         # --- フォールバック・トーストのドレイン（毎フレーム） ---
@@ -4682,30 +4909,71 @@ while True:
 
             # --- DEV: F8で追跡者をプレイヤー背後に強制出現 ---
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_F8:
-                _spawn_chaser_behind(distance_px=96.0)  # ← ここを背後版に
+                # 既存の追跡者は残したまま追加（多数体の負荷確認にも使える）
+                _spawn_chaser_behind(distance_px=96.0, replace=False)
                 try:
                     from core import toast_bridge
                     toast_bridge.show("[DEV] 追跡者を出現させました（背後）")
                 except Exception:
                     pass
 
-    # ==== ゲーム更新はメニューが開いていないときだけ ====
+    # ==== ゲーム更新（固定タイムステップ）はメニューが開いていないときだけ ====
     is_menu_open = (menu_scene is not None)
 
-    if not is_menu_open:
-        # ← ここで一回だけ取得（以降で共通利用）
-        keys = pygame.key.get_pressed()
-
-        # --- プレイヤー移動（モジュール化 core/player.py） ---
-        # ① まず移動処理
-        moved, curr_tile = handle_movement(
-            keys=keys,                 # ← 取得した keys を渡す
-            state=game_state,
-            is_wall=is_wall,
-            tile_size=TILE,
-        )
-        # ② 次に回転処理（←→で向きが変わったかどうか）
-        rotated = handle_rotation(keys=keys, state=game_state)
+    # ← ここで一回だけ取得（以降で共通利用）
+    keys = pygame.key.get_pressed()
+
+    if is_menu_open:
+        # ポーズ扱い：時間を溜めない＆補間の起点も現在姿勢にそろえる
+        sim_accum = 0.0
+        _sim_snapshot_pose()
+        moved = rotated = False
+    else:
+        sim_accum += frame_dt
+        steps = 0
+        step_any_moved = step_any_rotated = False
+        while sim_accum >= SIM_DT and steps < MAX_SIM_STEPS:
+            _sim_snapshot_pose()  # 補間用に“前ステップ”の姿勢を保存
+            step_map_id = game_state.current_map_id
+            step_start_ms = pygame.time.get_ticks()
+
+            # --- プレイヤー移動・回転（モジュール化 core/player.py、px/秒で進む） ---
+            step_moved, curr_tile = handle_movement(
+                keys=keys,
+                state=game_state,
+                is_wall=is_wall,
+                tile_size=TILE,
+                dt=SIM_DT,
+                collide=_player_collide,
+            )
+            step_any_rotated |= handle_rotation(keys=keys, state=game_state, dt=SIM_DT)
+            step_any_moved |= step_moved
+
+            # --- タイル跨ぎ（出口・近接トリガ・近接ムービー） ---
+            if step_moved and curr_tile is not None and curr_tile != last_tile:
+                _on_player_tile_crossed(curr_tile)
+
+            # --- 追跡者：移動＆捕捉チェック ---
+            _update_chaser_and_check_caught(SIM_DT)
+
+            # --- 累積プレイ時間 ---
+            game_state.playtime_sec += SIM_DT
+
+            sim_accum -= SIM_DT
+            steps += 1
+
+            # ステップ内でムービー・マップ移動・捕獲などのブロッキング処理が走ったら、
+            # 残りのステップは止める（keys と sim_accum はブロック前のものなので使わない）
+            if (game_state.current_map_id != step_map_id
+                    or pygame.time.get_ticks() - step_start_ms > MAX_FRAME_DT * 1000):
+                sim_accum = 0.0
+                _sim_snapshot_pose()
+                keys = pygame.key.get_pressed()
+                break
+
+        # 描画fpsが更新頻度より高いと 0ステップのフレームがある → 直前の状態を維持（足音の途切れ防止）
+        if steps:
+            moved, rotated = step_any_moved, step_any_rotated
 
     # ----------------------------------------------------------
     # ★足音（改良版）
@@ -4715,25 +4983,6 @@ while True:
     #   → どちらも満たさなければ “停止”
     #   ※ 同じ name="footstep" チャンネルを使うので二重になりません
     # ----------------------------------------------------------
-    def _footstep_env_key(map_id: str) -> str:
-        mid = (map_id or "").lower()
-        # 明示指定がある場合:  maps[map_id]["footstep"] == "forest|lab|tunnel"
-        try:
-            from maps import MAPS
-            explicit = (MAPS.get(map_id, {}).get("footstep") or "").lower()
-            if explicit in ("forest", "lab", "tunnel"):
-                return f"step_{explicit}"
-        except Exception:
-            pass
-        # 自動判定（必要に応じて規則を足してください）
-        if mid.startswith("forest"):
-            return "step_forest"
-        if ("dungeon" in mid) or ("tunnel" in mid) or ("underground" in mid):
-            return "step_tunnel"
-        if ("lab" in mid) or ("research" in mid) or ("lab" in mid):
-            return "step_lab"
-        return "step_forest"
-
     # 前進/後退キーが押されているか（例: ↑↓ / W S）
     forward_pressed = keys[pygame.K_UP] or keys[pygame.K_w]
     backward_pressed = keys[pygame.K_DOWN] or keys[pygame.K_s]
@@ -4751,83 +5000,6 @@ while True:
         else:
             sound_manager.stop_loop(name="footstep", fade_ms=80)
 
-        # タイル跨ぎ時の処理（ここが唯一の“タイル跨ぎ”入口）
-    if moved and curr_tile is not None and curr_tile != last_tile:
-        check_map_triggers()                         # 出口・階段などのタイル上トリガ
-        _check_proximity_triggers_from_map()         # 近接型トリガ（追跡者/ムービー 等）
-        last_tile = curr_tile
-        _cancel_confirm_if_moved_off_tile()          # 確認ダイアログ中に動いたら解除
-        # 必要ならここでムービーキュー処理などを呼び出す
-        # _process_cinematic_queue()
-        
-        is_forest = game_state.current_map_id.startswith("forest") # 森マップだけで動くようガード
-        # 近接ムービーの発火（旧 if move_x or move_y ブロックから移設）
-        # 近接ムービー発火（fog）
-        cin_trigger_once(
-            screen, BASE_DIR,
-            video_id="assets/movies/fog_block_intro.mp4", # ムービー
-            audio_path="assets/sounds/se/死後の世界.mp3.enc", # ムービーの音
-            symbols=('F','f'),
-            radius_px=96.0,
-            enable_if=lambda: game_state.current_map_id not in game_state.FLAGS.get("fog_cleared", set()),
-            # ▼ムービー終了後のトーストと、スキップ時のトーストを追加
-            toast_on_end="霧が立ちこめて進めない……",
-            toast_on_skip="……（スキップ）",
-            toast_cb=lambda m, ms: toast.show(m, ms),
-            # ▼▼▼ SoundManager を渡す（VideoEvent → play_video が voice音量に連動させる）
-            sound_manager=sound_manager,
-        )
-
-        # river
-        cin_trigger_once(
-            screen, BASE_DIR,
-            video_id="assets/movies/river_warning.mp4",
-            audio_path="assets/sounds/se/河原.mp3.enc",
-            symbols=('w','W'),
-            radius_px=96.0,
-            enable_if=lambda: True,
-            toast_on_end="川の流れが激しい…橋があれば渡れそうだ。",
-            toast_on_skip="……（スキップ）",
-            toast_cb=_toast_adapter,  
-            sound_manager=sound_manager,
-        )
-
-        # trunk
-        cin_trigger_once(
-            screen, BASE_DIR,
-            video_id="assets/movies/trunk_intro.mp4",
-            audio_path="assets/sounds/se/河原.mp3.enc",
-            symbols=('O',),
-            radius_px=96.0,
-            enable_if=lambda: True,
-            toast_on_end="太い大木が行く手をふさいでいる…",
-            toast_on_skip="……（スキップ）",
-            toast_cb=_toast_adapter,  
-            sound_manager=sound_manager,
-        )
-
-        # --- ★重要：ムービー再生があった場合でも、戻ってきたら環境音を再適用 ---
-        # ここは cin_trigger_once が“再生しなかった”場合でも呼んでOK（無害）。
-        # ループ環境音が止まっていれば再開し、同じ音が鳴っていれば内部でノーオペになります。
-        try:
-            _apply_map_ambience()
-        except Exception:
-            pass
-
-        last_tile = curr_tile
-        _cancel_confirm_if_moved_off_tile()
-        # _process_cinematic_queue()
-
-        # --- 視点回転（←→キー core/player.py）---
-        rotated = handle_rotation(
-            keys=keys,
-            state=game_state,
-            rot_per_tick=0.04,      # お好みで調整
-            # key_left=pygame.K_LEFT, key_right=pygame.K_RIGHT  # 変更したい場合だけ指定
-        )
-
-    # # === 追跡者：移動＆捕捉チェック（毎フレーム） ===
-    _update_chaser_and_check_caught(clock.get_time() / 1000.0)
 
     # 毎フレーム、動画のキューを回す
     _process_cinematic_queue()                
@@ -4875,14 +5047,6 @@ while True:
         just_teleported = False
 
     # ---- 6. 描画 ----
-    clock.tick(60)
-
-    # ★ 直前フレームの経過時間（ms）→ 秒に
-    dt_sec = clock.get_time() / 1000.0
-    # ★ メニューを開いていないときだけ進める（ポーズ扱い）
-    if menu_scene is None:
-        game_state.playtime_sec += dt_sec
-
     def draw_minimap(surface, *, box_size: int = 96, margin: int = 8):
         inv = game_state.inventory
         if inv.get("map_chart", 0) <= 0:
@@ -4966,18 +5130,14 @@ while True:
         pygame.draw.polygon(panel,(255,255,255,230),[tip,left,right])
         pygame.draw.polygon(panel,(0,0,0,220),[tip,left,right],width=1)
 
-        # ❹ 追跡者描画
-        ch = game_state.state.get("chaser",{})
-        if ch.get("active") and ch.get("map_id")==game_state.current_map_id:
-            try:
-                cx_t = float(ch["x"])/TILE
-                cy_t = float(ch["y"])/TILE
-                mx = int(cx_t*s)
-                my = int(cy_t*s)
-                dot_r = max(6,int(s))  # ミニマップに合ったサイズ アイテムマーカーと同じ
+        # ❹ 追跡者描画（現在マップのプール内の全個体）
+        pool = _enemy_pool(create=False)
+        if pool is not None and pool.count:
+            dot_r = max(6,int(s))  # ミニマップに合ったサイズ アイテムマーカーと同じ
+            for k in range(pool.count):
+                mx = int(pool.x[k]/TILE*s)
+                my = int(pool.y[k]/TILE*s)
                 pygame.draw.circle(panel,(220,40,40,255),(mx,my),dot_r)
-            except Exception:
-                pass
 
         # ❺ エンディングシンボル
         end_points = _collect_end_points_for_map(cur_map)
@@ -5003,202 +5163,202 @@ while True:
 
     # ★：自動ムービー＆デバッグ
     tick_auto_events_and_debug()
-    # 壁や床の描画（Zバッファ取得）
-    zbuf = draw_rays()
+    # ここから flip までは補間したカメラ姿勢で描く
+    pose_token = _begin_interpolated_pose(sim_accum / SIM_DT)
+    try:
+        # 壁や床の描画（Zバッファ取得）
+        zbuf = draw_rays()
 
-    # 風見鶏ガイド（マップ移動の目印）
-    draw_weathercock_guides(screen, zbuf) 
+        # 風見鶏ガイド（マップ移動の目印）
+        draw_weathercock_guides(screen, zbuf) 
 
-    # エンディング床（'E'）シンボル
-    draw_ending_symbols(screen, zbuf)
+        # エンディング床（'E'）シンボル
+        draw_ending_symbols(screen, zbuf)
 
-    # ★ 追跡者の赤い○（ビルボード）を描画
-    _draw_chaser_billboard(screen, zbuf) # ← 場所確認には第2引数のzbufを外すと壁に透ける。
+        # ★ 追跡者の赤い○（ビルボード）を描画
+        _draw_chaser_billboard(screen, zbuf) # ← 場所確認には第2引数のzbufを外すと壁に透ける。
     
-    # 取得しないスプライト（守人など）、透明な壁
-    draw_world_sprites(zbuf)
-
-    # アイテム（スプライト）描画（壁との前後関係をZバッファで判定）
-    draw_items(zbuf)
-
-    # 近接ラベル（ドア／スイッチも統一UIで）
-    draw_interaction_hints(zbuf)
-
-    # デバッグオーバーレイ（DEV_MODE のときだけ有効）
-    if DEV_MODE and SHOW_DEBUG_OVERLAY:
-        draw_inventory_overlay(screen)
-
-    # Y/N メッセージ
-    draw_map_confirm_prompt(screen)
-    # ミニマップ
-    draw_minimap(screen)
+        # 取得しないスプライト（守人など）、透明な壁
+        draw_world_sprites(zbuf)
 
-    # 今フレーム分を一括表示
-    flush_world_toasts(screen)  
+        # アイテム（スプライト）描画（壁との前後関係をZバッファで判定）
+        draw_items(zbuf)
 
-    # メニューを先に最前面へ
-    if menu_scene is not None:
-        menu_scene.draw(screen, WIDTH, HEIGHT)
+        # 近接ラベル（ドア／スイッチも統一UIで）
+        draw_interaction_hints(zbuf)
 
-    # ★ デバッグ：敵の赤丸を重ね描き（最前面・任意）
-    if hasattr(game_state, "current_enemies"):
-        for ch in game_state.current_enemies:
-            # カメラオフセットを使っていなければ (0,0) でOK
-            ch.draw_debug_2d(screen, (0.0, 0.0))
-            
-    # ---- 近接ラベル（最前面に） -----------------------------------------
-    # ※ここに移動：壁/スプライト/メニュー/ミニマップより前面で、トーストの直前に
-    #   ドアやスイッチの「E：〜」「◯◯が必要」を最上位レイヤで描く
-    #
-    # デバウンスのため、draw_interaction_hints() 内で描画候補を列挙しつつ
-    # _hint_session_should_draw() で同一ヒントの出し過ぎを抑えます。
-    #
-    # 実装：既存の draw_interaction_hints を薄くラップする関数を用意します。
-    # ---- 近接ラベル（最前面に） -----------------------------------------
-    def _draw_interaction_hints_front(zbuf):
-        """
-        ドア・スイッチ等の近接ヒントを“最前面レイヤ”で描画する。
-        - ドアが壁で隠れて見えない場合は、正面1タイルが床なら床側に貼る
-        - それでも不可視なら画面固定ピルにフォールバック
-        ※「ドアを開けたあとは walkable なのでヒントは出ない」挙動は維持
-        """
-        cur_map = MAPS[game_state.current_map_id]
-        layout  = cur_map["layout"]
+        # デバッグオーバーレイ（DEV_MODE のときだけ有効）
+        if DEV_MODE and SHOW_DEBUG_OVERLAY:
+            draw_inventory_overlay(screen)
 
-        # プレイヤー位置
-        px, py = game_state.player_x, game_state.player_y
-        cx, cy = int(px // TILE), int(py // TILE)
+        # Y/N メッセージ
+        draw_map_confirm_prompt(screen)
+        # ミニマップ
+        draw_minimap(screen)
 
-        is_front = False  # ← まずは関数スコープに用意（ループで上書き）
+        # 今フレーム分を一括表示
+        flush_world_toasts(screen)  
 
-        # 正面1/2マス（“壁で隠れる”ケースに備えて床へのフォールバックで使う）
-        fx1, fy1 = _front_tile(px, py, game_state.player_angle)        # 正面1マス
-        fx2, fy2 = (fx1 + (fx1 - cx), fy1 + (fy1 - cy))                # 正面2マス
-
-        # 距離閾値（R の2乗で比較して sqrt を避ける）
-        # 既定: 80px → 少しゆるめて 110px（= 80 * 1.375）
-        R2 = (110.0 * 110.0)
-
-        drew_any = False
-
-        # -----------------------------
-        # 1) ドア（鍵あり/なしで文言分岐）
-        # -----------------------------
-        for door in cur_map.get("doors", []):
-            tx, ty = door["tile"]
-            wx, wy = _tile_center(tx, ty)
+        # メニューを先に最前面へ
+        if menu_scene is not None:
+            menu_scene.draw(screen, WIDTH, HEIGHT)
+
+        # ---- 近接ラベル（最前面に） -----------------------------------------
+        # ※ここに移動：壁/スプライト/メニュー/ミニマップより前面で、トーストの直前に
+        #   ドアやスイッチの「E：〜」「◯◯が必要」を最上位レイヤで描く
+        #
+        # デバウンスのため、draw_interaction_hints() 内で描画候補を列挙しつつ
+        # _hint_session_should_draw() で同一ヒントの出し過ぎを抑えます。
+        #
+        # 実装：既存の draw_interaction_hints を薄くラップする関数を用意します。
+        # ---- 近接ラベル（最前面に） -----------------------------------------
+        def _draw_interaction_hints_front(zbuf):
+            """
+            ドア・スイッチ等の近接ヒントを“最前面レイヤ”で描画する。
+            - ドアが壁で隠れて見えない場合は、正面1タイルが床なら床側に貼る
+            - それでも不可視なら画面固定ピルにフォールバック
+            ※「ドアを開けたあとは walkable なのでヒントは出ない」挙動は維持
+            """
+            cur_map = MAPS[game_state.current_map_id]
+            layout  = cur_map["layout"]
+
+            # プレイヤー位置
+            px, py = game_state.player_x, game_state.player_y
+            cx, cy = int(px // TILE), int(py // TILE)
+
+            is_front = False  # ← まずは関数スコープに用意（ループで上書き）
+
+            # 正面1/2マス（“壁で隠れる”ケースに備えて床へのフォールバックで使う）
+            fx1, fy1 = _front_tile(px, py, game_state.player_angle)        # 正面1マス
+            fx2, fy2 = (fx1 + (fx1 - cx), fy1 + (fy1 - cy))                # 正面2マス
+
+            # 距離閾値（R の2乗で比較して sqrt を避ける）
+            # 既定: 80px → 少しゆるめて 110px（= 80 * 1.375）
+            R2 = (110.0 * 110.0)
+
+            drew_any = False
+
+            # -----------------------------
+            # 1) ドア（鍵あり/なしで文言分岐）
+            # -----------------------------
+            for door in cur_map.get("doors", []):
+                tx, ty = door["tile"]
+                wx, wy = _tile_center(tx, ty)
+
+                # 既に開いているドアは完全にスキップ
+                if door.get("opened"):
+                    continue
 
-            # 既に開いているドアは完全にスキップ
-            if door.get("opened"):
-                continue
+                # 距離が遠いなら対象外
+                if _dist2_px(px, py, wx, wy) > R2:
+                    continue
 
-            # 距離が遠いなら対象外
-            if _dist2_px(px, py, wx, wy) > R2:
-                continue
+                # すでに“床化”しているドア（= 開いているドア）は対象外にする
+                #    ドアを開けたあと set_tile(..., '.') で床に変えているので、
+                #    ここで現在のタイル文字を見て、walkable ならスキップします。
+                try:
+                    ch = layout[ty][tx]  # 現在のタイル文字を取得
+                    # TILE_TYPES の walkable が True なら床など“通行可能”とみなす
+                    if TILE_TYPES.get(ch, {"walkable": False}).get("walkable", False):
+                        continue  # 開いているドアなのでヒントは出さない
+                except Exception:
+                    # 範囲外など何かおかしければ、安全側に倒してスキップ
+                    continue
 
-            # すでに“床化”しているドア（= 開いているドア）は対象外にする
-            #    ドアを開けたあと set_tile(..., '.') で床に変えているので、
-            #    ここで現在のタイル文字を見て、walkable ならスキップします。
-            try:
-                ch = layout[ty][tx]  # 現在のタイル文字を取得
-                # TILE_TYPES の walkable が True なら床など“通行可能”とみなす
-                if TILE_TYPES.get(ch, {"walkable": False}).get("walkable", False):
-                    continue  # 開いているドアなのでヒントは出さない
-            except Exception:
-                # 範囲外など何かおかしければ、安全側に倒してスキップ
-                continue
+                # ★ ここまで来た＝「ヒント対象として扱うドア」
+                #    デバッグ出力して、opened やタイル文字を確認
+                print(
+                    f"[DEBUG] hint for door at {game_state.current_map_id} "
+                    f"tile=({tx},{ty}) opened={door.get('opened')} ch={ch!r}"
+                )
+                # ここまで来た時点で「まだ壁として存在するドア」
+                lock_id = door.get("lock_id")
+                text = (
+                    f"{display_name(lock_id)}が必要"
+                    if (lock_id and game_state.inventory.get(lock_id, 0) <= 0)
+                    else "E：開ける"
+                )
 
-            # ★ ここまで来た＝「ヒント対象として扱うドア」
-            #    デバッグ出力して、opened やタイル文字を確認
-            print(
-                f"[DEBUG] hint for door at {game_state.current_map_id} "
-                f"tile=({tx},{ty}) opened={door.get('opened')} ch={ch!r}"
-            )
-            # ここまで来た時点で「まだ壁として存在するドア」
-            lock_id = door.get("lock_id")
-            text = (
-                f"{display_name(lock_id)}が必要"
-                if (lock_id and game_state.inventory.get(lock_id, 0) <= 0)
-                else "E：開ける"
-            )
+                # ★ この“個別ドア”に対する「正面1マスがドアか？」の判定を計算
+                #    （画面固定ピル表示は“正面1マスがドア”の時だけ 1.0s 出す設計）
+                is_front = ((fx1, fy1) == (tx, ty))
 
-            # ★ この“個別ドア”に対する「正面1マスがドアか？」の判定を計算
-            #    （画面固定ピル表示は“正面1マスがドア”の時だけ 1.0s 出す設計）
-            is_front = ((fx1, fy1) == (tx, ty))
+                # A) まずは“ドアそのもの”に世界貼り（見えていれば最良）
+                drew = emit_label_for_tile(tx, ty, text, zbuf, overlap_frac=0.22)
+                if drew:
+                    drew_any = True
+                    continue
 
-            # A) まずは“ドアそのもの”に世界貼り（見えていれば最良）
-            drew = emit_label_for_tile(tx, ty, text, zbuf, overlap_frac=0.22)
-            if drew:
+                # B) ドアが正面2マス目にあり、正面1マス目が床なら「床側に貼る」
+                if (fx2, fy2) == (tx, ty):
+                    walk1 = False
+                    if 0 <= fy1 < len(layout) and 0 <= fx1 < len(layout[0]):
+                        ch1 = layout[fy1][fx1]
+                        walk1 = bool(TILE_TYPES.get(ch1, {"walkable": False}).get("walkable", False))
+                    if walk1:
+                        drew2 = emit_label_for_tile(fx1, fy1, text, zbuf, overlap_frac=0.18)
+                        if drew2:
+                            drew_any = True
+                            continue
+
+                # C) それでも見えないなら、画面固定ピルで確実に提示
+                blit_pill_label_midtop(screen, text, center_x=WIDTH // 2, top_y=HEIGHT - 86, size=16)
                 drew_any = True
-                continue
-
-            # B) ドアが正面2マス目にあり、正面1マス目が床なら「床側に貼る」
-            if (fx2, fy2) == (tx, ty):
-                walk1 = False
-                if 0 <= fy1 < len(layout) and 0 <= fx1 < len(layout[0]):
-                    ch1 = layout[fy1][fx1]
-                    walk1 = bool(TILE_TYPES.get(ch1, {"walkable": False}).get("walkable", False))
-                if walk1:
-                    drew2 = emit_label_for_tile(fx1, fy1, text, zbuf, overlap_frac=0.18)
-                    if drew2:
-                        drew_any = True
-                        continue
-
-            # C) それでも見えないなら、画面固定ピルで確実に提示
-            blit_pill_label_midtop(screen, text, center_x=WIDTH // 2, top_y=HEIGHT - 86, size=16)
-            drew_any = True
 
-        # -----------------------------
-        # 2) スイッチ（近ければ「E：押す」）
-        #    ※ 正しい格納場所：cur_map["puzzle"]["switches"]
-        #       形式は {"a":{"pos":(x,y)}, "b":{"pos":(x,y)}, ...}
-        # -----------------------------
-        puzzle = cur_map.get("puzzle") or {}
-        switches = puzzle.get("switches") or {}
-        # dict形式を想定。想定外なら空ループにして安全にスキップ。
-        for info in (switches.values() if isinstance(switches, dict) else []):
-            tx, ty = info["pos"]  # 例: (15, 7)
-            wx, wy = _tile_center(tx, ty)
-            # 前面版は R をゆるめている（R2=110^2）。ここでも同じ閾値を使用。
-            if _dist2_px(px, py, wx, wy) > R2:
-                continue
-            key = (game_state.current_map_id, tx, ty, "E：押す")
-            # 同一ヒントの出しっぱなしを抑制
-            if not _hint_session_should_draw(key):
-                continue
-            emit_label_for_tile(tx, ty, "E：押す", zbuf, overlap_frac=0.18)
-            drew_any = True
-
-        # -----------------------------
-        # 3) 候補が無ければセッション終了（次回再接近で再表示）
-        # -----------------------------
-        if not drew_any:
-            _hint_session_left_proximity()
+            # -----------------------------
+            # 2) スイッチ（近ければ「E：押す」）
+            #    ※ 正しい格納場所：cur_map["puzzle"]["switches"]
+            #       形式は {"a":{"pos":(x,y)}, "b":{"pos":(x,y)}, ...}
+            # -----------------------------
+            puzzle = cur_map.get("puzzle") or {}
+            switches = puzzle.get("switches") or {}
+            # dict形式を想定。想定外なら空ループにして安全にスキップ。
+            for info in (switches.values() if isinstance(switches, dict) else []):
+                tx, ty = info["pos"]  # 例: (15, 7)
+                wx, wy = _tile_center(tx, ty)
+                # 前面版は R をゆるめている（R2=110^2）。ここでも同じ閾値を使用。
+                if _dist2_px(px, py, wx, wy) > R2:
+                    continue
+                key = (game_state.current_map_id, tx, ty, "E：押す")
+                # 同一ヒントの出しっぱなしを抑制
+                if not _hint_session_should_draw(key):
+                    continue
+                emit_label_for_tile(tx, ty, "E：押す", zbuf, overlap_frac=0.18)
+                drew_any = True
 
-    _draw_interaction_hints_front(zbuf)
+            # -----------------------------
+            # 3) 候補が無ければセッション終了（次回再接近で再表示）
+            # -----------------------------
+            if not drew_any:
+                _hint_session_left_proximity()
 
-    # ---- 肖像画ヒント-----------------------------------
-    def _draw_portrait_hint_front():
-        cur_map = MAPS[game_state.current_map_id]
-        hint_text = get_portrait_hint(cur_map)  # 既存のヘルパをそのまま利用
-        if hint_text:
-            draw_label(
-                screen,
-                hint_text,
-                size=18,
-                pos=(WIDTH//2, HEIGHT - 24),
-                anchor="midbottom",
-                bg_color=(0, 0, 0, 140),
-            )
-    _draw_portrait_hint_front()
+        _draw_interaction_hints_front(zbuf)
 
-    # 位置付きトースト（世界貼り → だめなら前面ピル）
-    world_toast.draw(screen, zbuf)
-    # トースト
-    now_ms = pygame.time.get_ticks()
-    toast.draw(screen, now_ms, WIDTH, HEIGHT)
-    # メニュー最前面
-    if menu_scene is not None:
-        menu_scene.draw(screen, WIDTH, HEIGHT)
+        # ---- 肖像画ヒント-----------------------------------
+        def _draw_portrait_hint_front():
+            cur_map = MAPS[game_state.current_map_id]
+            hint_text = get_portrait_hint(cur_map)  # 既存のヘルパをそのまま利用
+            if hint_text:
+                draw_label(
+                    screen,
+                    hint_text,
+                    size=18,
+                    pos=(WIDTH//2, HEIGHT - 24),
+                    anchor="midbottom",
+                    bg_color=(0, 0, 0, 140),
+                )
+        _draw_portrait_hint_front()
+
+        # 位置付きトースト（世界貼り → だめなら前面ピル）
+        world_toast.draw(screen, zbuf)
+        # トースト
+        now_ms = pygame.time.get_ticks()
+        toast.draw(screen, now_ms, WIDTH, HEIGHT)
+        # メニュー最前面
+        if menu_scene is not None:
+            menu_scene.draw(screen, WIDTH, HEIGHT)
 
-    pygame.display.flip()
+        pygame.display.flip()
+    finally:
+        # 描画中に例外が出ても、補間姿勢を本来の姿勢として残さない
+        _end_interpolated_pose(pose_token)
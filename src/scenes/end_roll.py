@@ -15,10 +15,11 @@ import pygame
 import math
 import io
 try:
-    # 既存の鍵を一元利用（複製禁止）
-    from core.sound_manager import fernet
+    # 既存の鍵を一元利用（複製禁止）。チャンク暗号（ストリーム）と従来の Fernet の両方を扱う
+    from core.sound_manager import decrypt_audio, stream_key
+    from core.stream_crypto import open_stream
 except Exception:
-    fernet = None
+    decrypt_audio = stream_key = open_stream = None
 
 from pathlib import Path
 
@@ -267,10 +268,26 @@ class EndRollEvent:
     
 # ================================================================
 #  内部：暗号化BGMも安全に読み込んで再生するヘルパ
-#  - .mp3.enc は Fernet で復号して BytesIO → music.load()
+#  - .mp3.enc はチャンク暗号ならストリーム再生、従来の Fernet なら復号して BytesIO → music.load()
 #  - .mp3/.ogg/.wav など通常音源はそのまま load()
 #  - 平文一時ファイルは作成しません（漏えい対策）
 # ================================================================
+_music_stream = None   # ストリーム再生中の復号リーダ（mixer が読み続けるので曲を替えるまで保持）
+
+def _close_music_stream() -> None:
+    global _music_stream
+    if _music_stream is None:
+        return
+    try:
+        pygame.mixer.music.unload()
+    except Exception:
+        pass
+    try:
+        _music_stream.close()
+    except Exception:
+        pass
+    _music_stream = None
+
 def _safe_music_play(*, path: str, volume: float = 0.6, fade_ms: int = 1000, loop: bool = True) -> None:
     """
     :param path: "assets/sounds/bgm/foo.mp3" または "assets/sounds/bgm/foo.mp3.enc"
@@ -279,19 +296,27 @@ def _safe_music_play(*, path: str, volume: float = 0.6, fade_ms: int = 1000, loo
     if not pygame.mixer.get_init():
         pygame.mixer.init()
 
+    global _music_stream
     is_enc = str(path).lower().endswith(".enc")
     try:
+        pygame.mixer.music.stop()
+        _close_music_stream()
         if is_enc:
-            # Fernet が用意されていない環境では .enc は扱えないので安全に中断
-            if fernet is None:
-                raise RuntimeError(".enc を再生するには core.sound_manager.fernet が必要です。")            
-            # --- 暗号化BGM：メモリ復号で安全再生 ---
+            # 復号の仕組みが用意されていない環境では .enc は扱えないので安全に中断
+            if decrypt_audio is None:
+                raise RuntimeError(".enc を再生するには core.sound_manager の復号が必要です。")
             p = Path(path)
-            with open(p, "rb") as f:
-                encrypted = f.read()
-            decrypted = fernet.decrypt(encrypted)   # ← 鍵は sound_manager.py に集約  :contentReference[oaicite:4]{index=4}
-            buf = io.BytesIO(decrypted)
-            pygame.mixer.music.load(buf)
+            stream = open_stream(p, stream_key())
+            if stream is not None:
+                # --- チャンク暗号のBGM：読む位置のチャンクだけ復号しながらストリーム再生 ---
+                pygame.mixer.music.load(stream)
+                _music_stream = stream
+            else:
+                # --- 従来の Fernet 形式：メモリ復号で安全再生（鍵は sound_manager.py に集約） ---
+                with open(p, "rb") as f:
+                    encrypted = f.read()
+                buf = io.BytesIO(decrypt_audio(encrypted))
+                pygame.mixer.music.load(buf)
         else:
             # --- 通常BGM ---
             pygame.mixer.music.load(path)
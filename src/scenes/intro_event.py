@@ -222,6 +222,9 @@ HINT_IMG_PATHS = {
     "LAST": "assets/sprites/ui/enter_start.png",
 }
 
+# ボイスの先読み：今の行を表示している間に、この行数ぶん先までのボイスを裏で復号しておく
+VOICE_LOOKAHEAD = 3
+
 # 状態バッジの色（AUTO / SKIP / FAST 表示）
 BADGE_BG = (0, 0, 0, 140)
 BADGE_OUTLINE = (255, 255, 255, 40)
@@ -412,9 +415,40 @@ class IntroEventScene:
                     self.sm.play_voice(str(raw["voice"]))
             except Exception:
                 pass
+            # 次の数行ぶんのボイスを先読み（この行をタイプしている間に終わる）
+            self._prefetch_upcoming_voices()
             
             self._line_side_effect_applied = True
 
+    def _upcoming_voice_files(self, count: int) -> List[str]:
+        """今の行より後ろ count 行（ページをまたぐ）のボイスファイル名"""
+        out: List[str] = []
+        p, l = self.page_idx, self.line_idx
+        for _ in range(count):
+            l += 1
+            while p < len(self.pages) and l >= len(self.pages[p]):
+                p, l = p + 1, 0
+            if p >= len(self.pages):
+                break
+            raw = self.pages[p][l]
+            if isinstance(raw, dict) and raw.get("voice"):
+                out.append(str(raw["voice"]))
+        return out
+
+    def _prefetch_upcoming_voices(self, include_current: bool = False) -> None:
+        """次の VOICE_LOOKAHEAD 行のボイスを SoundManager に先読みさせる（スキップ中は何もしない）"""
+        if self.sm is None or self._skip_all_silent or not hasattr(self.sm, "prefetch_voices"):
+            return
+        files = self._upcoming_voice_files(VOICE_LOOKAHEAD)
+        if include_current:
+            raw = self._current_line_raw()
+            if isinstance(raw, dict) and raw.get("voice"):
+                files.insert(0, str(raw["voice"]))
+        try:
+            self.sm.prefetch_voices(files)
+        except Exception:
+            pass
+
     def _mute_all_sounds_for_skip(self) -> None:
         """スキップ開始時に現在のサウンドをすべて止めるヘルパー。"""
         # pygame 側の全チャンネルを停止
@@ -859,6 +893,9 @@ class IntroEventScene:
         clock = pygame.time.Clock()
         draw = lambda: (self._draw_background(screen), self._draw_panel(screen))
 
+        # 最初の数行のボイスはフェードインの間に先読みしておく
+        self._prefetch_upcoming_voices(include_current=True)
+
         # フェードイン
         fade_in(screen, 600, draw_under=draw)
 
@@ -11,6 +11,16 @@ from scenes.menu import MenuScene          # （ロード専用で使う）
 from scenes.scene_manager import run_scene, make_dialogue_controller  
 
 from core.sound_manager import SoundManager
+from core.lazy_import import warm_up
+
+# タイトル表示中に裏で読み込んでおくもの（どれも最初に使うときまで import を遅らせている）
+_WARM_UP_MODULES = (
+    "cv2",                    # 動画再生（core.video_player）
+    "cryptography.fernet",    # 暗号化音源の復号（core.sound_manager）
+    "scenes.ending_event",
+    "scenes.end_roll",
+    "scenes.afterword",
+)
 
 def _run_menu_as_modal_load(screen: pygame.Surface, base_dir: Path, sound_manager=None) -> bool:
     """
@@ -49,6 +59,7 @@ def run_startup_sequence(screen, base_dir: Path, sound_manager=None):
         # ★重要：TitleScene へ sound_manager を確実に注入
         #  - ここで渡し忘れると SE が鳴らない（cursor/select）
         title = TitleScene(base_dir=base_dir, sound_manager=sound_manager)
+        warm_up(_WARM_UP_MODULES)           # タイトルを出している間に重い import を済ませる
         choice = run_scene(title, screen)   # "start"/"load"/"quit" を受け取る 
 
         if choice == "quit":
@@ -19,6 +19,7 @@ import sys
 # 画像が無いときのフォールバックに使う（既存プロジェクトのフォントヘルパ）
 from core.fonts import render_text  # Noto Sans JP を使った縁取りテキスト
 from core.transitions import fade_in, fade_out  # フェードアウト演出
+from core.startup_trace import finish_startup_trace  # 起動計測の締め
 
 # エンディングクリアフラグをここから読む
 import core.game_state as game_state
@@ -341,6 +342,9 @@ class TitleScene:
         """
         clock = pygame.time.Clock()
 
+        # 起動計測はここ（最初の操作可能な画面）で締める。2回目以降は何もしない
+        finish_startup_trace("title screen")
+
         # ★★ 注意書き画面
         #    - ゲーム全体でまだ表示していない場合だけ表示する
         #    - フラグは core.game_state.disclaimer_shown に保存する